@@ -0,0 +1,76 @@
+"""
+Сравнение разбора страницы ответа HeadHunter (100 вакансий):
+    response.json() + dict() + Vacancy.cast_to_object_list  и  Vacancy.cast_from_bytes
+
+Запуск из корня проекта: python -m benchmarks.json_decode
+"""
+
+import json
+import timeit
+from typing import Any, Dict, List
+
+from src.json_codec import HAS_ORJSON, loads
+from src.vacancies import Vacancy
+
+PER_PAGE = 100
+REPEAT = 5
+NUMBER = 200
+
+
+def make_page(per_page: int = PER_PAGE) -> bytes:
+    """
+    Создание тела ответа API, похожего на реальное (с полями, которые Vacancy не использует)
+    :param per_page: Количество вакансий на странице
+    :return: Тело ответа в байтах
+    """
+    items: List[Dict[str, Any]] = []
+    for index in range(per_page):
+        items.append(
+            {
+                "id": str(100000 + index),
+                "name": f"Python Developer {index}",
+                "alternate_url": f"https://hh.ru/vacancy/{100000 + index}",
+                "salary": {"from": 100000 + index * 1000, "to": 200000 + index * 1000, "currency": "RUR"},
+                "experience": {"id": "between1And3", "name": "От 1 года до 3 лет"},
+                "area": {"id": "1", "name": "Москва", "url": "https://api.hh.ru/areas/1"},
+                "employer": {"id": str(index), "name": f"Компания {index}", "trusted": True},
+                "snippet": {"requirement": "Опыт работы с Python " * 5, "responsibility": "Разработка " * 5},
+                "published_at": "2025-01-01T10:00:00+0300",
+                "professional_roles": [{"id": "96", "name": "Программист, разработчик"}],
+            }
+        )
+    return json.dumps({"items": items, "found": per_page, "pages": 1, "page": 0}, ensure_ascii=False).encode()
+
+
+def decode_default(body: bytes) -> List[Vacancy]:
+    """Текущий путь: разбор в строку, копия словаря и создание вакансий из словарей"""
+    data = dict(json.loads(body.decode("utf-8")))
+    return Vacancy.cast_to_object_list(data["items"])
+
+
+def decode_fast(body: bytes) -> List[Vacancy]:
+    """Быстрый путь: разбор байтов и извлечение только нужных полей"""
+    return Vacancy.cast_from_bytes(body)
+
+
+def main() -> None:
+    """Запуск сравнения и вывод результатов"""
+    body = make_page()
+    assert [v.to_dict() for v in decode_default(body)] == [v.to_dict() for v in decode_fast(body)]
+    print(f"orjson: {'установлен' if HAS_ORJSON else 'не установлен (стандартный json)'}")
+    decode_only = min(timeit.repeat(lambda: json.loads(body.decode("utf-8")), repeat=REPEAT, number=NUMBER))
+    decode_fast_only = min(timeit.repeat(lambda: loads(body), repeat=REPEAT, number=NUMBER))
+    print(
+        f"Только разбор JSON: json {decode_only / NUMBER * 1e6:.1f} мкс, "
+        f"loads {decode_fast_only / NUMBER * 1e6:.1f} мкс"
+    )
+    results = {}
+    for name, func in (("default", decode_default), ("fast", decode_fast)):
+        best = min(timeit.repeat(lambda: func(body), repeat=REPEAT, number=NUMBER)) / NUMBER
+        results[name] = best
+        print(f"{name:>8}: {best * 1e6:9.1f} мкс на страницу из {PER_PAGE} вакансий")
+    print(f"Ускорение: {results['default'] / results['fast']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Сравнение пиковой памяти при подсчете средней зарплаты по JSON файлу вакансий:
+JSONSaver.read_data (json.load всего файла) и JSONSaver.iter_data (потоковый разбор, с mmap и без).
+Измерение через tracemalloc
+
+Запуск из корня проекта: python -m benchmarks.json_stream [количество вакансий]
+"""
+
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Tuple
+
+from src.job_files import JSONSaver
+
+
+def write_records(path: Path, count: int) -> None:
+    """
+    Запись файла вакансий в формате JSONSaver (массив с отступами)
+    :param path: Путь к файлу
+    :param count: Количество вакансий
+    """
+    records = (
+        {
+            "name": f"Разработчик Python {index}",
+            "url": f"https://hh.ru/vacancy/{100000000 + index}",
+            "salary_from": 100000 + index % 1000 * 100,
+            "salary_to": 200000 + index % 1000 * 100,
+            "experience": "От 1 года до 3 лет",
+        }
+        for index in range(count)
+    )
+    with open(path, "w", encoding="utf-8") as json_file:
+        json_file.write("[\n")
+        for index, record in enumerate(records):
+            json_file.write(",\n" if index else "")
+            json_file.write(json.dumps(record, indent=4, ensure_ascii=False))
+        json_file.write("\n]")
+
+
+def average_salary(records: Iterable[Dict[str, Any]]) -> float:
+    """
+    Подсчет средней зарплаты "от" за один проход
+    :param records: Записи вакансий
+    :return: Средняя зарплата
+    """
+    total = count = 0
+    for record in records:
+        total += record["salary_from"]
+        count += 1
+    return total / count if count else 0.0
+
+
+def measure(run: Callable[[], float]) -> Tuple[float, int, float]:
+    """
+    Измерение пиковой памяти и времени
+    :param run: Функция подсчета
+    :return: Кортеж (результат, пиковая память в байтах, время в секундах)
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = run()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, peak, elapsed
+
+
+def main() -> None:
+    """Запуск сравнения и вывод результатов"""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / "vacancies.json"
+        write_records(path, count)
+        print(f"Вакансий: {count}, файл {path.stat().st_size / 2**20:.1f} МБ")
+        runs = {
+            "read_data": lambda: average_salary(JSONSaver(path).read_data()),
+            "iter_data": lambda: average_salary(JSONSaver(path).iter_data()),
+            "iter_data(mmap)": lambda: average_salary(JSONSaver(path).iter_data(use_mmap=True)),
+        }
+        for name, run in runs.items():
+            result, peak, elapsed = measure(run)
+            print(f"{name:16} пик {peak / 2**20:8.1f} МБ, {elapsed:6.2f} с, средняя зарплата {result:.0f}")
+
+
+if __name__ == "__main__":
+    main()
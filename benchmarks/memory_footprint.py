@@ -0,0 +1,74 @@
+"""
+Сравнение памяти на хранение вакансий: список экземпляров Vacancy и VacancyFrame
+(опыт - коды общей таблицы, ссылка - код начала и номер вакансии). Измерение через tracemalloc
+
+Запуск из корня проекта: python -m benchmarks.memory_footprint [количество вакансий]
+"""
+
+import gc
+import sys
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from src.vacancies import Vacancy
+from src.vacancy_frame import VacancyFrame
+
+EXPERIENCE_NAMES = ["Нет опыта", "От 1 года до 3 лет", "От 3 до 6 лет", "Более 6 лет"]
+NAMES = ["Python Developer", "Backend-разработчик", "QA engineer", "Data Scientist", "DevOps инженер"]
+
+
+def copy_str(value: str) -> str:
+    """Создание отдельной копии строки (как у каждой строки после json.loads)"""
+    return (value + " ")[:-1]
+
+
+def make_records(count: int) -> List[Dict[str, Any]]:
+    """
+    Создание записей в формате Vacancy.to_dict. Строки опыта и ссылок создаются заново
+    для каждой записи, как после разбора JSON
+    :param count: Количество записей
+    :return: Список словарей вакансий
+    """
+    return [
+        {
+            "name": copy_str(NAMES[index % len(NAMES)]),
+            "url": f"https://hh.ru/vacancy/{100000000 + index}",
+            "salary_from": 100000 + index % 1000 * 100,
+            "salary_to": 200000 + index % 1000 * 100,
+            "experience": copy_str(EXPERIENCE_NAMES[index % len(EXPERIENCE_NAMES)]),
+        }
+        for index in range(count)
+    ]
+
+
+def measure(build: Callable[[], Any]) -> int:
+    """
+    Измерение памяти, которую занимает результат build после сборки мусора
+    :param build: Функция создания структуры данных
+    :return: Размер в байтах
+    """
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def main() -> None:
+    """Запуск сравнения и вывод результатов"""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    list_size = measure(lambda: Vacancy.from_trusted_dicts(make_records(count), validate=False))
+    frame_size = measure(
+        lambda: VacancyFrame.from_vacancies(Vacancy.from_trusted_dicts(make_records(count), validate=False))
+    )
+    print(f"Вакансий: {count}")
+    print(f"list[Vacancy]: {list_size / count:7.1f} байт на вакансию ({list_size / 2**20:.1f} МБ)")
+    print(f"VacancyFrame:  {frame_size / count:7.1f} байт на вакансию ({frame_size / 2**20:.1f} МБ)")
+    print(f"Экономия: {list_size / frame_size:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Сравнение создания вакансий из большой выгрузки HeadHunter:
+    Vacancy.cast_to_object_list (один процесс)  и  src.parallel.cast_to_object_list_parallel
+
+Запуск из корня проекта: python -m benchmarks.parallel_cast [количество вакансий] [количество процессов]
+"""
+
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+from src.parallel import DEFAULT_CHUNK_SIZE, cast_to_object_list_parallel
+from src.vacancies import Vacancy
+
+
+def make_items(count: int) -> List[Dict[str, Any]]:
+    """
+    Создание словарей вакансий API, похожих на реальные
+    :param count: Количество вакансий
+    :return: Список словарей вакансий
+    """
+    return [
+        {
+            "id": str(index),
+            "name": f"Python Developer {index}",
+            "alternate_url": f"https://hh.ru/vacancy/{index}",
+            "salary": {"from": 100000 + index % 1000, "to": 200000 + index % 1000, "currency": "RUR"},
+            "experience": {"id": "between1And3", "name": "От 1 года до 3 лет"},
+            "area": {"id": "1", "name": "Москва"},
+            "published_at": "2025-01-01T10:00:00+0300",
+        }
+        for index in range(count)
+    ]
+
+
+def measure(func: Callable[[], List[Vacancy]]) -> float:
+    """
+    Измерение времени выполнения
+    :param func: Функция создания вакансий
+    :return: Время в секундах
+    """
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Запуск сравнения и вывод результатов"""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 1
+    items = make_items(count)
+    serial = measure(lambda: Vacancy.cast_to_object_list(items))
+    parallel = measure(lambda: cast_to_object_list_parallel(items, workers=workers, min_parallel_size=0))
+    print(f"Вакансий: {count}, процессов: {workers}, размер части: {DEFAULT_CHUNK_SIZE}")
+    print(f"  один процесс: {serial:6.2f} с")
+    print(f"   параллельно: {parallel:6.2f} с")
+    print(f"Ускорение: {serial / parallel:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,11 @@
-
+from typing import Iterable
 
 from src.head_hunter_api import HeadHunterAPI
 from src.settings import BASE_DIR
-from src.utils import (get_top_vacancies, get_vacancies_by_salary, print_vacancies, safe_json,
+from src.sync import IncrementalSync
+from src.utils import (get_top_vacancies, iter_vacancies_by_salary, print_vacancies, safe_json,
                        user_response_salary_range, user_response_top_n)
-from src.vacancies import Vacancy
+from src.vacancies import LazyVacancy, Vacancy
 
 file_path = BASE_DIR / "data" / "top_vacancies.json"
 
@@ -15,15 +16,22 @@ def user_interaction() -> None:
     top_n = user_response_top_n()
     salary_min, salary_max = user_response_salary_range()
 
+    incremental = input("Загрузить только новые вакансии с прошлого запуска? (да/нет): ").strip().lower() == "да"
+
     hh_api = HeadHunterAPI()
-    # Выполняется получение вакансий с ключевыми словами
-    hh_vacancies = hh_api.get_vacancies(search_query)
-    # Получение списка вакансий списком экземпляров класса
-    vacancies_list = Vacancy.cast_to_object_list(hh_vacancies)
+    vacancies_iter: Iterable[Vacancy]
+    if incremental:
+        # Загрузка вакансий, опубликованных после прошлого запуска, и объединение с сохраненными
+        vacancies_iter = IncrementalSync(hh_api, BASE_DIR / "data").sync(search_query)
+    else:
+        # Получение вакансий с ключевыми словами постранично (обработка идет по мере загрузки)
+        hh_vacancies = hh_api.iter_vacancies(search_query)
+        # Ленивые вакансии: название и ссылка проверяются только у прошедших фильтр по зарплате
+        vacancies_iter = map(LazyVacancy, hh_vacancies)
     # Получение вакансий в диапазоне зарплат
-    ranged_vacancies = get_vacancies_by_salary(vacancies_list, salary_min, salary_max)
-    # Получение топ N вакансий
-    top_vacancies = get_top_vacancies(ranged_vacancies, top_n)
+    ranged_vacancies = iter_vacancies_by_salary(vacancies_iter, salary_min, salary_max)
+    # Получение топ N вакансий (если подходящих меньше N - выводятся все найденные)
+    top_vacancies = get_top_vacancies(ranged_vacancies, top_n, strict=False)
     # Вывод в консоль вакансии
     print_vacancies(top_vacancies)
     # Сохранение информации о вакансиях в файл
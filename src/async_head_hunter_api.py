@@ -0,0 +1,198 @@
+import asyncio
+from contextlib import asynccontextmanager
+from types import TracebackType
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Type
+
+import aiohttp
+
+from src.exceptions import APIError
+from src.interfaces import AbstractAsyncApi
+
+
+class AsyncHeadHunterAPI(AbstractAsyncApi):
+    """
+    Класс асинхронной работы с HeadHunter
+    Возвращает те же словари вакансий, что и HeadHunterAPI, поэтому результат
+    можно передавать в Vacancy.cast_to_object_list без изменений.
+    Внутри "async with" все вызовы используют общую сессию, без него каждый вызов открывает
+    и закрывает собственную сессию (одновременные вызовы не закрывают соединения друг друга)
+
+    Атрибуты:
+        url(str): Адрес API (по умолчанию https://api.hh.ru/vacancies)
+        per_page(int): Количество элементов со станицы (по умолчанию и максимум 100)
+        max_concurrency(int): Максимальное количество одновременных запросов (по умолчанию 5)
+        timeout(float): Таймаут запроса в секундах (по умолчанию 10)
+
+    Методы:
+        __init__(self, per_page: int = 100, max_concurrency: int = 5, url: str = "https://api.hh.ru/vacancies",
+        timeout: float = 10.0) -> None:
+            Инициализация класса AsyncHeadHunterAPI
+        __aenter__(self) -> "AsyncHeadHunterAPI":
+            Открытие сессии с пулом соединений
+        __aexit__(self, exc_type, exc_value, traceback) -> None:
+            Закрытие сессии
+        connect(self, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+            Асинхронный метод подключения к API
+            :raise APIError: Ошибка запроса API
+            :raise ValueError: Если API выдает не словарь
+        get_vacancies(self, keyword: str, max_per_page: int = 20) -> List[Dict[str, Any]]:
+            Асинхронный метод получения вакансий
+        __session_scope(self) -> AsyncIterator[Tuple[aiohttp.ClientSession, asyncio.Semaphore]]:
+            Приватный асинхронный контекстный менеджер сессии вызова (общей или собственной)
+        __create_session(self) -> aiohttp.ClientSession:
+            Приватный метод создания сессии с пулом соединений
+        __request(self, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore, params: Dict[str, Any])
+        -> Dict[str, Any]:
+            Приватный метод запроса одной страницы с ограничением количества одновременных запросов
+        __valid_positive(value: int, name: str) -> int:
+            Статический метод проверки, что аргумент - положительное целое число
+    """
+
+    url: str
+    per_page: int
+    max_concurrency: int
+    timeout: float
+
+    def __init__(
+        self,
+        per_page: int = 100,
+        max_concurrency: int = 5,
+        url: str = "https://api.hh.ru/vacancies",
+        timeout: float = 10.0,
+    ) -> None:
+        """
+        Инициализация класса AsyncHeadHunterAPI
+        :param per_page: Количество вакансий на странице (по умолчанию 100)
+        :param max_concurrency: Максимальное количество одновременных запросов (по умолчанию 5)
+        :param url: Адрес API (по умолчанию https://api.hh.ru/vacancies)
+        :param timeout: Таймаут запроса в секундах (по умолчанию 10)
+        :raise TypeError: Если per_page или max_concurrency не целое число
+        :raise ValueError: Если per_page или max_concurrency не положительное число, или per_page больше 100
+        """
+        self.url = url
+        self.per_page = self.__valid_positive(per_page, "Параметр")
+        if self.per_page > 100:
+            raise ValueError("Параметр не может быть больше 100")
+        self.max_concurrency = self.__valid_positive(max_concurrency, "Количество одновременных запросов")
+        self.timeout = timeout
+        self.__headers = {"User-Agent": "HH-User-Agent"}
+        self.__session: Optional[aiohttp.ClientSession] = None
+        self.__semaphore: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self) -> "AsyncHeadHunterAPI":
+        """Открытие сессии с пулом соединений"""
+        self.__session = self.__create_session()
+        self.__semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Закрытие сессии"""
+        if self.__session is not None:
+            await self.__session.close()
+            self.__session = None
+            self.__semaphore = None
+
+    async def connect(self, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Асинхронный метод подключения к API
+        :param params: Параметры запроса (по умолчанию первая страница пустого запроса)
+        :return: Словарь ответа от API
+        :raise APIError: Ошибка запроса API
+        :raise ValueError: Если API выдает не словарь
+        """
+        if params is None:
+            params = {"text": "", "page": 0, "per_page": self.per_page}
+        async with self.__session_scope() as (session, semaphore):
+            return await self.__request(session, semaphore, params)
+
+    async def get_vacancies(self, keyword: str, max_per_page: int = 20) -> List[Dict[str, Any]]:
+        """
+        Асинхронный метод получения вакансий.
+        Первая страница определяет количество страниц ("pages"), остальные загружаются одновременно,
+        но не более max_concurrency запросов за раз. Порядок вакансий соответствует порядку страниц
+        :param keyword: Ключевое слово
+        :param max_per_page: Максимальное количество страниц (по умолчанию 20)
+        :return: Список словарей вакансий
+        """
+        if max_per_page <= 0:
+            return []
+        params: Dict[str, Any] = {"text": keyword, "page": 0, "per_page": self.per_page}
+        async with self.__session_scope() as (session, semaphore):
+            data = await self.__request(session, semaphore, params)
+            vacancies: List[Dict[str, Any]] = list(data.get("items", []))
+            if not vacancies:
+                return vacancies
+            last_page = min(data.get("pages", 1), max_per_page)
+            # gather возвращает результаты в порядке переданных корутин, а не в порядке завершения
+            pages = await asyncio.gather(
+                *(self.__request(session, semaphore, {**params, "page": page}) for page in range(1, last_page))
+            )
+        for page_data in pages:
+            vacancies.extend(page_data.get("items", []))
+        return vacancies
+
+    @asynccontextmanager
+    async def __session_scope(self) -> AsyncIterator[Tuple[aiohttp.ClientSession, asyncio.Semaphore]]:
+        """
+        Сессия вызова: общая сессия, открытая "async with", или собственная сессия вызова,
+        которая закрывается по его завершении и не сохраняется в экземпляре
+        :return: Кортеж (сессия aiohttp, семафор одновременных запросов)
+        """
+        if self.__session is not None and self.__semaphore is not None:
+            yield self.__session, self.__semaphore
+            return
+        session = self.__create_session()
+        try:
+            yield session, asyncio.Semaphore(self.max_concurrency)
+        finally:
+            await session.close()
+
+    def __create_session(self) -> aiohttp.ClientSession:
+        """Создание сессии с пулом соединений размером max_concurrency"""
+        connector = aiohttp.TCPConnector(limit=self.max_concurrency)
+        return aiohttp.ClientSession(
+            connector=connector, headers=self.__headers, timeout=aiohttp.ClientTimeout(total=self.timeout)
+        )
+
+    async def __request(
+        self, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore, params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Приватный метод запроса одной страницы с ограничением количества одновременных запросов
+        :param session: Сессия aiohttp
+        :param semaphore: Семафор одновременных запросов сессии
+        :param params: Параметры запроса
+        :return: Словарь ответа от API
+        :raise APIError: Ошибка запроса API
+        :raise ValueError: Если API выдает не словарь
+        """
+        async with semaphore:
+            async with session.get(self.url, params=params) as response:
+                if response.status != 200:
+                    text = await response.text()
+                    raise APIError(f"Ошибка API: {response.status} - {text}")
+                result = await response.json(content_type=None)
+        if not isinstance(result, Dict):
+            raise ValueError("API выдает не словарь")
+        return result
+
+    @staticmethod
+    def __valid_positive(value: int, name: str) -> int:
+        """
+        Проверка, что аргумент - положительное целое число
+        :param value: Значение аргумента
+        :param name: Наименование аргумента для сообщения об ошибке
+        :return: Значение аргумента
+        :raise TypeError: Если аргумент не является целым числом
+        :raise ValueError: Если аргумент равен 0 или отрицательный
+        """
+        if not isinstance(value, int):
+            raise TypeError(f"{name} не является целым числом")
+        if value <= 0:
+            raise ValueError(f"{name} должен быть положительным числом")
+        return value
@@ -0,0 +1,216 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+
+class CachedResponse:
+    """
+    Класс записи кэша ответа API
+
+    Атрибуты:
+        body(bytes): Тело ответа
+        etag(str): Заголовок ETag ответа (по умолчанию None)
+        last_modified(str): Заголовок Last-Modified ответа (по умолчанию None)
+        stored_at(float): Время сохранения (или последней проверки) ответа, timestamp
+        fresh(bool): Не истек ли срок жизни записи
+    """
+
+    body: bytes
+    etag: Optional[str]
+    last_modified: Optional[str]
+    stored_at: float
+    fresh: bool
+    __slots__ = ("body", "etag", "last_modified", "stored_at", "fresh")
+
+    def __init__(
+        self, body: bytes, etag: Optional[str], last_modified: Optional[str], stored_at: float, fresh: bool
+    ) -> None:
+        """Инициализация класса CachedResponse"""
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.stored_at = stored_at
+        self.fresh = fresh
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """
+        Метод получения заголовков условного запроса (If-None-Match / If-Modified-Since)
+        :return: Словарь заголовков (пустой, если сервер не прислал ETag и Last-Modified)
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """
+    Класс дискового кэша ответов API (SQLite) со сроком жизни и вытеснением по LRU
+
+    Атрибуты:
+        cache_path(Path): Путь к файлу кэша
+        ttl(float): Срок жизни записи в секундах (по умолчанию 3600)
+        max_bytes(int): Максимальный суммарный размер тел ответов в байтах (по умолчанию 50 МБ)
+
+    Методы:
+        __init__(self, cache_path: Union[str, Path], ttl: float = 3600, max_bytes: int = 50 * 1024 * 1024) -> None:
+            Инициализация класса ResponseCache
+            :raise ValueError: Если ttl или max_bytes отрицательные
+        make_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+            Статический метод получения ключа кэша по адресу и параметрам запроса
+        get(self, key: str) -> Optional[CachedResponse]:
+            Метод получения записи кэша (учитывается как попадание, если запись не устарела)
+        set(self, key: str, body: bytes, etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+            Метод сохранения ответа с вытеснением давно не использованных записей
+        touch(self, key: str) -> None:
+            Метод продления срока жизни записи после ответа 304 Not Modified
+        clear(self) -> None:
+            Метод очистки кэша
+        close(self) -> None:
+            Метод закрытия файла кэша
+        stats(self) -> Dict[str, int]:
+            Свойство получения счетчиков: hits, misses, revalidations, bytes_read, bytes_written, size_bytes
+    """
+
+    cache_path: Path
+    ttl: float
+    max_bytes: int
+
+    def __init__(self, cache_path: Union[str, Path], ttl: float = 3600, max_bytes: int = 50 * 1024 * 1024) -> None:
+        """
+        Инициализация класса ResponseCache
+        :param cache_path: Путь к файлу кэша
+        :param ttl: Срок жизни записи в секундах (по умолчанию 3600)
+        :param max_bytes: Максимальный суммарный размер тел ответов в байтах (по умолчанию 50 МБ)
+        :raise ValueError: Если ttl или max_bytes отрицательные
+        """
+        if ttl < 0 or max_bytes < 0:
+            raise ValueError("Срок жизни и размер кэша не могут быть отрицательными")
+        self.cache_path = Path(cache_path)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.__lock = threading.Lock()
+        self.__counters = {"hits": 0, "misses": 0, "revalidations": 0, "bytes_read": 0, "bytes_written": 0}
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        self.__connection = sqlite3.connect(self.cache_path, check_same_thread=False)
+        self.__connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, body BLOB NOT NULL, etag TEXT, last_modified TEXT, "
+            "stored_at REAL NOT NULL, accessed_at REAL NOT NULL, size INTEGER NOT NULL)"
+        )
+        self.__connection.execute("CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)")
+        self.__connection.commit()
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Получение ключа кэша по адресу и параметрам запроса (порядок параметров не важен)
+        :param url: Адрес запроса
+        :param params: Параметры запроса
+        :return: Ключ кэша
+        """
+        raw_key = json.dumps([url, params or {}], sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(raw_key.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """
+        Метод получения записи кэша. Свежая запись учитывается как попадание,
+        отсутствующая или устаревшая - как промах
+        :param key: Ключ кэша
+        :return: Запись кэша или None, если ее нет
+        """
+        now = time.time()
+        with self.__lock:
+            row = self.__connection.execute(
+                "SELECT body, etag, last_modified, stored_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.__counters["misses"] += 1
+                return None
+            body, etag, last_modified, stored_at = row
+            fresh = now - stored_at < self.ttl
+            if fresh:
+                self.__counters["hits"] += 1
+                self.__counters["bytes_read"] += len(body)
+                self.__connection.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+                self.__connection.commit()
+            else:
+                self.__counters["misses"] += 1
+        return CachedResponse(bytes(body), etag, last_modified, stored_at, fresh)
+
+    def set(self, key: str, body: bytes, etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+        """
+        Метод сохранения ответа с вытеснением давно не использованных записей
+        :param key: Ключ кэша
+        :param body: Тело ответа
+        :param etag: Заголовок ETag ответа
+        :param last_modified: Заголовок Last-Modified ответа
+        """
+        if len(body) > self.max_bytes:
+            return
+        now = time.time()
+        with self.__lock:
+            self.__connection.execute(
+                "INSERT OR REPLACE INTO responses (key, body, etag, last_modified, stored_at, accessed_at, size) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, body, etag, last_modified, now, now, len(body)),
+            )
+            self.__counters["bytes_written"] += len(body)
+            self.__evict()
+            self.__connection.commit()
+
+    def touch(self, key: str) -> None:
+        """
+        Метод продления срока жизни записи после ответа 304 Not Modified
+        :param key: Ключ кэша
+        """
+        now = time.time()
+        with self.__lock:
+            row = self.__connection.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return
+            self.__connection.execute(
+                "UPDATE responses SET stored_at = ?, accessed_at = ? WHERE key = ?", (now, now, key)
+            )
+            self.__connection.commit()
+            self.__counters["revalidations"] += 1
+            self.__counters["bytes_read"] += row[0]
+
+    def clear(self) -> None:
+        """Метод очистки кэша"""
+        with self.__lock:
+            self.__connection.execute("DELETE FROM responses")
+            self.__connection.commit()
+
+    def close(self) -> None:
+        """Метод закрытия файла кэша"""
+        with self.__lock:
+            self.__connection.close()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        Свойство получения счетчиков кэша
+        :return: Словарь: hits, misses, revalidations, bytes_read, bytes_written, size_bytes
+        """
+        with self.__lock:
+            size_bytes = self.__connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            return {**self.__counters, "size_bytes": int(size_bytes)}
+
+    def __evict(self) -> None:
+        """Вытеснение давно не использованных записей, пока размер кэша больше max_bytes"""
+        total = self.__connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self.__connection.execute("SELECT key, size FROM responses ORDER BY accessed_at, rowid").fetchall()
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            self.__connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
@@ -1,9 +1,21 @@
-from typing import Any, Dict, List
-
-import requests
+import math
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
+from src.cache import ResponseCache
 from src.exceptions import APIError
-from src.interfaces import AbstractApi
+from src.interfaces import AbstractApi, AbstractTransport
+from src.json_codec import loads
+from src.transport import get_default_transport
+from src.twelve_data_api import CurrencyConversion
+from src.vacancies import Vacancy
+
+# HeadHunter отдает не больше 2000 вакансий на один запрос (page * per_page < 2000)
+DEPTH_LIMIT = 2000
+# Формат дат date_from / date_to в запросах к HeadHunter
+DATE_FORMAT = "%Y-%m-%dT%H:%M:%S%z"
 
 
 class HeadHunterAPI(AbstractApi):
@@ -15,33 +27,93 @@ class HeadHunterAPI(AbstractApi):
         __params(dict): Параметры запроса (private);
         __vacancies(list): Список вакансий (private);
         per_page(int): Количество элементов со станицы(по умолчанию и максимум 100)
+        max_workers(int): Количество потоков загрузки страниц (по умолчанию 1 - последовательно)
+        transport(AbstractTransport): HTTP транспорт (по умолчанию общий для процесса HttpTransport)
+        cache(ResponseCache): Дисковый кэш ответов (по умолчанию None - без кэша)
+        fast_json(bool): Разбирать тело ответа напрямую из байтов (orjson, если установлен) без копирования
     Методы:
-        __init__(self, per_page: int = 100) -> None:
+        __init__(self, per_page: int = 100, max_workers: int = 1, transport: Optional[AbstractTransport] = None,
+        cache: Optional[ResponseCache] = None, fast_json: bool = False) -> None:
             Инициализатор экземпляра класса HeadHunterAPI.
         connect(self) -> Dict[Any, Any]:
             Метод подключения к API
-        __connect(self) -> Dict[Any, Any]:
+        __connect(self, params: Optional[Dict[str, Any]] = None) -> Dict[Any, Any]:
             Приватный метод подключения к Head_Hunter_API
             :raise APIError: Ошибка запроса API
             :raise ValueError: Если API выдает не словарь
-        get_vacancies(self, keyword: str) -> List[Dict[Any, Any]]:
+        __fetch_body(self, params: Dict[str, Any]) -> bytes:
+            Приватный метод получения тела ответа Head_Hunter_API без разбора
+        __fetch_cached(self, params: Dict[str, Any], cache: ResponseCache) -> bytes:
+            Приватный метод получения тела ответа Head_Hunter_API через кэш ответов
+        __decode(body: bytes) -> Dict[str, Any]:
+            Статический метод разбора тела ответа API
+            :raise ValueError: Если API выдает не словарь
+        get_vacancies(self, keyword: str, max_per_page: int = 20, date_from: Optional[str] = None)
+        -> List[Dict[Any, Any]]:
             Метод получения вакансий
+        iter_pages(self, keyword: str, max_per_page: int = 20, date_from: Optional[str] = None)
+        -> Iterator[List[Dict[str, Any]]]:
+            Генератор страниц вакансий
+        iter_vacancies(self, keyword: str, max_per_page: int = 20, date_from: Optional[str] = None)
+        -> Iterator[Dict[str, Any]]:
+            Генератор вакансий постранично, без накопления полного списка
+        iter_vacancy_pages(self, keyword: str, max_per_page: int = 20, date_from: Optional[str] = None,
+        converter: Optional[CurrencyConversion] = None) -> Iterator[List[Vacancy]]:
+            Генератор страниц экземпляров Vacancy из тела ответа (Vacancy.cast_from_bytes)
+        search_many(self, keywords: Iterable[str], max_per_page: int = 20)
+        -> Tuple[List[Dict[str, Any]], Dict[str, Dict[str, int]]]:
+            Метод получения вакансий по нескольким ключевым словам с удалением повторов по id
+        get_all_vacancies(self, keyword: str, date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None, min_window: timedelta = timedelta(minutes=1)) -> List[Dict[str, Any]]:
+            Метод получения всех вакансий сверх ограничения HeadHunter в 2000 результатов
+        __plan_slices(self, keyword: str, date_from: datetime, date_to: datetime, min_window: timedelta)
+        -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+            Приватный метод разбиения запроса на интервалы дат, каждый из которых помещается в 2000 результатов
+        __collect_pages(self, params: Dict[str, Any], max_per_page: int, first_data: Optional[Dict[str, Any]] = None)
+        -> List[Dict[str, Any]]:
+            Приватный метод получения всех страниц запроса без общего состояния
+        __append_unique(target: List[Dict[str, Any]], vacancies: List[Dict[str, Any]], seen_ids: Set[Any]) -> int:
+            Статический метод добавления вакансий с еще не встреченным id
+        __iter_pages_concurrent(self, max_per_page: int) -> Iterator[List[Dict[str, Any]]]:
+            Приватный генератор параллельной загрузки страниц вакансий
         __valid_per_page(per_page: int) -> int:
             Статический метод проверки корректности аргумента
             TypeError: Если аргумент не является целым числом
             ValueError: Если аргумент равен 0 или отрицательный
+        __valid_max_workers(max_workers: int) -> int:
+            Статический метод проверки корректности количества потоков
+            TypeError: Если аргумент не является целым числом
+            ValueError: Если аргумент равен 0 или отрицательный
     """
 
     per_page: int
+    max_workers: int
+    cache: Optional[ResponseCache]
+    fast_json: bool
 
-    def __init__(self, per_page: int = 100) -> None:
+    def __init__(
+        self,
+        per_page: int = 100,
+        max_workers: int = 1,
+        transport: Optional[AbstractTransport] = None,
+        cache: Optional[ResponseCache] = None,
+        fast_json: bool = False,
+    ) -> None:
         """
         Инициализация класса HeadHunterAPI
         :param per_page: Количество страниц вакансий (по умолчанию 100)
+        :param max_workers: Количество потоков загрузки страниц (по умолчанию 1 - последовательно)
+        :param transport: HTTP транспорт (по умолчанию общий для процесса HttpTransport)
+        :param cache: Дисковый кэш ответов (по умолчанию None - без кэша)
+        :param fast_json: Разбирать тело ответа напрямую из байтов без копирования (по умолчанию False)
         """
         self.__url = "https://api.hh.ru/vacancies"
         self.__headers = {"User-Agent": "HH-User-Agent"}
         self.per_page = self.__valid_per_page(per_page)
+        self.max_workers = self.__valid_max_workers(max_workers)
+        self.transport = transport if transport is not None else get_default_transport()
+        self.cache = cache
+        self.fast_json = fast_json
         self.__params: Dict[str, Any] = {"text": "", "page": 0, "per_page": self.per_page}
         self.__vacancies: List[Dict[str, Any]] = []
 
@@ -49,41 +121,356 @@ class HeadHunterAPI(AbstractApi):
         """Метод подключения к API"""
         return self.__connect()
 
-    def __connect(self) -> Dict[str, Any]:
+    def __connect(self, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Приватный метод подключения к Head_Hunter_API
+        :param params: Параметры запроса (по умолчанию текущие параметры экземпляра)
         :return: Словарь ответа от API
         :raise APIError: Ошибка запроса API
         :raise ValueError: Если API выдает не словарь
         """
-        response = requests.get(self.__url, headers=self.__headers, params=self.__params)
+        if params is None:
+            params = self.__params
+        if self.cache is not None:
+            return self.__decode(self.__fetch_cached(params, self.cache))
+        response = self.transport.get(self.__url, headers=self.__headers, params=params)
         if response.status_code != 200:
             error_message = f"Ошибка API: {response.status_code} - {response.text}"
             raise APIError(error_message)
+        elif self.fast_json:
+            return self.__decode(response.content)
         else:
             result = response.json()
             if not isinstance(result, Dict):
                 raise ValueError("API выдает не словарь")
             return dict(result)
 
-    def get_vacancies(self, keyword: str, max_per_page: int = 20) -> List[Dict[str, Any]]:
+    def __fetch_body(self, params: Dict[str, Any]) -> bytes:
+        """
+        Приватный метод получения тела ответа Head_Hunter_API без разбора (через кэш ответов, если он задан)
+        :param params: Параметры запроса
+        :return: Тело ответа
+        :raise APIError: Ошибка запроса API
+        """
+        if self.cache is not None:
+            return self.__fetch_cached(params, self.cache)
+        response = self.transport.get(self.__url, headers=self.__headers, params=params)
+        if response.status_code != 200:
+            error_message = f"Ошибка API: {response.status_code} - {response.text}"
+            raise APIError(error_message)
+        body: bytes = response.content
+        return body
+
+    def __fetch_cached(self, params: Dict[str, Any], cache: ResponseCache) -> bytes:
+        """
+        Приватный метод получения тела ответа Head_Hunter_API через кэш ответов.
+        Свежая запись возвращается без обращения к сети. Устаревшая запись проверяется
+        условным запросом (If-None-Match / If-Modified-Since), при ответе 304 используется кэш.
+        Новый ответ попадает в кэш только если он разбирается в словарь
+        :param params: Параметры запроса
+        :param cache: Дисковый кэш ответов
+        :return: Тело ответа
+        :raise APIError: Ошибка запроса API
+        :raise ValueError: Если API выдает не словарь
+        """
+        key = cache.make_key(self.__url, params)
+        cached = cache.get(key)
+        if cached is not None and cached.fresh:
+            return cached.body
+        headers = dict(self.__headers)
+        if cached is not None:
+            headers.update(cached.conditional_headers())
+        response = self.transport.get(self.__url, headers=headers, params=params)
+        if response.status_code == 304 and cached is not None:
+            cache.touch(key)
+            return cached.body
+        if response.status_code != 200:
+            error_message = f"Ошибка API: {response.status_code} - {response.text}"
+            raise APIError(error_message)
+        body: bytes = response.content
+        self.__decode(body)
+        cache.set(key, body, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+        return body
+
+    @staticmethod
+    def __decode(body: bytes) -> Dict[str, Any]:
+        """
+        Разбор тела ответа API напрямую из байтов (orjson, если установлен)
+        :param body: Тело ответа
+        :return: Словарь ответа от API
+        :raise ValueError: Если API выдает не словарь
+        """
+        result = loads(body)
+        if not isinstance(result, Dict):
+            raise ValueError("API выдает не словарь")
+        return result
+
+    def get_vacancies(
+        self, keyword: str, max_per_page: int = 20, date_from: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
         """
         Метод получения вакансий
         :param keyword: Ключевое слово
         :param max_per_page: Максимальное количество страниц (по умолчанию 20)
+        :param date_from: Дата публикации, начиная с которой ищутся вакансии (по умолчанию None - без ограничения)
         :return: Список словарей вакансий
         """
+        self.__vacancies.clear()
+        for page in self.iter_pages(keyword, max_per_page, date_from):
+            self.__vacancies.extend(page)
+        return self.__vacancies
+
+    def iter_pages(
+        self, keyword: str, max_per_page: int = 20, date_from: Optional[str] = None
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Генератор страниц вакансий. Каждая страница отдается сразу после загрузки,
+        поэтому обработка вакансий идет по мере загрузки, без накопления всех страниц
+        :param keyword: Ключевое слово
+        :param max_per_page: Максимальное количество страниц (по умолчанию 20)
+        :param date_from: Дата публикации, начиная с которой ищутся вакансии (по умолчанию None - без ограничения)
+        :return: Итератор списков словарей вакансий (по одному на страницу)
+        """
         self.__params["text"] = keyword
         self.__params["page"] = 0
-        self.__vacancies.clear()
+        if date_from is None:
+            self.__params.pop("date_from", None)
+        else:
+            self.__params["date_from"] = date_from
+        if self.max_workers > 1:
+            yield from self.__iter_pages_concurrent(max_per_page)
+            return
         while self.__params.get("page", 0) < max_per_page:
             data = self.connect()
             vacancy = data.get("items", [])
             if not vacancy:
                 break
-            self.__vacancies.extend(vacancy)
+            yield vacancy
             self.__params["page"] += 1  # Увеличение номера страницы
-        return self.__vacancies
+
+    def iter_vacancies(
+        self, keyword: str, max_per_page: int = 20, date_from: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Генератор вакансий постранично, без накопления полного списка
+        :param keyword: Ключевое слово
+        :param max_per_page: Максимальное количество страниц (по умолчанию 20)
+        :param date_from: Дата публикации, начиная с которой ищутся вакансии (по умолчанию None - без ограничения)
+        :return: Итератор словарей вакансий
+        """
+        for page in self.iter_pages(keyword, max_per_page, date_from):
+            yield from page
+
+    def iter_vacancy_pages(
+        self,
+        keyword: str,
+        max_per_page: int = 20,
+        date_from: Optional[str] = None,
+        converter: Optional[CurrencyConversion] = None,
+    ) -> Iterator[List[Vacancy]]:
+        """
+        Генератор страниц экземпляров Vacancy. Тело каждого ответа передается в Vacancy.cast_from_bytes
+        без промежуточного словаря страницы (быстрый декодер, извлекаются только нужные поля).
+        Страницы загружаются последовательно, параметры запроса не разделяются с другими методами
+        :param keyword: Ключевое слово
+        :param max_per_page: Максимальное количество страниц (по умолчанию 20)
+        :param date_from: Дата публикации, начиная с которой ищутся вакансии (по умолчанию None - без ограничения)
+        :param converter: Конвертер валют для перевода зарплат в рубли
+            (по умолчанию None - зарплата не в рублях не учитывается)
+        :return: Итератор списков экземпляров класса Vacancy (по одному на страницу)
+        :raise APIError: Ошибка запроса API
+        """
+        params: Dict[str, Any] = {"text": keyword, "page": 0, "per_page": self.per_page}
+        if date_from is not None:
+            params["date_from"] = date_from
+        for page in range(max_per_page):
+            vacancies = Vacancy.cast_from_bytes(self.__fetch_body({**params, "page": page}), converter)
+            if not vacancies:
+                break
+            yield vacancies
+
+    def search_many(
+        self, keywords: Iterable[str], max_per_page: int = 20
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Dict[str, int]]]:
+        """
+        Метод получения вакансий по нескольким ключевым словам.
+        Ключевые слова обрабатываются параллельно в max_workers потоков, результаты объединяются
+        в порядке ключевых слов, вакансии с уже встреченным id пропускаются
+        :param keywords: Ключевые слова (повторы игнорируются)
+        :param max_per_page: Максимальное количество страниц на одно ключевое слово (по умолчанию 20)
+        :return: Кортеж из списка словарей уникальных вакансий и счетчиков по ключевым словам. Формат счетчиков:
+            {keyword: {"total": загружено вакансий, "new": добавлено уникальных вакансий}}
+        """
+        unique_keywords = list(dict.fromkeys(keywords))
+        vacancies: List[Dict[str, Any]] = []
+        counts: Dict[str, Dict[str, int]] = {}
+        if not unique_keywords:
+            return vacancies, counts
+        seen_ids: Set[Any] = set()
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(unique_keywords))) as executor:
+            keywords_params = [{"text": keyword, "page": 0, "per_page": self.per_page} for keyword in unique_keywords]
+            results = executor.map(lambda params: self.__collect_pages(params, max_per_page), keywords_params)
+            for keyword, keyword_vacancies in zip(unique_keywords, results):
+                new_count = self.__append_unique(vacancies, keyword_vacancies, seen_ids)
+                counts[keyword] = {"total": len(keyword_vacancies), "new": new_count}
+        return vacancies, counts
+
+    def get_all_vacancies(
+        self,
+        keyword: str,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        min_window: timedelta = timedelta(minutes=1),
+    ) -> List[Dict[str, Any]]:
+        """
+        Метод получения всех вакансий сверх ограничения HeadHunter в 2000 результатов.
+        Если по запросу найдено ("found") больше 2000 вакансий, интервал дат публикации делится пополам,
+        пока каждый интервал не поместится в ограничение (или не станет меньше min_window;
+        API принимает даты с точностью до секунды, поэтому интервал в 1 секунду не делится в любом случае).
+        Интервалы загружаются параллельно в max_workers потоков, повторы по id удаляются
+        :param keyword: Ключевое слово
+        :param date_from: Начало интервала дат публикации (по умолчанию 30 дней до date_to)
+        :param date_to: Конец интервала дат публикации (по умолчанию текущее время)
+        :param min_window: Минимальный интервал, который больше не делится (по умолчанию 1 минута)
+        :return: Список словарей вакансий, от новых интервалов к старым
+        :raise ValueError: Если начало интервала позже конца
+        """
+        if date_to is None:
+            date_to = datetime.now(timezone.utc).replace(microsecond=0)
+        if date_from is None:
+            date_from = date_to - timedelta(days=30)
+        if date_from > date_to:
+            raise ValueError("Начало интервала дат не может быть позже конца")
+        slices = self.__plan_slices(keyword, date_from, date_to, min_window)
+        max_per_page = math.ceil(DEPTH_LIMIT / self.per_page)
+        vacancies: List[Dict[str, Any]] = []
+        seen_ids: Set[Any] = set()
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(slices))) as executor:
+            results = executor.map(lambda plan: self.__collect_pages(plan[0], max_per_page, plan[1]), slices)
+            for slice_vacancies in results:
+                self.__append_unique(vacancies, slice_vacancies, seen_ids)
+        return vacancies
+
+    def __plan_slices(
+        self, keyword: str, date_from: datetime, date_to: datetime, min_window: timedelta
+    ) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """
+        Приватный метод разбиения запроса на интервалы дат, каждый из которых помещается в 2000 результатов.
+        Первая страница каждого интервала запрашивается для получения "found" и затем переиспользуется
+        :param keyword: Ключевое слово
+        :param date_from: Начало интервала дат публикации
+        :param date_to: Конец интервала дат публикации
+        :param min_window: Минимальный интервал, который больше не делится
+        :return: Список кортежей (параметры запроса интервала, первая страница ответа), от новых интервалов к старым
+        """
+        accepted: List[Tuple[datetime, Dict[str, Any], Dict[str, Any]]] = []
+        pending = [(date_from, date_to)]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while pending:
+                windows_params = [
+                    {
+                        "text": keyword,
+                        "page": 0,
+                        "per_page": self.per_page,
+                        "date_from": start.strftime(DATE_FORMAT),
+                        "date_to": end.strftime(DATE_FORMAT),
+                    }
+                    for start, end in pending
+                ]
+                next_pending = []
+                for (start, end), params, data in zip(
+                    pending, windows_params, executor.map(self.__connect, windows_params)
+                ):
+                    middle = (start + (end - start) / 2).replace(microsecond=0)
+                    # Середина без микросекунд может совпасть с началом - такой интервал не делится
+                    if data.get("found", 0) <= DEPTH_LIMIT or end - start <= min_window or middle <= start:
+                        accepted.append((start, params, data))
+                    else:
+                        next_pending.extend([(middle, end), (start, middle)])
+                pending = next_pending
+        accepted.sort(key=lambda plan: plan[0], reverse=True)
+        return [(params, data) for _, params, data in accepted]
+
+    def __collect_pages(
+        self, params: Dict[str, Any], max_per_page: int, first_data: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Приватный метод получения всех страниц запроса.
+        Использует собственную копию параметров запроса, поэтому безопасен для вызова из нескольких потоков
+        :param params: Параметры запроса (страница берется из "page")
+        :param max_per_page: Максимальное количество страниц
+        :param first_data: Уже полученный ответ для первой страницы (по умолчанию None - запрашивается)
+        :return: Список словарей вакансий
+        """
+        params = dict(params)
+        vacancies: List[Dict[str, Any]] = []
+        while params["page"] < max_per_page:
+            data = first_data if first_data is not None else self.__connect(dict(params))
+            first_data = None
+            vacancy = data.get("items", [])
+            if not vacancy:
+                break
+            vacancies.extend(vacancy)
+            if params["page"] + 1 >= data.get("pages", max_per_page):
+                break
+            params["page"] += 1
+        return vacancies
+
+    @staticmethod
+    def __append_unique(target: List[Dict[str, Any]], vacancies: List[Dict[str, Any]], seen_ids: Set[Any]) -> int:
+        """
+        Добавление вакансий с еще не встреченным id (вакансии без id добавляются всегда)
+        :param target: Список, в который добавляются вакансии
+        :param vacancies: Добавляемые вакансии
+        :param seen_ids: Множество уже встреченных id (дополняется)
+        :return: Количество добавленных вакансий
+        """
+        added = 0
+        for vacancy in vacancies:
+            vacancy_id = vacancy.get("id")
+            if vacancy_id is not None:
+                if vacancy_id in seen_ids:
+                    continue
+                seen_ids.add(vacancy_id)
+            target.append(vacancy)
+            added += 1
+        return added
+
+    def __iter_pages_concurrent(self, max_per_page: int) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Приватный генератор параллельной загрузки страниц вакансий.
+        Первая страница запрашивается отдельно, из нее берется общее количество страниц ("pages"),
+        остальные страницы загружаются в max_workers потоков. Одновременно загружается не больше
+        max_workers страниц, порядок страниц сохраняется
+        :param max_per_page: Максимальное количество страниц
+        :return: Итератор списков словарей вакансий
+        """
+        if max_per_page <= 0:
+            return
+        data = self.connect()
+        vacancy = data.get("items", [])
+        if not vacancy:
+            return
+        yield vacancy
+        last_page = min(data.get("pages", 1), max_per_page)
+        pages_params = [{**self.__params, "page": page} for page in range(1, last_page)]
+        if not pages_params:
+            return
+        executor = ThreadPoolExecutor(max_workers=min(self.max_workers, len(pages_params)))
+        futures: Deque[Future[Dict[str, Any]]] = deque()
+        try:
+            for params in pages_params:
+                futures.append(executor.submit(self.__connect, params))
+                if len(futures) >= self.max_workers:
+                    vacancy = futures.popleft().result().get("items", [])
+                    if vacancy:
+                        yield vacancy
+            while futures:
+                vacancy = futures.popleft().result().get("items", [])
+                if vacancy:
+                    yield vacancy
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
 
     @staticmethod
     def __valid_per_page(per_page: int) -> int:
@@ -96,3 +483,12 @@ class HeadHunterAPI(AbstractApi):
             raise ValueError("Параметр не может быть больше 100")
         else:
             return per_page
+
+    @staticmethod
+    def __valid_max_workers(max_workers: int) -> int:
+        """Проверка корректности количества потоков"""
+        if not isinstance(max_workers, int):
+            raise TypeError("Количество потоков не является целым числом")
+        if max_workers <= 0:
+            raise ValueError("Количество потоков должно быть положительным числом")
+        return max_workers
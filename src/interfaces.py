@@ -1,16 +1,35 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+
+class AbstractTransport(ABC):
+    """
+    Абстрактный класс HTTP транспорта, общего для клиентов API
+    Методы:
+        get(self, url: str, headers: Optional[Dict[str, str]] = None, params: Optional[Dict[str, Any]] = None) -> Any:
+            Метод выполнения GET запроса
+    """
+
+    @abstractmethod
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None, params: Optional[Dict[str, Any]] = None) -> Any:
+        """Метод выполнения GET запроса"""
+        pass
 
 
 class AbstractApi(ABC):
     """
     Абстрактный класс работы с API
+    Атрибуты:
+        transport(AbstractTransport): HTTP транспорт, через который выполняются запросы
+    Методы:
         connect(self) -> Dict[Any, Any]:
             Метод подключения к API
         get_vacancies(self, keyword) -> List[Dict[Any, Any]]:
             Метод получения вакансий
     """
 
+    transport: AbstractTransport
+
     @abstractmethod
     def connect(self) -> Dict[Any, Any]:
         """Метод подключения к API"""
@@ -22,6 +41,27 @@ class AbstractApi(ABC):
         pass
 
 
+class AbstractAsyncApi(ABC):
+    """
+    Абстрактный класс асинхронной работы с API
+    Методы:
+        connect(self) -> Dict[Any, Any]:
+            Асинхронный метод подключения к API
+        get_vacancies(self, keyword) -> List[Dict[Any, Any]]:
+            Асинхронный метод получения вакансий
+    """
+
+    @abstractmethod
+    async def connect(self) -> Dict[Any, Any]:
+        """Асинхронный метод подключения к API"""
+        pass
+
+    @abstractmethod
+    async def get_vacancies(self, keyword: str) -> List[Dict[Any, Any]]:
+        """Асинхронный метод получения вакансий"""
+        pass
+
+
 class AbstractJobFiles(ABC):
     """
     Абстрактный класс работы с файлами
@@ -30,6 +70,8 @@ class AbstractJobFiles(ABC):
             Метод получения данных из файла
         add_data(self, data: Dict[str, Any]) -> None:
             Метод добавления данных в файл
+        add_many(self, data: Iterable[Dict[str, Any]]) -> int:
+            Метод добавления многих записей в файл за одно чтение и одну запись
         del_data(self, data: Dict[str, Any]) -> None:
             Метод удаления данных из файла
     """
@@ -44,6 +86,11 @@ class AbstractJobFiles(ABC):
         """Метод добавления данных в файл"""
         pass
 
+    @abstractmethod
+    def add_many(self, data: Iterable[Dict[str, Any]]) -> int:
+        """Метод добавления многих записей в файл за одно чтение и одну запись"""
+        pass
+
     @abstractmethod
     def del_data(self, data: Dict[str, Any]) -> None:
         """Метод удаления данных из файла"""
@@ -56,6 +103,9 @@ class Valid(ABC):
     Метод:
         validate_vacancy_to_dict(self, *args, **kwargs) -> Dict[str, Any]:
             Метод получения валидные данных вакансии выводит в виде словаря
+        validate_many(self, names: Sequence[str], urls: Sequence[str], salaries_from: Sequence[Optional[int]],
+        salaries_to: Sequence[Optional[int]]) -> Dict[str, List[Any]]:
+            Метод получения валидных данных сразу по колонкам многих вакансий
     """
 
     @abstractmethod
@@ -65,10 +115,23 @@ class Valid(ABC):
         """Метод получения валидных данных вакансии выводит в виде словаря"""
         pass
 
+    @abstractmethod
+    def validate_many(
+            self,
+            names: Sequence[str],
+            urls: Sequence[str],
+            salaries_from: Sequence[Optional[int]],
+            salaries_to: Sequence[Optional[int]],
+    ) -> Dict[str, List[Any]]:
+        """Метод получения валидных данных сразу по колонкам многих вакансий"""
+        pass
+
 
 class AbsTwelveDataApi(ABC):
     """
     Абстрактный класс интерфейса работы с TwelveData_API
+    Атрибуты:
+        transport(AbstractTransport): HTTP транспорт, через который выполняются запросы
     Методы:
         connect(self) -> Dict[str, Any]:
             Метод подключения к API
@@ -76,6 +139,8 @@ class AbsTwelveDataApi(ABC):
             Метод получения стоимости валюты
     """
 
+    transport: AbstractTransport
+
     @abstractmethod
     def connect(self) -> Dict[str, Any]:
         """Метод подключения к API"""
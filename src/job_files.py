@@ -1,19 +1,68 @@
+import codecs
+import copy
 import json
+import mmap
+import os
+import re
+import time
+import uuid
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple, Union
 
 from src.interfaces import AbstractJobFiles
 
 
+def stable_key(data: Dict[str, Any], key_field: str = "url") -> str:
+    """
+    Функция получения устойчивого ключа записи вакансии (ссылка или id HeadHunter)
+    :param data: Словарь с данными
+    :param key_field: Поле ключа (по умолчанию "url")
+    :return: Значение поля key_field строкой, без него - JSON строка словаря с отсортированными ключами
+    """
+    key = data.get(key_field)
+    return json.dumps(data, sort_keys=True, ensure_ascii=False) if key is None else str(key)
+
+
+def _copy_record(record: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Копирование записи: кэш процесса общий для всех JSONSaver файла, поэтому записи отдаются и сохраняются
+    копиями, и изменение словаря вызывающим кодом не меняет данные других экземпляров
+    :param record: Словарь записи
+    :return: Копия словаря (вложенные списки и словари копируются глубоко)
+    """
+    return {key: copy.deepcopy(value) if isinstance(value, (dict, list)) else value for key, value in record.items()}
+
+
+# Размер части файла, читаемой за раз при потоковом разборе (JSONSaver.iter_data), в символах или байтах
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# Количество изменений и время в секундах, после которых буферизованная сессия записывает файл (JSONSaver.buffered)
+DEFAULT_MAX_PENDING = 1000
+DEFAULT_MAX_DELAY = 5.0
+
+# Пробельные символы JSON между элементами массива
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# Загруженные в процессе JSON файлы: (путь, поле ключа) -> (подпись файла, записи, индекс ключ -> позиция)
+_snapshots: Dict[Tuple[str, str], Tuple[Tuple[int, int, int], List[Dict[str, Any]], Dict[str, int]]] = {}
+
+
 class JSONSaver(AbstractJobFiles):
     """
-    Класс работы с JSON файлами
+    Класс работы с JSON файлами. Записи индексируются по устойчивому ключу (stable_key: ссылка вакансии),
+    поэтому поиск, проверка повторов, обновление и удаление не сравнивают словари целиком.
+    Файл разбирается и индексируется один раз на процесс, повторно - только если он изменился
+    на диске (по времени изменения, размеру и inode). Файл записывается атомарно (временный файл
+    и os.replace), в буферизованной сессии (buffered) изменения копятся в памяти и записываются пачкой
 
     Атрибуты:
         file_path(str): путь к файлу
+        key_field(str): Поле ключа записи (по умолчанию "url")
+        fsync(bool): Сбрасывать файл и папку на диск при каждой записи (по умолчанию False)
 
     Методы:
-        __init__(self, file_path: str):
+        __init__(self, file_path: str, key_field: str = "url", fsync: bool = False):
             Инициализация класса JSONSaver
         read_data(self) -> List[Dict[str, Any]]:
             Метод получения данных из JSON файла
@@ -21,63 +70,769 @@ class JSONSaver(AbstractJobFiles):
                 Выводит пустой список
             :raise json.JSONDecodeError: Ошибка форматирования JSON файла. Обходит исключение.
                 Выводит пустой список
+        iter_data(self, use_mmap: bool = False, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Dict[str, Any]]:
+            Метод-генератор потокового чтения записей JSON файла (память - одна запись и часть файла)
+            :raise json.JSONDecodeError: Ошибка форматирования JSON внутри массива
         add_data(self, data: Dict[str, Any]) -> None:
             Метод добавления данных в файл (добавляет, а не перезаписывает)
+        add_many(self, data: Iterable[Dict[str, Any]]) -> int:
+            Метод добавления многих записей за одно чтение и одну запись файла (без повторов)
+        upsert(self, data: Dict[str, Any]) -> bool:
+            Метод добавления записи или замены записи с тем же ключом
+        get(self, key: str) -> Optional[Dict[str, Any]]:
+            Метод получения записи по ключу
         del_data(self, vacancy: Dict[str, Any]) -> None:
-            Метод удаления данных из файла
+            Метод удаления данных из файла (по ключу записи)
             :raise ValueError: Вызывается, если удаляемые данные не найдены. Обходит исключение.
                 Выводит в консоль 'Вакансия не найдена'
+        record_key(self, data: Dict[str, Any]) -> str:
+            Метод получения ключа записи
+        buffered(self, max_pending: int = DEFAULT_MAX_PENDING, max_delay: float = DEFAULT_MAX_DELAY)
+        -> Iterator["JSONSaver"]:
+            Контекстный менеджер буферизованной сессии (запись по количеству изменений, времени и на выходе)
+            :raise ValueError: Если max_pending меньше 1 или max_delay отрицательный
+        flush(self) -> None:
+            Метод записи накопленных в сессии изменений в файл
+        __current(self) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+            Приватный метод получения записей и индекса с учетом незаписанных изменений сессии
+        __edit(self) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+            Приватный метод получения изменяемых копий записей и индекса
+        __commit(self, data: List[Dict[str, Any]], index: Dict[str, int]) -> None:
+            Приватный метод сохранения изменения (запись файла или буфер сессии)
+        __load(self) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+            Приватный метод получения записей и индекса (из кэша процесса, если файл не изменился)
+        __save(self, data: List[Dict[str, Any]], index: Dict[str, int]) -> None:
+            Приватный метод атомарной записи файла и обновления кэша процесса
+        __fsync_dir(self) -> None:
+            Приватный метод сброса на диск записи папки файла
+        __build_index(self, data: List[Dict[str, Any]]) -> Dict[str, int]:
+            Приватный метод построения индекса ключ -> позиция записи
+        __signature(self) -> Optional[Tuple[int, int, int]]:
+            Приватный метод получения подписи файла (время изменения, размер, inode)
+        __parse_array(chunks: Iterator[str]) -> Iterator[Any]:
+            Статический метод-генератор разбора элементов JSON массива по частям текста
+        __text_chunks(json_file: TextIO, chunk_size: int) -> Iterator[str]:
+            Статический метод-генератор чтения файла частями
+        __mmap_chunks(fileno: int, chunk_size: int) -> Iterator[str]:
+            Статический метод-генератор чтения отображенного в память файла частями
     """
 
     file_path: str
+    key_field: str
+    fsync: bool
 
-    def __init__(self, file_path: str | Path) -> None:
+    def __init__(self, file_path: str | Path, key_field: str = "url", fsync: bool = False) -> None:
         """
         Инициализация класса JSONSaver
         :param file_path: Путь к файлу
+        :param key_field: Поле ключа записи (по умолчанию "url")
+        :param fsync: Сбрасывать файл и папку на диск (os.fsync) при каждой записи: запись переживает
+            отключение питания, но медленнее (по умолчанию False - атомарность только при сбое процесса)
         """
         self.__file_path = file_path
+        self.__cache_key = (os.path.abspath(file_path), key_field)
+        self.key_field = key_field
+        self.fsync = fsync
+        self.__buffer: Optional[Tuple[List[Dict[str, Any]], Dict[str, int]]] = None
+        self.__limits: Optional[Tuple[int, float]] = None
+        self.__pending = 0
+        self.__pending_since = 0.0
 
     def read_data(self) -> List[Dict[str, Any]]:
         """
         Метод получения данных из JSON файла
-        :return: Список словарей
+        :return: Список копий словарей (изменение не влияет на файл и другие экземпляры JSONSaver)
         :raise FileNotFoundError: Если файл не найден. Выводит пустой список
         :raise json.JSONDecodeError: Ошибка форматирования JSON файла. Выводит пустой список
         """
+        data, _ = self.__current()
+        return [_copy_record(record) for record in data]
+
+    def iter_data(self, use_mmap: bool = False, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Dict[str, Any]]:
+        """
+        Метод-генератор потокового чтения записей JSON файла: массив разбирается по мере чтения частями
+        по chunk_size, в памяти одновременно находятся только текущая запись и непрочитанная часть.
+        Как и read_data, для отсутствующего файла и файла не с массивом записей не возвращает ничего.
+        В сессии с незаписанными изменениями записи берутся из буфера сессии
+        :param use_mmap: Читать файл через отображение в память (mmap) вместо чтения частями
+        :param chunk_size: Размер части файла (по умолчанию 64 КБ)
+        :return: Итератор словарей записей в порядке файла
+        :raise json.JSONDecodeError: Ошибка форматирования JSON внутри массива
+            (записи до ошибки уже возвращены)
+        :raise ValueError: Если chunk_size меньше 1
+        """
+        if chunk_size < 1:
+            raise ValueError("Размер части должен быть положительным числом")
+        if self.__buffer is not None:
+            yield from map(_copy_record, list(self.__buffer[0]))
+            return
         try:
-            with open(self.__file_path, "r", encoding="utf-8") as json_file:
-                data = json.load(json_file)
-                if isinstance(data, List):
-                    return data
-                return []
+            if use_mmap:
+                with open(self.__file_path, "rb") as binary_file:
+                    yield from self.__parse_array(self.__mmap_chunks(binary_file.fileno(), chunk_size))
+            else:
+                with open(self.__file_path, "r", encoding="utf-8") as json_file:
+                    yield from self.__parse_array(self.__text_chunks(json_file, chunk_size))
         except FileNotFoundError:
-            return []
-        except json.JSONDecodeError:
-            return []
+            return
 
     def add_data(self, data: Dict[str, Any]) -> None:
         """
         Метод добавления данных в файл (добавляет, а не перезаписывает)
         :param data: Словарь с данными
         """
-        file_data = self.read_data()
-        if data not in file_data:
+        self.add_many([data])
+
+    def add_many(self, data: Iterable[Dict[str, Any]]) -> int:
+        """
+        Метод добавления многих записей в файл: файл записывается один раз,
+        записи с уже сохраненным ключом (и повторы внутри data) не добавляются
+        :param data: Итерируемый объект словарей с данными
+        :return: Количество добавленных записей
+        """
+        file_data, index = self.__edit()
+        added = 0
+        for record in data:
+            key = self.record_key(record)
+            if key not in index:
+                index[key] = len(file_data)
+                file_data.append(_copy_record(record))
+                added += 1
+        if added:
+            self.__commit(file_data, index)
+        return added
+
+    def upsert(self, data: Dict[str, Any]) -> bool:
+        """
+        Метод добавления записи или замены записи с тем же ключом (например, изменился опыт или зарплата)
+        :param data: Словарь с данными
+        :return: True - запись добавлена, False - заменена существующая
+        """
+        file_data, index = self.__edit()
+        key = self.record_key(data)
+        data = _copy_record(data)
+        position = index.get(key)
+        if position is None:
+            index[key] = len(file_data)
             file_data.append(data)
-        with open(self.__file_path, "w", encoding="utf-8") as json_file:
-            json.dump(file_data, json_file, indent=4, ensure_ascii=False)
+        else:
+            file_data[position] = data
+        self.__commit(file_data, index)
+        return position is None
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Метод получения записи по ключу
+        :param key: Ключ записи (значение key_field, например ссылка на вакансию)
+        :return: Копия словаря записи или None, если записи нет
+        """
+        file_data, index = self.__current()
+        position = index.get(key)
+        return None if position is None else _copy_record(file_data[position])
 
     def del_data(self, data: Dict[str, Any]) -> None:
         """
-        Метод удаления данных из файла
+        Метод удаления данных из файла (по ключу записи)
         :param data: Словарь с данными
         :raise ValueError: Вызывается, если удаляемые данные не найдены, с выводом в консоль 'Вакансия не найдена'
         """
-        file_data = self.read_data()
+        file_data, index = self.__edit()
+        try:
+            position = index[self.record_key(data)]
+        except KeyError:
+            print("Вакансия не найдена")
+        else:
+            del file_data[position]
+            self.__commit(file_data, self.__build_index(file_data))
+
+    def record_key(self, data: Dict[str, Any]) -> str:
+        """
+        Метод получения ключа записи
+        :param data: Словарь с данными
+        :return: Значение поля key_field строкой (stable_key)
+        """
+        return stable_key(data, self.key_field)
+
+    @contextmanager
+    def buffered(
+        self, max_pending: int = DEFAULT_MAX_PENDING, max_delay: float = DEFAULT_MAX_DELAY
+    ) -> Iterator["JSONSaver"]:
+        """
+        Контекстный менеджер буферизованной сессии: add_data, add_many, upsert и del_data меняют записи
+        в памяти, файл записывается одной атомарной записью, когда накопилось max_pending изменений,
+        когда с первого незаписанного изменения прошло max_delay секунд (проверяется при следующем
+        изменении) и при выходе из сессии (в том числе по исключению). Чтение в сессии видит
+        незаписанные изменения, изменения файла другими процессами до записи не учитываются.
+        Вложенная сессия продолжает внешнюю
+        :param max_pending: Количество изменений, после которого файл записывается (по умолчанию 1000)
+        :param max_delay: Время в секундах, после которого файл записывается (по умолчанию 5)
+        :return: Этот же экземпляр JSONSaver
+        :raise ValueError: Если max_pending меньше 1 или max_delay отрицательный
+        """
+        if max_pending < 1 or max_delay < 0:
+            raise ValueError("Некорректный размер или время буфера")
+        if self.__limits is not None:
+            yield self
+            return
+        self.__limits = (max_pending, max_delay)
+        try:
+            yield self
+        finally:
+            try:
+                self.flush()
+            finally:
+                self.__limits = None
+
+    def flush(self) -> None:
+        """Метод записи накопленных в сессии изменений в файл (без изменений ничего не делает)"""
+        if self.__buffer is not None and self.__pending:
+            self.__save(*self.__buffer)
+        # Записанные списки теперь принадлежат кэшу процесса, следующее изменение работает с копией
+        self.__buffer = None
+        self.__pending = 0
+
+    def __current(self) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+        """
+        Получение записей и индекса для чтения (с незаписанными изменениями сессии)
+        :return: Кортеж (список записей, индекс ключ -> позиция)
+        """
+        return self.__buffer if self.__buffer is not None else self.__load()
+
+    def __edit(self) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+        """
+        Получение изменяемых копий записей и индекса: кэш процесса меняется только после записи файла,
+        поэтому ошибка записи или незаписанный буфер сессии не расходятся с файлом на диске
+        :return: Кортеж (список записей, индекс ключ -> позиция)
+        """
+        if self.__buffer is not None:
+            return self.__buffer
+        data, index = self.__load()
+        data, index = list(data), dict(index)
+        if self.__limits is not None:
+            self.__buffer = (data, index)
+        return data, index
+
+    def __commit(self, data: List[Dict[str, Any]], index: Dict[str, int]) -> None:
+        """
+        Сохранение изменения: вне сессии - запись файла, в сессии - буфер и запись по размеру или времени
+        :param data: Список записей
+        :param index: Индекс ключ -> позиция записи
+        """
+        if self.__limits is None:
+            self.__save(data, index)
+            return
+        self.__buffer = (data, index)
+        if not self.__pending:
+            self.__pending_since = time.monotonic()
+        self.__pending += 1
+        max_pending, max_delay = self.__limits
+        if self.__pending >= max_pending or time.monotonic() - self.__pending_since >= max_delay:
+            self.flush()
+
+    def __load(self) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+        """
+        Получение записей и индекса: файл разбирается, только если изменился с прошлого чтения в процессе
+        :return: Кортеж (список записей, индекс ключ -> позиция)
+        """
+        signature = self.__signature()
+        snapshot = _snapshots.get(self.__cache_key)
+        if signature is not None and snapshot is not None and snapshot[0] == signature:
+            return snapshot[1], snapshot[2]
         try:
-            file_data.remove(data)
-        except ValueError:
+            with open(self.__file_path, "r", encoding="utf-8") as json_file:
+                data = json.load(json_file)
+        except FileNotFoundError:
+            data = []
+        except json.JSONDecodeError:
+            data = []
+        if not isinstance(data, list):
+            data = []
+        index = self.__build_index(data)
+        if signature is not None:
+            _snapshots[self.__cache_key] = (signature, data, index)
+        return data, index
+
+    def __save(self, data: List[Dict[str, Any]], index: Dict[str, int]) -> None:
+        """
+        Атомарная запись файла: данные пишутся во временный файл в той же папке, который заменяет
+        файл через os.replace, поэтому сбой во время записи не оставляет обрезанный JSON.
+        Обновляет кэш процесса (следующее чтение не разбирает файл заново)
+        :param data: Список записей
+        :param index: Индекс ключ -> позиция записи
+        """
+        tmp_path = f"{self.__file_path}.{uuid.uuid4().hex}.tmp"
+        try:
+            with open(tmp_path, "x", encoding="utf-8") as json_file:
+                json.dump(data, json_file, indent=4, ensure_ascii=False)
+                if self.fsync:
+                    json_file.flush()
+                    os.fsync(json_file.fileno())
+            os.replace(tmp_path, self.__file_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        if self.fsync:
+            self.__fsync_dir()
+        signature = self.__signature()
+        if signature is not None:
+            _snapshots[self.__cache_key] = (signature, data, index)
+
+    def __fsync_dir(self) -> None:
+        """Сброс на диск записи папки файла (новая запись каталога после os.replace), только в POSIX"""
+        if os.name != "posix":
+            return
+        dir_fd = os.open(os.path.dirname(os.path.abspath(self.__file_path)), os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+    def __build_index(self, data: List[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Построение индекса ключ -> позиция записи (при повторах ключа в старых файлах - первая запись)
+        :param data: Список записей
+        :return: Индекс ключ -> позиция записи
+        """
+        index: Dict[str, int] = {}
+        for position, record in enumerate(data):
+            index.setdefault(self.record_key(record), position)
+        return index
+
+    def __signature(self) -> Optional[Tuple[int, int, int]]:
+        """
+        Получение подписи файла для проверки изменений
+        :return: Кортеж (время изменения в наносекундах, размер, inode) или None, если файла нет
+        """
+        try:
+            stat = os.stat(self.__file_path)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+    @staticmethod
+    def __parse_array(chunks: Iterator[str]) -> Iterator[Any]:
+        """
+        Разбор элементов JSON массива верхнего уровня по частям текста (json.JSONDecoder.raw_decode).
+        Если элемент не помещается в прочитанную часть, дочитывается следующая часть,
+        уже разобранный текст отбрасывается
+        :param chunks: Итератор частей текста файла
+        :return: Итератор элементов массива (ничего, если файл пустой или не начинается с "[")
+        :raise json.JSONDecodeError: Ошибка форматирования JSON внутри массива
+        """
+        decoder = json.JSONDecoder()
+        buffer, pos, eof = "", 0, False
+        expect = "start"
+        while True:
+            pos = _WHITESPACE.match(buffer, pos).end()  # type: ignore[union-attr]
+            if pos == len(buffer):
+                chunk = next(chunks, None)
+                if chunk is None:
+                    if expect == "start":
+                        return
+                    raise json.JSONDecodeError("Незавершенный массив", buffer, pos)
+                buffer, pos = buffer[pos:] + chunk, 0
+                continue
+            char = buffer[pos]
+            if expect == "start":
+                if char != "[":
+                    return
+                pos, expect = pos + 1, "first"
+            elif char == "]" and expect in ("first", "separator"):
+                return
+            elif expect == "separator":
+                if char != ",":
+                    raise json.JSONDecodeError("Ожидалась запятая", buffer, pos)
+                pos, expect = pos + 1, "value"
+            else:
+                while True:
+                    try:
+                        value, end = decoder.raw_decode(buffer, pos)
+                        # Число в конце части может продолжаться в следующей
+                        if end < len(buffer) or eof:
+                            break
+                    except json.JSONDecodeError:
+                        if eof:
+                            raise
+                    chunk = next(chunks, None)
+                    if chunk is None:
+                        eof = True
+                    else:
+                        buffer, pos = buffer[pos:] + chunk, 0
+                yield value
+                pos, expect = end, "separator"
+
+    @staticmethod
+    def __text_chunks(json_file: TextIO, chunk_size: int) -> Iterator[str]:
+        """
+        Чтение файла частями
+        :param json_file: Файл, открытый на чтение в текстовом режиме
+        :param chunk_size: Размер части в символах
+        :return: Итератор частей текста
+        """
+        while chunk := json_file.read(chunk_size):
+            yield chunk
+
+    @staticmethod
+    def __mmap_chunks(fileno: int, chunk_size: int) -> Iterator[str]:
+        """
+        Чтение отображенного в память файла частями (страницы подгружает и освобождает ОС)
+        :param fileno: Дескриптор файла, открытого на чтение
+        :param chunk_size: Размер части в байтах
+        :return: Итератор частей текста (символы UTF-8 на границе частей не разрываются)
+        """
+        if os.fstat(fileno).st_size == 0:
+            return
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        with mmap.mmap(fileno, 0, access=mmap.ACCESS_READ) as mapped:
+            for start in range(0, len(mapped), chunk_size):
+                yield decoder.decode(mapped[start:start + chunk_size])
+        yield decoder.decode(b"", final=True)
+
+
+# Поле записи-надгробия (tombstone): отметка удаления записи с этим ключом в JSON Lines файле
+TOMBSTONE_FIELD = "__deleted__"
+
+
+class JSONLinesSaver(AbstractJobFiles):
+    """
+    Класс работы с файлами JSON Lines (одна запись на строку, только дозапись в конец).
+    Добавление не перезаписывает файл, удаление дописывает запись-надгробие (tombstone).
+    Рядом с файлом хранится индекс смещений (file_path + ".idx", тоже только дозапись):
+    ключ -> смещение и длина строки, поэтому get читает с диска одну строку без разбора всего файла.
+    Индекс - кэш: если его нет или он отстает от файла, недостающая часть строится по файлу данных
+
+    Атрибуты:
+        file_path(Path): Путь к файлу данных
+        index_path(Path): Путь к файлу индекса смещений
+        key_field(str): Поле ключа записи (по умолчанию "url"), без него ключ - JSON строка записи (stable_key)
+
+    Методы:
+        __init__(self, file_path: Union[str, Path], key_field: str = "url") -> None:
+            Инициализация класса JSONLinesSaver
+        read_data(self) -> List[Dict[str, Any]]:
+            Метод получения всех действующих записей в порядке добавления
+        add_data(self, data: Dict[str, Any]) -> None:
+            Метод добавления записи в конец файла (запись с уже сохраненным ключом не добавляется)
+        add_many(self, data: Iterable[Dict[str, Any]]) -> int:
+            Метод добавления многих записей в конец файла
+        del_data(self, data: Dict[str, Any]) -> None:
+            Метод удаления записи (дописывает запись-надгробие).
+            Если удаляемые данные не найдены, выводит в консоль 'Вакансия не найдена'
+        get(self, key: str) -> Optional[Dict[str, Any]]:
+            Метод получения записи по ключу через индекс смещений
+        compact(self) -> None:
+            Метод перезаписи файла и индекса без удаленных записей
+        record_key(self, data: Dict[str, Any]) -> str:
+            Метод получения ключа записи
+        __sync_index(self) -> Dict[str, Tuple[int, int]]:
+            Приватный метод загрузки индекса и догрузки записей, которых в нем еще нет
+        __apply(self, key: str, offset: int, length: int, live: bool) -> None:
+            Приватный метод применения записи индекса к словарю действующих записей
+        __scan(self, start: int) -> List[Tuple[str, int, int, bool]]:
+            Приватный метод построения записей индекса по файлу данных, начиная со смещения start
+        __append(self, records: List[Tuple[str, Dict[str, Any]]]) -> None:
+            Приватный метод дозаписи строк в файл данных и индекс
+        __signature(self) -> Optional[Tuple[int, int, int]]:
+            Приватный метод получения подписи файла данных (время изменения, размер, inode)
+        __trim_partial_line(data_file: BinaryIO) -> int:
+            Статический метод отрезания недописанной последней строки (после сбоя записи)
+        __encode(value: Any) -> bytes:
+            Статический метод кодирования значения в строку JSON Lines
+    """
+
+    file_path: Path
+    index_path: Path
+    key_field: str
+
+    def __init__(self, file_path: Union[str, Path], key_field: str = "url") -> None:
+        """
+        Инициализация класса JSONLinesSaver
+        :param file_path: Путь к файлу данных
+        :param key_field: Поле ключа записи (по умолчанию "url")
+        """
+        self.file_path = Path(file_path)
+        self.index_path = self.file_path.with_name(self.file_path.name + ".idx")
+        self.key_field = key_field
+        # Действующие записи: ключ -> (смещение, длина строки)
+        self.__index: Dict[str, Tuple[int, int]] = {}
+        # Размер файла данных, до которого построен индекс (None - индекс еще не загружен)
+        self.__indexed_size: Optional[int] = None
+        # Подпись файла данных при последней сверке индекса (время изменения, размер, inode)
+        self.__synced_signature: Optional[Tuple[int, int, int]] = None
+
+    def read_data(self) -> List[Dict[str, Any]]:
+        """
+        Метод получения всех действующих записей в порядке добавления
+        :return: Список словарей (пустой, если файла нет)
+        """
+        live_offsets = {offset for offset, _ in self.__sync_index().values()}
+        if not live_offsets:
+            return []
+        result = []
+        with open(self.file_path, "rb") as data_file:
+            offset = 0
+            for line in data_file:
+                if offset in live_offsets:
+                    result.append(json.loads(line))
+                offset += len(line)
+        return result
+
+    def add_data(self, data: Dict[str, Any]) -> None:
+        """
+        Метод добавления записи в конец файла (запись с уже сохраненным ключом не добавляется)
+        :param data: Словарь с данными
+        """
+        self.add_many([data])
+
+    def add_many(self, data: Iterable[Dict[str, Any]]) -> int:
+        """
+        Метод добавления многих записей в конец файла за одно открытие (без повторов по ключу)
+        :param data: Итерируемый объект словарей с данными
+        :return: Количество добавленных записей
+        """
+        index = self.__sync_index()
+        seen = set()
+        records = []
+        for record in data:
+            key = self.record_key(record)
+            if key not in index and key not in seen:
+                seen.add(key)
+                records.append((key, record))
+        self.__append(records)
+        return len(records)
+
+    def del_data(self, data: Dict[str, Any]) -> None:
+        """
+        Метод удаления записи (дописывает запись-надгробие, место освобождает compact)
+        :param data: Словарь с данными (используется только его ключ)
+        Если удаляемые данные не найдены, выводит в консоль 'Вакансия не найдена'
+        """
+        key = self.record_key(data)
+        if key not in self.__sync_index():
             print("Вакансия не найдена")
         else:
-            with open(self.__file_path, "w", encoding="utf-8") as json_file:
-                json.dump(file_data, json_file, indent=4, ensure_ascii=False)
+            self.__append([(key, {TOMBSTONE_FIELD: key})])
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Метод получения записи по ключу: читается одна строка по смещению из индекса
+        :param key: Ключ записи (значение key_field)
+        :return: Словарь записи или None, если записи нет
+        """
+        position = self.__sync_index().get(key)
+        if position is None:
+            return None
+        offset, length = position
+        with open(self.file_path, "rb") as data_file:
+            data_file.seek(offset)
+            record: Dict[str, Any] = json.loads(data_file.read(length))
+        return record
+
+    def compact(self) -> None:
+        """Метод перезаписи файла и индекса без удаленных записей и надгробий"""
+        data = self.read_data()
+        tmp_path = self.file_path.with_name(self.file_path.name + ".tmp")
+        index = {}
+        index_lines = []
+        with open(tmp_path, "wb") as data_file:
+            offset = 0
+            for record in data:
+                key = self.record_key(record)
+                line = self.__encode(record)
+                data_file.write(line)
+                index[key] = (offset, len(line))
+                index_lines.append(self.__encode([key, offset, len(line), True]))
+                offset += len(line)
+        os.replace(tmp_path, self.file_path)
+        with open(self.index_path, "wb") as index_file:
+            index_file.writelines(index_lines)
+        self.__index = index
+        self.__indexed_size = offset
+        self.__synced_signature = self.__signature()
+
+    def record_key(self, data: Dict[str, Any]) -> str:
+        """
+        Метод получения ключа записи
+        :param data: Словарь с данными
+        :return: Значение поля key_field строкой (stable_key)
+        """
+        if TOMBSTONE_FIELD in data:
+            return str(data[TOMBSTONE_FIELD])
+        return stable_key(data, self.key_field)
+
+    def __sync_index(self) -> Dict[str, Tuple[int, int]]:
+        """
+        Загрузка индекса (при первом обращении) и догрузка записей, дописанных в файл данных после
+        построения индекса (например, другим процессом). Если файл данных заменен (другой inode, например
+        после compact в другом экземпляре) или перезаписан без изменения размера - индекс загружается заново,
+        если файл данных стал меньше - индекс строится заново
+        :return: Словарь действующих записей: ключ -> (смещение, длина строки)
+        """
+        signature = self.__signature()
+        size = 0 if signature is None else signature[1]
+        synced = self.__synced_signature
+        if synced is not None and (
+            signature is None or signature[2] != synced[2] or (size == synced[1] and signature != synced)
+        ):
+            self.__indexed_size = None
+        if self.__indexed_size is None:
+            self.__index, self.__indexed_size = {}, 0
+            try:
+                with open(self.index_path, "rb") as index_file:
+                    for line in index_file:
+                        key, offset, length, live = json.loads(line)
+                        self.__apply(key, offset, length, live)
+            except FileNotFoundError:
+                pass
+            except ValueError:
+                # Поврежденный индекс строится заново по файлу данных
+                self.__index, self.__indexed_size = {}, 0
+                self.index_path.unlink()
+        if size < self.__indexed_size:
+            self.__index, self.__indexed_size = {}, 0
+            self.index_path.unlink(missing_ok=True)
+        if size > self.__indexed_size:
+            entries = self.__scan(self.__indexed_size)
+            with open(self.index_path, "ab") as index_file:
+                index_file.writelines(self.__encode(list(entry)) for entry in entries)
+            for entry in entries:
+                self.__apply(*entry)
+            self.__indexed_size = size
+        self.__synced_signature = signature
+        return self.__index
+
+    def __apply(self, key: str, offset: int, length: int, live: bool) -> None:
+        """
+        Применение записи индекса к словарю действующих записей
+        :param key: Ключ записи
+        :param offset: Смещение строки в файле данных
+        :param length: Длина строки в байтах
+        :param live: False - запись-надгробие (удаление ключа)
+        """
+        if live:
+            self.__index[key] = (offset, length)
+        else:
+            self.__index.pop(key, None)
+        self.__indexed_size = max(self.__indexed_size or 0, offset + length)
+
+    def __scan(self, start: int) -> List[Tuple[str, int, int, bool]]:
+        """
+        Построение записей индекса по файлу данных, начиная со смещения start.
+        Поврежденные и недописанные строки пропускаются
+        :param start: Смещение начала чтения
+        :return: Список записей индекса (ключ, смещение, длина строки, действующая ли запись)
+        """
+        entries = []
+        with open(self.file_path, "rb") as data_file:
+            data_file.seek(start)
+            offset = start
+            for line in data_file:
+                if line.endswith(b"\n"):
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        record = None
+                    if isinstance(record, dict):
+                        entries.append((self.record_key(record), offset, len(line), TOMBSTONE_FIELD not in record))
+                offset += len(line)
+        return entries
+
+    def __append(self, records: List[Tuple[str, Dict[str, Any]]]) -> None:
+        """
+        Дозапись строк в конец файла данных и записей в индекс. Недописанная последняя строка
+        (сбой прошлой записи) отрезается, иначе новая строка склеилась бы с ней и потерялась при чтении
+        :param records: Список пар (ключ, словарь записи или надгробия)
+        """
+        if not records:
+            return
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        entries = []
+        with open(self.file_path, "a+b") as data_file:
+            offset = self.__trim_partial_line(data_file)
+            self.__indexed_size = min(self.__indexed_size or 0, offset)
+            for key, record in records:
+                line = self.__encode(record)
+                data_file.write(line)
+                entries.append((key, offset, len(line), TOMBSTONE_FIELD not in record))
+                offset += len(line)
+        with open(self.index_path, "ab") as index_file:
+            index_file.writelines(self.__encode(list(entry)) for entry in entries)
+        for entry in entries:
+            self.__apply(*entry)
+        self.__synced_signature = self.__signature()
+
+    def __signature(self) -> Optional[Tuple[int, int, int]]:
+        """
+        Получение подписи файла данных для проверки замены файла
+        :return: Кортеж (время изменения в наносекундах, размер, inode) или None, если файла нет
+        """
+        try:
+            stat = os.stat(self.file_path)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+    @staticmethod
+    def __trim_partial_line(data_file: BinaryIO) -> int:
+        """
+        Отрезание недописанной последней строки (без перевода строки в конце) после сбоя записи
+        :param data_file: Файл данных, открытый на чтение и дозапись
+        :return: Размер файла после отрезания (смещение следующей строки)
+        """
+        end = data_file.seek(0, os.SEEK_END)
+        if end == 0:
+            return 0
+        data_file.seek(end - 1)
+        if data_file.read(1) == b"\n":
+            return end
+        position = end
+        while position > 0:
+            start = max(0, position - DEFAULT_CHUNK_SIZE)
+            data_file.seek(start)
+            newline = data_file.read(position - start).rfind(b"\n")
+            if newline != -1:
+                position = start + newline + 1
+                break
+            position = start
+        data_file.truncate(position)
+        return position
+
+    @staticmethod
+    def __encode(value: Any) -> bytes:
+        """
+        Кодирование значения в строку JSON Lines
+        :param value: Словарь записи или запись индекса
+        :return: Байты строки с переводом строки в конце
+        """
+        return (json.dumps(value, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def json_to_jsonlines(json_path: Union[str, Path], jsonlines_path: Union[str, Path], key_field: str = "url") -> int:
+    """
+    Функция перевода файла JSON (массив записей, JSONSaver) в JSON Lines (JSONLinesSaver).
+    Файл JSON Lines и его индекс создаются заново
+    :param json_path: Путь к файлу JSON
+    :param jsonlines_path: Путь к файлу JSON Lines
+    :param key_field: Поле ключа записи (по умолчанию "url")
+    :return: Количество записанных записей
+    """
+    saver = JSONLinesSaver(jsonlines_path, key_field)
+    saver.file_path.unlink(missing_ok=True)
+    saver.index_path.unlink(missing_ok=True)
+    return saver.add_many(JSONSaver(json_path).read_data())
+
+
+def jsonlines_to_json(jsonlines_path: Union[str, Path], json_path: Union[str, Path], key_field: str = "url") -> int:
+    """
+    Функция перевода файла JSON Lines (JSONLinesSaver) в JSON (массив записей, JSONSaver).
+    Файл JSON перезаписывается
+    :param jsonlines_path: Путь к файлу JSON Lines
+    :param json_path: Путь к файлу JSON
+    :param key_field: Поле ключа записи (по умолчанию "url")
+    :return: Количество записанных записей
+    """
+    data = JSONLinesSaver(jsonlines_path, key_field).read_data()
+    with open(json_path, "w", encoding="utf-8") as json_file:
+        json.dump(data, json_file, indent=4, ensure_ascii=False)
+    return len(data)
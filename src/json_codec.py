@@ -0,0 +1,25 @@
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # orjson - необязательная зависимость (pip install orjson)
+    orjson = None  # type: ignore[assignment]
+
+# Используется ли быстрый разбор orjson
+HAS_ORJSON = orjson is not None
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """
+    Функция разбора JSON. При установленном orjson разбирает байты напрямую,
+    без декодирования в строку, иначе использует стандартный json
+    :param data: JSON в виде байтов или строки
+    :return: Разобранный объект
+    :raise ValueError: Если данные не являются корректным JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
@@ -0,0 +1,80 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Any, Dict, Iterable, List, Optional
+
+from src.twelve_data_api import CurrencyConversion
+from src.vacancies import Vacancy, foreign_currencies
+
+# Размер части списка, обрабатываемой одним процессом за раз
+DEFAULT_CHUNK_SIZE = 5000
+# Меньше этого количества вакансий запуск процессов дороже самой обработки - обработка в текущем процессе
+MIN_PARALLEL_SIZE = 20000
+
+
+def cast_to_object_list_parallel(
+    vacancy_data: Iterable[Dict[str, Any]],
+    converter: Optional[CurrencyConversion] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    workers: Optional[int] = None,
+    min_parallel_size: int = MIN_PARALLEL_SIZE,
+) -> List[Vacancy]:
+    """
+    Функция создания списка вакансий из словарей API в нескольких процессах (ProcessPoolExecutor).
+    Список делится на части по chunk_size, каждая часть разбирается и проверяется в отдельном процессе,
+    результат собирается в исходном порядке. Курсы валют запрашиваются один раз в текущем процессе.
+    Небольшие списки (меньше min_parallel_size) и workers=1 обрабатываются в текущем процессе
+    :param vacancy_data: Итерируемый объект словарей вакансий API (например, архивная выгрузка)
+    :param converter: Конвертер валют для перевода зарплаты в рубли
+        (по умолчанию None - зарплата не в рублях не учитывается)
+    :param chunk_size: Количество вакансий в одной части (по умолчанию DEFAULT_CHUNK_SIZE)
+    :param workers: Количество процессов (по умолчанию количество процессоров)
+    :param min_parallel_size: Минимальное количество вакансий для обработки в процессах
+        (по умолчанию MIN_PARALLEL_SIZE)
+    :return: Список экземпляров класса Vacancy в порядке исходных словарей
+    :raise ValueError: Если chunk_size или workers меньше 1, либо данные вакансии не проходят проверку
+    :raise TypeError: Если данные вакансии не проходят проверку
+    """
+    if chunk_size < 1:
+        raise ValueError("Размер части должен быть положительным числом")
+    if workers is not None and workers < 1:
+        raise ValueError("Количество процессов должно быть положительным числом")
+    vacancy_data = list(vacancy_data)
+    rates = _get_rates(vacancy_data, converter)
+    workers = workers or os.cpu_count() or 1
+    if len(vacancy_data) < min_parallel_size or workers == 1 or len(vacancy_data) <= chunk_size:
+        return Vacancy.cast_with_rates(vacancy_data, rates)
+
+    chunks = [vacancy_data[start:start + chunk_size] for start in range(0, len(vacancy_data), chunk_size)]
+    result: List[Vacancy] = []
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+        # map возвращает результаты в порядке частей, независимо от порядка завершения процессов
+        for vacancies in executor.map(_cast_chunk, chunks, repeat(rates)):
+            result.extend(vacancies)
+    return result
+
+
+def _get_rates(
+    vacancy_data: List[Dict[str, Any]], converter: Optional[CurrencyConversion]
+) -> Optional[Dict[str, float]]:
+    """
+    Получение курсов к рублю для всех валют списка (конвертер не передается в дочерние процессы)
+    :param vacancy_data: Список словарей вакансий API
+    :param converter: Конвертер валют или None
+    :return: Словарь {код валюты: курс к рублю} или None, если конвертер не указан
+    """
+    if converter is None:
+        return None
+    return converter.get_rates_in_rub(
+        foreign_currencies((vacancy.get("salary") or {}).get("currency") for vacancy in vacancy_data)
+    )
+
+
+def _cast_chunk(chunk: List[Dict[str, Any]], rates: Optional[Dict[str, float]]) -> List[Vacancy]:
+    """
+    Обработка одной части списка в дочернем процессе
+    :param chunk: Часть списка словарей вакансий API
+    :param rates: Курсы валют к рублю или None
+    :return: Список экземпляров класса Vacancy
+    """
+    return Vacancy.cast_with_rates(chunk, rates)
@@ -0,0 +1,140 @@
+import heapq
+from typing import Any, Callable, Iterable, List, Sequence, Tuple
+
+from src.vacancies import Vacancy
+
+# Функция ключа ранжирования: чем больше значение, тем выше вакансия в топе
+RankKey = Callable[[Vacancy], Any]
+
+# Порядок требуемого опыта HeadHunter (неизвестное значение - ниже всех)
+EXPERIENCE_ORDER = {"Нет опыта": 0, "От 1 года до 3 лет": 1, "От 3 до 6 лет": 2, "Более 6 лет": 3}
+
+
+def salary_key(vacancy: Vacancy) -> float:
+    """
+    Ключ ранжирования по средней зарплате
+    :param vacancy: Экземпляр класса Vacancy
+    :return: Средняя зарплата
+    """
+    return vacancy.salary_average()
+
+
+def experience_key(vacancy: Vacancy) -> int:
+    """
+    Ключ ранжирования по требуемому опыту (больше опыта - выше)
+    :param vacancy: Экземпляр класса Vacancy
+    :return: Порядковый номер опыта по EXPERIENCE_ORDER, -1 если опыт не указан или неизвестен
+    """
+    return EXPERIENCE_ORDER.get(vacancy.experience, -1)
+
+
+class TopRanker:
+    """
+    Класс выбора топ-'n' вакансий частичной выборкой через ограниченную кучу (O(n log k)).
+    Ключ каждой вакансии считается один раз при добавлении, вакансии можно добавлять
+    по мере поступления (из генератора), в памяти хранится не больше top_n вакансий.
+    При равных ключах выше та вакансия, которая пришла раньше (как у устойчивой сортировки)
+
+    Атрибуты:
+        top_n(int): Количество вакансий в топе
+        keys(tuple): Ключи ранжирования, сравниваются по порядку (по умолчанию только salary_key)
+        strict(bool): Требовать ровно top_n вакансий (по умолчанию False - вернуть сколько есть)
+
+    Методы:
+        __init__(self, top_n: int, keys: Sequence[RankKey] = (salary_key,), strict: bool = False) -> None:
+            Инициализация класса TopRanker
+            :raise ValueError: Если top_n отрицательное или не указан ни один ключ
+        __len__(self) -> int:
+            Количество вакансий, добавленных в ранжирование
+        push(self, vacancy: Vacancy) -> None:
+            Метод добавления вакансии
+        extend(self, vacancies: Iterable[Vacancy]) -> None:
+            Метод добавления вакансий из итерируемого объекта
+        result(self) -> List[Vacancy]:
+            Метод получения топа по убыванию ключей
+            :raise ValueError: Если strict и вакансий меньше, чем top_n
+        __score(self, vacancy: Vacancy) -> Tuple[Any, ...]:
+            Приватный метод расчета ключа вакансии
+    """
+
+    top_n: int
+    keys: Tuple[RankKey, ...]
+    strict: bool
+
+    def __init__(self, top_n: int, keys: Sequence[RankKey] = (salary_key,), strict: bool = False) -> None:
+        """
+        Инициализация класса TopRanker
+        :param top_n: Количество вакансий в топе
+        :param keys: Ключи ранжирования, сравниваются по порядку (по умолчанию только salary_key)
+        :param strict: Требовать ровно top_n вакансий (по умолчанию False - вернуть сколько есть)
+        :raise ValueError: Если top_n отрицательное или не указан ни один ключ
+        """
+        if top_n < 0:
+            raise ValueError("Количество вакансий в топе не может быть отрицательным")
+        if not keys:
+            raise ValueError("Не указан ни один ключ ранжирования")
+        self.top_n = top_n
+        self.keys = tuple(keys)
+        self.strict = strict
+        self.__heap: List[Tuple[Tuple[Any, ...], int, Vacancy]] = []
+        self.__count = 0
+
+    def __len__(self) -> int:
+        """Количество вакансий, добавленных в ранжирование"""
+        return self.__count
+
+    def push(self, vacancy: Vacancy) -> None:
+        """
+        Метод добавления вакансии. В куче остаются top_n лучших, худшая - на вершине
+        :param vacancy: Экземпляр класса Vacancy
+        """
+        # Отрицательный номер: при равном ключе раньше пришедшая вакансия "больше"
+        entry = (self.__score(vacancy), -self.__count, vacancy)
+        self.__count += 1
+        if len(self.__heap) < self.top_n:
+            heapq.heappush(self.__heap, entry)
+        elif self.__heap and entry[:2] > self.__heap[0][:2]:
+            heapq.heapreplace(self.__heap, entry)
+
+    def extend(self, vacancies: Iterable[Vacancy]) -> None:
+        """
+        Метод добавления вакансий из итерируемого объекта
+        :param vacancies: Список (или итератор) экземпляров класса Vacancy
+        """
+        for vacancy in vacancies:
+            self.push(vacancy)
+
+    def result(self) -> List[Vacancy]:
+        """
+        Метод получения топа по убыванию ключей
+        :return: Список не более top_n вакансий
+        :raise ValueError: Если strict и вакансий меньше, чем top_n
+        """
+        if self.strict and self.__count < self.top_n:
+            raise ValueError("В списке вакансий меньше чем необходимо")
+        return [vacancy for _, _, vacancy in sorted(self.__heap, key=lambda entry: entry[:2], reverse=True)]
+
+    def __score(self, vacancy: Vacancy) -> Tuple[Any, ...]:
+        """
+        Расчет ключа вакансии (один раз на вакансию)
+        :param vacancy: Экземпляр класса Vacancy
+        :return: Кортеж значений ключей ранжирования
+        """
+        return tuple(key(vacancy) for key in self.keys)
+
+
+def rank_top(
+    vacancies: Iterable[Vacancy], top_n: int, keys: Sequence[RankKey] = (salary_key,), strict: bool = False
+) -> List[Vacancy]:
+    """
+    Функция получения топ-'n' вакансий через TopRanker
+    :param vacancies: Список (или итератор) экземпляров класса Vacancy
+    :param top_n: Количество вакансий в топе
+    :param keys: Ключи ранжирования, сравниваются по порядку (по умолчанию только salary_key)
+    :param strict: Требовать ровно top_n вакансий (по умолчанию False - вернуть сколько есть)
+    :return: Список не более top_n вакансий по убыванию ключей
+    :raise ValueError: Если strict и вакансий меньше, чем top_n
+    """
+    ranker = TopRanker(top_n, keys, strict)
+    ranker.extend(vacancies)
+    return ranker.result()
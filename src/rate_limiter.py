@@ -0,0 +1,184 @@
+import json
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Union
+
+
+class RateLimiter:
+    """
+    Класс ограничения частоты запросов "token bucket" с адаптивной скоростью.
+    При ответе 429 скорость уменьшается в decrease_factor раз, при успешных ответах
+    медленно растет на increase_step до max_rate. Если указан lock_path, состояние хранится
+    в файле под блокировкой (fcntl) и ограничение действует на все процессы, использующие этот файл
+
+    Атрибуты:
+        capacity(float): Максимальное количество накопленных запросов (размер "всплеска")
+        min_rate(float): Минимальная скорость, запросов в секунду
+        max_rate(float): Максимальная скорость, запросов в секунду
+        increase_step(float): Прирост скорости после успешного ответа, запросов в секунду
+        decrease_factor(float): Множитель скорости после ответа 429
+        lock_path(Path): Путь к файлу общего для процессов состояния (по умолчанию None - только текущий процесс)
+
+    Методы:
+        __init__(self, rate: float, capacity: Optional[float] = None, min_rate: Optional[float] = None,
+        max_rate: Optional[float] = None, increase_step: Optional[float] = None, decrease_factor: float = 0.5,
+        lock_path: Union[str, Path, None] = None) -> None:
+            Инициализация класса RateLimiter
+            :raise ValueError: Если скорость, емкость или множитель некорректны
+        rate(self) -> float:
+            Свойство получения текущей скорости, запросов в секунду
+        acquire(self) -> float:
+            Метод ожидания разрешения на запрос
+        on_success(self) -> None:
+            Метод увеличения скорости после успешного ответа
+        on_throttle(self) -> None:
+            Метод уменьшения скорости после ответа 429
+        __state(self) -> Iterator[Dict[str, float]]:
+            Приватный контекстный менеджер доступа к состоянию под блокировкой
+    """
+
+    capacity: float
+    min_rate: float
+    max_rate: float
+    increase_step: float
+    decrease_factor: float
+    lock_path: Optional[Path]
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        min_rate: Optional[float] = None,
+        max_rate: Optional[float] = None,
+        increase_step: Optional[float] = None,
+        decrease_factor: float = 0.5,
+        lock_path: Union[str, Path, None] = None,
+    ) -> None:
+        """
+        Инициализация класса RateLimiter
+        :param rate: Начальная скорость, запросов в секунду
+        :param capacity: Максимальное количество накопленных запросов (по умолчанию max(1, rate))
+        :param min_rate: Минимальная скорость (по умолчанию rate / 10)
+        :param max_rate: Максимальная скорость (по умолчанию rate)
+        :param increase_step: Прирост скорости после успешного ответа (по умолчанию rate / 100)
+        :param decrease_factor: Множитель скорости после ответа 429 (по умолчанию 0.5)
+        :param lock_path: Путь к файлу общего для процессов состояния (по умолчанию None)
+        :raise ValueError: Если скорость, емкость или множитель некорректны
+        """
+        if rate <= 0:
+            raise ValueError("Скорость должна быть положительным числом")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("Множитель уменьшения скорости должен быть от 0 до 1")
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.min_rate = min_rate if min_rate is not None else rate / 10
+        self.max_rate = max_rate if max_rate is not None else rate
+        self.increase_step = increase_step if increase_step is not None else rate / 100
+        self.decrease_factor = decrease_factor
+        if self.capacity < 1 or not 0 < self.min_rate <= rate <= self.max_rate:
+            raise ValueError("Некорректная емкость или границы скорости")
+        self.lock_path = Path(lock_path) if lock_path is not None else None
+        self.__initial: Dict[str, float] = {"tokens": self.capacity, "updated_at": time.monotonic(), "rate": rate}
+        self.__local_state = dict(self.__initial)
+        self.__lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        """Текущая скорость, запросов в секунду"""
+        with self.__state() as state:
+            return state["rate"]
+
+    def acquire(self) -> float:
+        """
+        Метод ожидания разрешения на запрос (блокирует поток, пока не накопится запрос)
+        :return: Время ожидания в секундах
+        """
+        waited = 0.0
+        while True:
+            with self.__state() as state:
+                self.__refill(state)
+                if state["tokens"] >= 1:
+                    state["tokens"] -= 1
+                    return waited
+                delay = (1 - state["tokens"]) / state["rate"]
+            time.sleep(delay)
+            waited += delay
+
+    def on_success(self) -> None:
+        """Метод увеличения скорости после успешного ответа"""
+        with self.__state() as state:
+            state["rate"] = min(self.max_rate, state["rate"] + self.increase_step)
+
+    def on_throttle(self) -> None:
+        """Метод уменьшения скорости после ответа 429 (накопленные запросы сгорают)"""
+        with self.__state() as state:
+            self.__refill(state)
+            state["rate"] = max(self.min_rate, state["rate"] * self.decrease_factor)
+            state["tokens"] = min(state["tokens"], 0.0)
+
+    def __refill(self, state: Dict[str, float]) -> None:
+        """
+        Пополнение запросов за прошедшее время
+        :param state: Состояние (tokens, updated_at, rate)
+        """
+        now = self.__now()
+        elapsed = max(0.0, now - state["updated_at"])
+        state["tokens"] = min(self.capacity, state["tokens"] + elapsed * state["rate"])
+        state["updated_at"] = now
+
+    def __now(self) -> float:
+        """Текущее время: монотонное для процесса, системное для общего файла состояния"""
+        return time.time() if self.lock_path is not None else time.monotonic()
+
+    @contextmanager
+    def __state(self) -> Iterator[Dict[str, float]]:
+        """
+        Приватный контекстный менеджер доступа к состоянию под блокировкой.
+        Без lock_path состояние хранится в памяти процесса, с lock_path - в файле под fcntl.flock
+        :return: Словарь состояния (tokens, updated_at, rate), изменения сохраняются при выходе
+        """
+        with self.__lock:
+            if self.lock_path is None:
+                yield self.__local_state
+                return
+            import fcntl  # Доступен только в POSIX системах
+
+            self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.lock_path, "a+", encoding="utf-8") as state_file:
+                fcntl.flock(state_file, fcntl.LOCK_EX)
+                try:
+                    state_file.seek(0)
+                    try:
+                        state = json.loads(state_file.read())
+                    except json.JSONDecodeError:
+                        state = {**self.__initial, "updated_at": time.time()}
+                    yield state
+                    state_file.seek(0)
+                    state_file.truncate()
+                    state_file.write(json.dumps(state))
+                    state_file.flush()
+                finally:
+                    fcntl.flock(state_file, fcntl.LOCK_UN)
+
+
+_rate_limiters: Dict[str, RateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(
+    name: str, rate: float, capacity: Optional[float] = None, lock_path: Union[str, Path, None] = None
+) -> RateLimiter:
+    """
+    Функция получения общего для процесса ограничителя по имени (создается при первом обращении,
+    параметры rate, capacity и lock_path используются только при создании)
+    :param name: Имя ограничителя, например хост API
+    :param rate: Начальная скорость, запросов в секунду
+    :param capacity: Максимальное количество накопленных запросов (по умолчанию max(1, rate))
+    :param lock_path: Путь к файлу общего для процессов состояния (по умолчанию None)
+    :return: Экземпляр класса RateLimiter
+    """
+    with _rate_limiters_lock:
+        if name not in _rate_limiters:
+            _rate_limiters[name] = RateLimiter(rate, capacity=capacity, lock_path=lock_path)
+        return _rate_limiters[name]
@@ -0,0 +1,286 @@
+import json
+import sqlite3
+from itertools import islice
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union
+
+from src.interfaces import AbstractJobFiles
+from src.job_files import stable_key
+from src.vacancies import salary_average
+
+# Количество записей в одной транзакции вставки
+DEFAULT_BATCH_SIZE = 1000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS vacancies (
+    key TEXT PRIMARY KEY,
+    name TEXT NOT NULL DEFAULT '',
+    url TEXT NOT NULL DEFAULT '',
+    salary_from INTEGER NOT NULL DEFAULT 0,
+    salary_to INTEGER NOT NULL DEFAULT 0,
+    salary_average REAL NOT NULL DEFAULT 0,
+    experience TEXT NOT NULL DEFAULT '',
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_vacancies_salary_from ON vacancies (salary_from);
+CREATE INDEX IF NOT EXISTS idx_vacancies_salary_to ON vacancies (salary_to);
+CREATE INDEX IF NOT EXISTS idx_vacancies_salary_average ON vacancies (salary_average);
+"""
+
+COLUMNS = "(key, name, url, salary_from, salary_to, salary_average, experience, data) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+
+INSERT_SQL = f"INSERT OR IGNORE INTO vacancies {COLUMNS}"
+
+UPSERT_SQL = f"""
+INSERT INTO vacancies {COLUMNS}
+ON CONFLICT (key) DO UPDATE SET
+    name = excluded.name,
+    url = excluded.url,
+    salary_from = excluded.salary_from,
+    salary_to = excluded.salary_to,
+    salary_average = excluded.salary_average,
+    experience = excluded.experience,
+    data = excluded.data
+"""
+
+
+class SQLiteSaver(AbstractJobFiles):
+    """
+    Класс хранения вакансий в SQLite (для локального запуска без PostgreSQL).
+    Запись в режиме WAL, вставка пачками в транзакциях, индексы по зарплате "от", "до" и средней.
+    Фильтр по диапазону средней зарплаты и топ-'n' выполняются запросом SQL по индексу,
+    без загрузки всех вакансий в Python. Записи хранятся в формате Vacancy.to_dict, ключ - stable_key
+
+    Атрибуты:
+        db_path(Path): Путь к файлу базы данных
+        key_field(str): Поле ключа записи (по умолчанию "url")
+        batch_size(int): Количество записей в одной транзакции вставки (по умолчанию 1000)
+
+    Методы:
+        __init__(self, db_path: Union[str, Path], key_field: str = "url", batch_size: int = DEFAULT_BATCH_SIZE)
+        -> None:
+            Инициализация класса SQLiteSaver (создание таблицы и индексов)
+            :raise ValueError: Если batch_size меньше 1
+        __enter__(self) -> "SQLiteSaver":
+            Магический метод входа в контекстный менеджер
+        __exit__(self, exc_type, exc_value, traceback) -> None:
+            Магический метод выхода из контекстного менеджера (закрытие соединения)
+        read_data(self) -> List[Dict[str, Any]]:
+            Метод получения всех записей в порядке добавления
+        add_data(self, data: Dict[str, Any]) -> None:
+            Метод добавления записи (запись с уже сохраненным ключом не добавляется)
+        add_many(self, data: Iterable[Dict[str, Any]]) -> int:
+            Метод добавления многих записей пачками по batch_size в транзакциях
+        upsert(self, data: Dict[str, Any]) -> None:
+            Метод добавления записи или замены записи с тем же ключом
+        get(self, key: str) -> Optional[Dict[str, Any]]:
+            Метод получения записи по ключу
+        del_data(self, data: Dict[str, Any]) -> None:
+            Метод удаления записи по ключу
+            Если удаляемые данные не найдены, выводит в консоль 'Вакансия не найдена'
+        iter_by_salary(self, salary_min: int, salary_max: int) -> Iterator[Dict[str, Any]]:
+            Метод-генератор записей со средней зарплатой в диапазоне (запрос по индексу)
+        get_by_salary(self, salary_min: int, salary_max: int) -> List[Dict[str, Any]]:
+            Метод получения записей со средней зарплатой в диапазоне
+        get_top(self, top_n: int, salary_min: Optional[int] = None, salary_max: Optional[int] = None)
+        -> List[Dict[str, Any]]:
+            Метод получения топ-'n' записей по средней зарплате (ORDER BY ... LIMIT в SQL)
+            :raise ValueError: Если top_n отрицательное
+        close(self) -> None:
+            Метод закрытия соединения
+        __select(self, clause: str, params: Tuple[Any, ...] = ()) -> List[Dict[str, Any]]:
+            Приватный метод выборки записей
+        __key(self, data: Dict[str, Any]) -> str:
+            Приватный метод получения ключа записи
+        __row(self, data: Dict[str, Any]) -> Tuple[Any, ...]:
+            Приватный метод получения строки таблицы из записи (средняя зарплата - функция salary_average)
+    """
+
+    db_path: Path
+    key_field: str
+    batch_size: int
+
+    def __init__(
+        self, db_path: Union[str, Path], key_field: str = "url", batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> None:
+        """
+        Инициализация класса SQLiteSaver (создание таблицы и индексов)
+        :param db_path: Путь к файлу базы данных
+        :param key_field: Поле ключа записи (по умолчанию "url")
+        :param batch_size: Количество записей в одной транзакции вставки (по умолчанию 1000)
+        :raise ValueError: Если batch_size меньше 1
+        """
+        if batch_size < 1:
+            raise ValueError("Размер пачки должен быть положительным числом")
+        self.db_path = Path(db_path)
+        self.key_field = key_field
+        self.batch_size = batch_size
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.__connection = sqlite3.connect(self.db_path)
+        # WAL: чтение не блокируется записью, NORMAL - без fsync на каждую транзакцию (безопасно для WAL)
+        self.__connection.execute("PRAGMA journal_mode=WAL")
+        self.__connection.execute("PRAGMA synchronous=NORMAL")
+        with self.__connection:
+            self.__connection.executescript(SCHEMA)
+
+    def __enter__(self) -> "SQLiteSaver":
+        """Магический метод входа в контекстный менеджер"""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Магический метод выхода из контекстного менеджера (закрытие соединения)"""
+        self.close()
+
+    def read_data(self) -> List[Dict[str, Any]]:
+        """
+        Метод получения всех записей в порядке добавления
+        :return: Список словарей
+        """
+        return self.__select("ORDER BY rowid")
+
+    def add_data(self, data: Dict[str, Any]) -> None:
+        """
+        Метод добавления записи (запись с уже сохраненным ключом не добавляется)
+        :param data: Словарь с данными
+        """
+        self.add_many([data])
+
+    def add_many(self, data: Iterable[Dict[str, Any]]) -> int:
+        """
+        Метод добавления многих записей пачками по batch_size, каждая пачка - одна транзакция.
+        Записи с уже сохраненным ключом (и повторы внутри data) не добавляются
+        :param data: Итерируемый объект словарей с данными
+        :return: Количество добавленных записей
+        """
+        rows = map(self.__row, data)
+        before = self.__connection.total_changes
+        while True:
+            batch = list(islice(rows, self.batch_size))
+            if not batch:
+                break
+            with self.__connection:
+                self.__connection.executemany(INSERT_SQL, batch)
+        return self.__connection.total_changes - before
+
+    def upsert(self, data: Dict[str, Any]) -> None:
+        """
+        Метод добавления записи или замены записи с тем же ключом
+        :param data: Словарь с данными
+        """
+        with self.__connection:
+            self.__connection.execute(UPSERT_SQL, self.__row(data))
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Метод получения записи по ключу
+        :param key: Ключ записи (значение key_field, например ссылка на вакансию)
+        :return: Словарь записи или None, если записи нет
+        """
+        result = self.__select("WHERE key = ?", (key,))
+        return result[0] if result else None
+
+    def del_data(self, data: Dict[str, Any]) -> None:
+        """
+        Метод удаления записи по ключу
+        :param data: Словарь с данными (используется только его ключ)
+        Если удаляемые данные не найдены, выводит в консоль 'Вакансия не найдена'
+        """
+        with self.__connection:
+            cursor = self.__connection.execute("DELETE FROM vacancies WHERE key = ?", (self.__key(data),))
+        if cursor.rowcount == 0:
+            print("Вакансия не найдена")
+
+    def iter_by_salary(self, salary_min: int, salary_max: int) -> Iterator[Dict[str, Any]]:
+        """
+        Метод-генератор записей со средней зарплатой в диапазоне (как get_vacancies_by_salary),
+        строки читаются из курсора по мере обхода
+        :param salary_min: Минимальная необходимая зарплата
+        :param salary_max: Максимальная необходимая зарплата
+        :return: Итератор словарей записей
+        """
+        cursor = self.__connection.execute(
+            "SELECT data FROM vacancies WHERE salary_average BETWEEN ? AND ? ORDER BY rowid", (salary_min, salary_max)
+        )
+        for (data,) in cursor:
+            yield json.loads(data)
+
+    def get_by_salary(self, salary_min: int, salary_max: int) -> List[Dict[str, Any]]:
+        """
+        Метод получения записей со средней зарплатой в диапазоне (как get_vacancies_by_salary)
+        :param salary_min: Минимальная необходимая зарплата
+        :param salary_max: Максимальная необходимая зарплата
+        :return: Список словарей записей
+        """
+        return list(self.iter_by_salary(salary_min, salary_max))
+
+    def get_top(
+        self, top_n: int, salary_min: Optional[int] = None, salary_max: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Метод получения топ-'n' записей по средней зарплате (при равной - раньше добавленная выше,
+        как у get_top_vacancies). Сортировка и ограничение выполняются в SQL
+        :param top_n: Количество записей в топе
+        :param salary_min: Минимальная средняя зарплата (по умолчанию без ограничения)
+        :param salary_max: Максимальная средняя зарплата (по умолчанию без ограничения)
+        :return: Список не более top_n словарей записей по убыванию средней зарплаты
+        :raise ValueError: Если top_n отрицательное
+        """
+        if top_n < 0:
+            raise ValueError("Количество вакансий в топе не может быть отрицательным")
+        conditions = []
+        params: List[Any] = []
+        if salary_min is not None:
+            conditions.append("salary_average >= ?")
+            params.append(salary_min)
+        if salary_max is not None:
+            conditions.append("salary_average <= ?")
+            params.append(salary_max)
+        where = f"WHERE {' AND '.join(conditions)} " if conditions else ""
+        return self.__select(f"{where}ORDER BY salary_average DESC, rowid LIMIT ?", (*params, top_n))
+
+    def close(self) -> None:
+        """Метод закрытия соединения"""
+        self.__connection.close()
+
+    def __select(self, clause: str, params: Tuple[Any, ...] = ()) -> List[Dict[str, Any]]:
+        """
+        Выборка записей
+        :param clause: Условие и сортировка запроса, например "WHERE key = ?"
+        :param params: Параметры запроса
+        :return: Список словарей записей
+        """
+        cursor = self.__connection.execute(f"SELECT data FROM vacancies {clause}", params)
+        return [json.loads(data) for (data,) in cursor]
+
+    def __key(self, data: Dict[str, Any]) -> str:
+        """
+        Получение ключа записи
+        :param data: Словарь с данными
+        :return: Ключ записи (stable_key)
+        """
+        return stable_key(data, self.key_field)
+
+    def __row(self, data: Dict[str, Any]) -> Tuple[Any, ...]:
+        """
+        Получение строки таблицы из записи в формате Vacancy.to_dict
+        :param data: Словарь с данными
+        :return: Кортеж значений колонок (key, name, url, salary_from, salary_to, salary_average, experience, data)
+        """
+        salary_from = data.get("salary_from") or 0
+        salary_to = data.get("salary_to") or 0
+        return (
+            self.__key(data),
+            data.get("name") or "",
+            data.get("url") or "",
+            salary_from,
+            salary_to,
+            salary_average(salary_from, salary_to),
+            data.get("experience") or "",
+            json.dumps(data, ensure_ascii=False),
+        )
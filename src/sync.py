@@ -0,0 +1,136 @@
+import json
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from src.head_hunter_api import DATE_FORMAT, HeadHunterAPI
+from src.job_files import JSONSaver
+from src.twelve_data_api import CurrencyConversion
+from src.vacancies import Vacancy
+
+
+class IncrementalSync:
+    """
+    Класс инкрементальной загрузки вакансий по отметке даты публикации (watermark).
+    Для каждого запроса хранится JSON файл вакансий и дата публикации самой новой из них,
+    следующий запуск запрашивает у API только вакансии, опубликованные после этой даты.
+    Вакансии загружаются по интервалам дат (HeadHunterAPI.get_all_vacancies), поэтому отметка
+    не сдвигается за вакансии, не попавшие в ограничение HeadHunter в 2000 результатов
+
+    Атрибуты:
+        api(HeadHunterAPI): Клиент API HeadHunter
+        data_dir(Path): Папка хранения файлов вакансий и отметок
+        watermark_path(Path): Путь к файлу отметок (data_dir / "watermarks.json")
+        converter(CurrencyConversion): Конвертер валют для перевода зарплат в рубли (по умолчанию None)
+
+    Методы:
+        __init__(self, api: HeadHunterAPI, data_dir: Union[str, Path],
+        converter: Optional[CurrencyConversion] = None) -> None:
+            Инициализация класса IncrementalSync
+        store_path(self, keyword: str) -> Path:
+            Метод получения пути к файлу вакансий запроса
+        get_watermark(self, keyword: str) -> Optional[str]:
+            Метод получения отметки даты публикации запроса
+        sync(self, keyword: str) -> List[Vacancy]:
+            Метод загрузки новых вакансий и объединения с сохраненными
+        __read_watermarks(self) -> Dict[str, str]:
+            Приватный метод чтения файла отметок
+        __latest_published(vacancies: List[Dict[str, Any]], watermark: Optional[str]) -> Optional[str]:
+            Статический метод получения самой поздней даты публикации
+    """
+
+    api: HeadHunterAPI
+    data_dir: Path
+    watermark_path: Path
+    converter: Optional[CurrencyConversion]
+
+    def __init__(
+        self, api: HeadHunterAPI, data_dir: Union[str, Path], converter: Optional[CurrencyConversion] = None
+    ) -> None:
+        """
+        Инициализация класса IncrementalSync
+        :param api: Клиент API HeadHunter
+        :param data_dir: Папка хранения файлов вакансий и отметок
+        :param converter: Конвертер валют для перевода зарплат в рубли
+            (по умолчанию None - зарплата не в рублях не учитывается)
+        """
+        self.api = api
+        self.data_dir = Path(data_dir)
+        self.watermark_path = self.data_dir / "watermarks.json"
+        self.converter = converter
+
+    def store_path(self, keyword: str) -> Path:
+        """
+        Метод получения пути к файлу вакансий запроса
+        :param keyword: Ключевое слово
+        :return: Путь к JSON файлу вакансий, например data_dir / "vacancies_python_developer.json"
+        """
+        slug = re.sub(r"\W+", "_", keyword.strip().lower()).strip("_") or "empty"
+        return self.data_dir / f"vacancies_{slug}.json"
+
+    def get_watermark(self, keyword: str) -> Optional[str]:
+        """
+        Метод получения отметки даты публикации запроса
+        :param keyword: Ключевое слово
+        :return: Дата публикации самой новой сохраненной вакансии или None, если запрос еще не загружался
+        """
+        return self.__read_watermarks().get(keyword)
+
+    def sync(self, keyword: str) -> List[Vacancy]:
+        """
+        Метод загрузки новых вакансий и объединения с сохраненными.
+        Первый запуск загружает все вакансии (за 30 дней), следующие - только опубликованные не раньше отметки.
+        Запрос делится на интервалы дат, чтобы загрузить все найденные вакансии, а не первые 2000 по релевантности:
+        иначе отметка сдвинулась бы на самую новую из загруженных и более старые вакансии не загрузились бы никогда
+        :param keyword: Ключевое слово
+        :return: Список всех сохраненных вакансий запроса (старых и новых)
+        """
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        watermarks = self.__read_watermarks()
+        watermark = watermarks.get(keyword)
+        date_from = datetime.strptime(watermark, DATE_FORMAT) if watermark else None
+        new_data = self.api.get_all_vacancies(keyword, date_from=date_from)
+        json_saver = JSONSaver(self.store_path(keyword))
+        json_saver.add_many(vacancy.to_dict() for vacancy in Vacancy.cast_to_object_list(new_data, self.converter))
+
+        latest = self.__latest_published(new_data, watermark)
+        if latest is not None and latest != watermark:
+            watermarks[keyword] = latest
+            with open(self.watermark_path, "w", encoding="utf-8") as json_file:
+                json.dump(watermarks, json_file, indent=4, ensure_ascii=False)
+        return Vacancy.from_trusted_dicts(json_saver.read_data())
+
+    def __read_watermarks(self) -> Dict[str, str]:
+        """
+        Приватный метод чтения файла отметок
+        :return: Словарь {ключевое слово: дата публикации}, пустой если файла нет или он поврежден
+        """
+        try:
+            with open(self.watermark_path, "r", encoding="utf-8") as json_file:
+                data = json.load(json_file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    @staticmethod
+    def __latest_published(vacancies: List[Dict[str, Any]], watermark: Optional[str]) -> Optional[str]:
+        """
+        Получение самой поздней даты публикации среди вакансий и текущей отметки
+        :param vacancies: Список словарей вакансий API (ключ "published_at")
+        :param watermark: Текущая отметка
+        :return: Самая поздняя дата публикации в формате API или None
+        """
+        latest = watermark
+        latest_date = datetime.strptime(watermark, DATE_FORMAT) if watermark else None
+        for vacancy in vacancies:
+            published_at = vacancy.get("published_at")
+            if not published_at:
+                continue
+            try:
+                published_date = datetime.strptime(published_at, DATE_FORMAT)
+            except ValueError:
+                continue
+            if latest_date is None or published_date > latest_date:
+                latest, latest_date = published_at, published_date
+        return latest
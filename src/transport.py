@@ -0,0 +1,197 @@
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.interfaces import AbstractTransport
+from src.rate_limiter import RateLimiter, get_rate_limiter
+
+# Статусы ответа, при которых запрос повторяется
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Ограничения частоты запросов по умолчанию: хост -> (запросов в секунду, размер "всплеска")
+DEFAULT_RATE_LIMITS = {"api.hh.ru": (10.0, 10.0), "api.twelvedata.com": (8 / 60, 8.0)}
+
+
+class HttpTransport(AbstractTransport):
+    """
+    Класс HTTP транспорта с пулом соединений (keep-alive) и повторами запросов
+
+    Атрибуты:
+        pool_size(int): Размер пула соединений на один хост (по умолчанию 10)
+        max_retries(int): Количество повторов запроса (по умолчанию 3)
+        backoff_factor(float): Базовая задержка экспоненциальной паузы в секундах (по умолчанию 0.5)
+        backoff_max(float): Максимальная пауза между повторами в секундах (по умолчанию 30)
+        timeout(float): Таймаут запроса в секундах (по умолчанию 10)
+        rate_limiters(dict): Ограничители частоты запросов по хостам (по умолчанию нет)
+
+    Методы:
+        __init__(self, pool_size: int = 10, max_retries: int = 3, backoff_factor: float = 0.5,
+        backoff_max: float = 30.0, timeout: float = 10.0, rate_limiters: Optional[Dict[str, RateLimiter]] = None)
+        -> None:
+            Инициализация класса HttpTransport
+            :raise ValueError: Если параметры отрицательные или размер пула меньше 1
+        get(self, url: str, headers: Optional[Dict[str, str]] = None, params: Optional[Dict[str, Any]] = None)
+        -> requests.Response:
+            Метод выполнения GET запроса с повторами при ошибках соединения и статусах 429/5xx
+            (ответ с Retry-After больше backoff_max возвращается без повтора)
+        set_rate_limiter(self, host: str, rate_limiter: Optional[RateLimiter]) -> None:
+            Метод установки (или снятия при None) ограничителя частоты запросов для хоста
+        close(self) -> None:
+            Метод закрытия пула соединений
+        backoff(self, attempt: int) -> float:
+            Метод расчета паузы перед повтором (экспоненциальная с "полным" jitter)
+        retry_after(response: requests.Response) -> Optional[float]:
+            Статический метод получения паузы из заголовка Retry-After
+    """
+
+    pool_size: int
+    max_retries: int
+    backoff_factor: float
+    backoff_max: float
+    timeout: float
+    rate_limiters: Dict[str, RateLimiter]
+
+    def __init__(
+        self,
+        pool_size: int = 10,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        backoff_max: float = 30.0,
+        timeout: float = 10.0,
+        rate_limiters: Optional[Dict[str, RateLimiter]] = None,
+    ) -> None:
+        """
+        Инициализация класса HttpTransport
+        :param pool_size: Размер пула соединений на один хост (по умолчанию 10)
+        :param max_retries: Количество повторов запроса (по умолчанию 3)
+        :param backoff_factor: Базовая задержка экспоненциальной паузы в секундах (по умолчанию 0.5)
+        :param backoff_max: Максимальная пауза между повторами в секундах (по умолчанию 30)
+        :param timeout: Таймаут запроса в секундах (по умолчанию 10)
+        :param rate_limiters: Ограничители частоты запросов по хостам (по умолчанию нет)
+        :raise ValueError: Если параметры отрицательные или размер пула меньше 1
+        """
+        if pool_size < 1:
+            raise ValueError("Размер пула соединений должен быть положительным числом")
+        if max_retries < 0 or backoff_factor < 0 or backoff_max < 0 or timeout <= 0:
+            raise ValueError("Параметры повторов и таймаут не могут быть отрицательными")
+        self.pool_size = pool_size
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.timeout = timeout
+        self.rate_limiters = dict(rate_limiters or {})
+        self.__session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.__session.mount("https://", adapter)
+        self.__session.mount("http://", adapter)
+
+    def get(
+        self, url: str, headers: Optional[Dict[str, str]] = None, params: Optional[Dict[str, Any]] = None
+    ) -> requests.Response:
+        """
+        Метод выполнения GET запроса с повторами при ошибках соединения и статусах 429/5xx.
+        Если сервер просит в Retry-After подождать дольше backoff_max, ответ возвращается без повтора,
+        чтобы не блокировать поток на время, заданное сервером
+        :param url: Адрес запроса
+        :param headers: Заголовки запроса
+        :param params: Параметры запроса
+        :return: Ответ сервера (после исчерпания повторов или при долгом Retry-After - последний полученный ответ)
+        :raise requests.ConnectionError: Ошибка соединения после исчерпания повторов
+        :raise requests.Timeout: Превышен таймаут после исчерпания повторов
+        """
+        rate_limiter = self.rate_limiters.get(urlparse(url).hostname or "")
+        attempt = 0
+        while True:
+            if rate_limiter is not None:
+                rate_limiter.acquire()
+            try:
+                response = self.__session.get(url, headers=headers, params=params, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt >= self.max_retries:
+                    raise
+                delay = self.backoff(attempt)
+            else:
+                if rate_limiter is not None:
+                    if response.status_code == 429:
+                        rate_limiter.on_throttle()
+                    elif response.status_code < 500:
+                        rate_limiter.on_success()
+                if response.status_code not in RETRY_STATUSES or attempt >= self.max_retries:
+                    return response
+                retry_after = self.retry_after(response)
+                if retry_after is not None and retry_after > self.backoff_max:
+                    return response
+                delay = self.backoff(attempt) if retry_after is None else retry_after
+            time.sleep(delay)
+            attempt += 1
+
+    def set_rate_limiter(self, host: str, rate_limiter: Optional[RateLimiter]) -> None:
+        """
+        Метод установки (или снятия при None) ограничителя частоты запросов для хоста
+        :param host: Хост API, например "api.hh.ru"
+        :param rate_limiter: Ограничитель частоты запросов
+        """
+        if rate_limiter is None:
+            self.rate_limiters.pop(host, None)
+        else:
+            self.rate_limiters[host] = rate_limiter
+
+    def close(self) -> None:
+        """Метод закрытия пула соединений"""
+        self.__session.close()
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Метод расчета паузы перед повтором (экспоненциальная с "полным" jitter)
+        :param attempt: Номер повтора, начиная с 0
+        :return: Пауза в секундах
+        """
+        return random.uniform(0, min(self.backoff_max, self.backoff_factor * 2**attempt))
+
+    @staticmethod
+    def retry_after(response: requests.Response) -> Optional[float]:
+        """
+        Получение паузы из заголовка Retry-After (секунды или HTTP-дата)
+        :param response: Ответ сервера
+        :return: Пауза в секундах или None, если заголовок отсутствует или не распознан
+        """
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_date = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_date.tzinfo is None:
+            retry_date = retry_date.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_date - datetime.now(timezone.utc)).total_seconds())
+
+
+_default_transport: Optional[HttpTransport] = None
+_default_lock = threading.Lock()
+
+
+def get_default_transport() -> HttpTransport:
+    """
+    Функция получения общего для процесса HTTP транспорта.
+    Для хостов HeadHunter и TwelveData подключены общие для процесса ограничители частоты запросов
+    :return: Экземпляр класса HttpTransport
+    """
+    global _default_transport
+    with _default_lock:
+        if _default_transport is None:
+            rate_limiters = {
+                host: get_rate_limiter(host, rate, capacity) for host, (rate, capacity) in DEFAULT_RATE_LIMITS.items()
+            }
+            _default_transport = HttpTransport(rate_limiters=rate_limiters)
+        return _default_transport
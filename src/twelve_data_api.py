@@ -1,9 +1,11 @@
-from typing import Any, Dict, Union
-
-import requests
+from typing import Any, Dict, Iterable, Optional, Union
 
 from src.exceptions import APIError
-from src.interfaces import AbsTwelveDataApi
+from src.interfaces import AbsTwelveDataApi, AbstractTransport
+from src.transport import get_default_transport
+
+# Коды валют HeadHunter, отличающиеся от ISO 4217 (коды TwelveData)
+HH_CURRENCY_CODES = {"RUR": "RUB", "BYR": "BYN"}
 
 
 class TwelveDataApiExchangeRate(AbsTwelveDataApi):
@@ -12,9 +14,10 @@ class TwelveDataApiExchangeRate(AbsTwelveDataApi):
 
     Атрибуты:
         __api_key(str) Ключ для API
+        transport(AbstractTransport): HTTP транспорт (по умолчанию общий для процесса HttpTransport)
 
     Методы:
-        __init__(self, __api_key: str) -> None:
+        __init__(self, __api_key: str, transport: Optional[AbstractTransport] = None) -> None:
             Инициализация класс TwelveData
             :raise ValueError: Если ключ пустой
         connect(self) -> Dict[str, Any]:
@@ -31,15 +34,17 @@ class TwelveDataApiExchangeRate(AbsTwelveDataApi):
 
     __api_key: str
 
-    def __init__(self, __api_key: str) -> None:
+    def __init__(self, __api_key: str, transport: Optional[AbstractTransport] = None) -> None:
         """
         Инициализация класс TwelveData
         :param __api_key: Ключ для API
+        :param transport: HTTP транспорт (по умолчанию общий для процесса HttpTransport)
         :raise ValueError: Если ключ пустой
         """
         if not __api_key:
             raise ValueError("Ключ не может быть пустым")
         self.__api_key = __api_key
+        self.transport = transport if transport is not None else get_default_transport()
         self.__currency_from = "RUB"
         self.__currency_to = "RUB"
 
@@ -59,7 +64,7 @@ class TwelveDataApiExchangeRate(AbsTwelveDataApi):
             f"{self.__currency_to}&apikey={self.__api_key}"
         )
 
-        response = requests.get(self.__url)
+        response = self.transport.get(self.__url)
         if response.status_code != 200:
             error_message = f"Ошибка API: {response.status_code} - {response.text}"
             raise APIError(error_message)
@@ -101,6 +106,8 @@ class CurrencyConversion:
             Инициализация класс CurrencyConversion
         conversion_in_rub(self, currency: str, amount: int) -> float:
             Метод конвертации валюты в рубли
+        get_rates_in_rub(self, currencies: Iterable[str]) -> Dict[str, float]:
+            Метод получения курсов к рублю для набора валют (каждый курс запрашивается один раз)
     """
 
     api_client: TwelveDataApiExchangeRate
@@ -108,6 +115,7 @@ class CurrencyConversion:
     def __init__(self, api_client: TwelveDataApiExchangeRate) -> None:
         """Инициализация класс CurrencyConversion"""
         self.api_client = api_client
+        self.__rates: Dict[str, float] = {}
 
     def conversion_in_rub(self, currency_from: str, currency_to: str, amount: int) -> float:
         """
@@ -120,3 +128,25 @@ class CurrencyConversion:
         currency_price = self.api_client.get_rate(currency_from, currency_to)
         result = round(amount * currency_price, 2)
         return result
+
+    def get_rates_in_rub(self, currencies: Iterable[str]) -> Dict[str, float]:
+        """
+        Метод получения курсов к рублю для набора валют. Повторяющиеся валюты запрашиваются один раз,
+        полученные курсы кэшируются в экземпляре. Коды HeadHunter (RUR, BYR) переводятся в ISO 4217
+        :param currencies: Коды валют, например ["USD", "EUR", "USD", "RUR"]
+        :return: Словарь {код валюты: курс к рублю}, валюты без курса в API в словарь не попадают
+        :raise APIError: Ошибка запроса API
+        """
+        rates = {}
+        for currency in set(currencies):
+            if currency not in self.__rates:
+                code = HH_CURRENCY_CODES.get(currency, currency)
+                if code == "RUB":
+                    self.__rates[currency] = 1.0
+                else:
+                    try:
+                        self.__rates[currency] = float(self.api_client.get_rate(code, "RUB"))
+                    except (TypeError, ValueError):
+                        continue
+            rates[currency] = self.__rates[currency]
+        return rates
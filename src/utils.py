@@ -1,8 +1,9 @@
 import re
 from pathlib import Path
-from typing import List, Tuple, Union
+from typing import Iterable, Iterator, List, Tuple, Union
 
 from src.job_files import JSONSaver
+from src.ranking import rank_top
 from src.vacancies import Vacancy
 
 
@@ -50,50 +51,56 @@ def user_response_salary_range(numb_attempts: int = 5) -> Tuple[int, int]:
     return 0, 0
 
 
-def get_vacancies_by_salary(vacancies: List[Vacancy], salary_min: int, salary_max: int) -> List[Vacancy]:
+def get_vacancies_by_salary(vacancies: Iterable[Vacancy], salary_min: int, salary_max: int) -> List[Vacancy]:
     """
     Функция получение зарплаты в указанном диапазоне
-    :param vacancies: Список экземпляров класса Vacancy
+    :param vacancies: Итерируемый объект экземпляров класса Vacancy (в том числе LazyVacancy)
     :param salary_min: Минимальная необходимая зарплата
     :param salary_max: Максимальная необходимая зарплата
     :return: Отфильтрованный список по зарплате
     """
-    result = []
+    return list(iter_vacancies_by_salary(vacancies, salary_min, salary_max))
+
+
+def iter_vacancies_by_salary(vacancies: Iterable[Vacancy], salary_min: int, salary_max: int) -> Iterator[Vacancy]:
+    """
+    Функция-генератор фильтрации вакансий по зарплате без накопления списка
+    :param vacancies: Итерируемый объект экземпляров класса Vacancy
+    :param salary_min: Минимальная необходимая зарплата
+    :param salary_max: Максимальная необходимая зарплата
+    :return: Итератор вакансий, входящих в диапазон
+    """
     for vacancy in vacancies:
         if salary_min <= vacancy.salary_average() <= salary_max:
-            result.append(vacancy)
-    return result
+            yield vacancy
 
 
-def get_top_vacancies(vacancies: List[Vacancy], top_n: int) -> List[Vacancy]:
+def get_top_vacancies(vacancies: Iterable[Vacancy], top_n: int, strict: bool = True) -> List[Vacancy]:
     """
-    Функция получения топ-'n' вакансий из списка
-    :param vacancies: Список экземпляров класса Vacancy
+    Функция получения топ-'n' вакансий по средней зарплате
+    (частичный выбор через ограниченную кучу, без полной сортировки списка)
+    :param vacancies: Список (или итератор) экземпляров класса Vacancy
     :param top_n: Количество в списке
+    :param strict: Требовать ровно top_n вакансий (по умолчанию True), иначе вернуть сколько есть
     :return: Список согласно топ N
-    :raise ValueError: Если в списке меньше позиций, чем необходимо
+    :raise ValueError: Если strict и в списке меньше позиций, чем необходимо
     """
-    sorted_vacancies = sorted(vacancies, reverse=True)
-    if len(vacancies) < top_n:
-        raise ValueError("В списке вакансий меньше чем необходимо")
-    return sorted_vacancies[:top_n]
+    return rank_top(vacancies, top_n, strict=strict)
 
 
-def print_vacancies(vacancies: List[Vacancy]) -> None:
+def print_vacancies(vacancies: Iterable[Vacancy]) -> None:
     """
     Функция вывода в консоль вакансий
-    :param vacancies: Список экземпляров класса Vacancy
+    :param vacancies: Список (или итератор) экземпляров класса Vacancy
     """
     for vacancy in vacancies:
         print(vacancy)
 
 
-def safe_json(vacancies: List[Vacancy], file_path: Union[str, Path]) -> None:
+def safe_json(vacancies: Iterable[Vacancy], file_path: Union[str, Path]) -> None:
     """
-    Функция записи экземпляров класса в JSON файл
-    :param vacancies: Список экземпляров класса Vacancy
+    Функция записи экземпляров класса в JSON файл (файл читается и записывается один раз, без повторов)
+    :param vacancies: Список (или итератор) экземпляров класса Vacancy
     :param file_path: Путь к файлу
     """
-    json_saver = JSONSaver(file_path)
-    for vacancy in vacancies:
-        json_saver.add_data(vacancy.to_dict())
+    JSONSaver(file_path).add_many(vacancy.to_dict() for vacancy in vacancies)
@@ -1,7 +1,37 @@
-from typing import Any, Dict, List, Optional, Union
+import sys
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
+from src.json_codec import loads
+from src.settings import VALIDATE_TRUSTED_DATA
+from src.twelve_data_api import CurrencyConversion
 from src.validates import Valid, ValidVacancy
 
+# Валидатор без состояния, общий для всех вакансий (не создается заново для каждого объекта)
+_validator = ValidVacancy()
+
+
+def salary_average(salary_from: Optional[int], salary_to: Optional[int]) -> Union[int, float]:
+    """
+    Функция расчета средней зарплаты - единое правило для Vacancy, VacancyFrame и SQLiteSaver
+    :param salary_from: Зарплата "от" (None или 0 - не указана)
+    :param salary_to: Зарплата "до" (None или 0 - не указана)
+    :return: Среднее "от" и "до", если указаны обе, иначе указанная зарплата, без зарплаты - 0
+    """
+    # Есть от и до, то берем среднее
+    if salary_to and salary_from:
+        return (salary_to + salary_from) / 2
+    # Если есть только до или только от
+    return salary_to or salary_from or 0
+
+
+def foreign_currencies(currencies: Iterable[Optional[str]]) -> Set[str]:
+    """
+    Функция отбора валют, для которых нужен курс к рублю - единое правило для Vacancy и cast_to_object_list_parallel
+    :param currencies: Коды валют HeadHunter (могут быть пустыми или None)
+    :return: Множество кодов валют без рубля ("RUR"), пустых строк и None
+    """
+    return {currency for currency in currencies if currency and currency != "RUR"}
+
 
 class Vacancy:
     """
@@ -13,10 +43,14 @@ class Vacancy:
         salary_from(int): Зарплата "от" (по умолчанию None)
         salary_to(int): Зарплата "до" (по умолчанию None)
         experience(str): Требуемый опыт (по умолчанию "")
+        currency(str): Исходная валюта зарплаты в кодах HeadHunter (по умолчанию "RUR")
+        salary_from_original(int): Зарплата "от" в исходной валюте (по умолчанию равна salary_from)
+        salary_to_original(int): Зарплата "до" в исходной валюте (по умолчанию равна salary_to)
 
     Методы:
         __init__(self, name: str, url: str, salary_from: Optional[int] = None, salary_to: Optional[int] = None,
-        experience: str = "") -> None:
+        experience: str = "", validate: Optional[Valid] = None, currency: str = "RUR",
+        salary_from_original: Optional[int] = None, salary_to_original: Optional[int] = None) -> None:
             Инициализация класса Vacancy
         __str__(self) -> str:
             Магический метод, строковое отображение класса. Формат:
@@ -35,10 +69,39 @@ class Vacancy:
             :raise TypeError: Не является классом Vacancy
         salary_average(self) -> Union[int, float]:
             Метод расчета средней зарплаты
-        created_vacancy(cls, vacancy_data: Dict[Any, Any]) -> "Vacancy":
+        created_vacancy(cls, vacancy_data: Dict[Any, Any], converter: Optional[CurrencyConversion] = None)
+        -> "Vacancy":
             Классовый метод создание экземпляра класса из словаря.
-        cast_to_object_list(cls, vacancy_data: List[Dict[Any, Any]]) -> List["Vacancy"]:
-            Классовый метод создание списка экземпляров класса из списка словарей
+        cast_to_object_list(cls, vacancy_data: List[Dict[Any, Any]], converter: Optional[CurrencyConversion] = None)
+        -> List["Vacancy"]:
+            Классовый метод создание списка экземпляров класса из списка словарей (пакетная валидация)
+        cast_with_rates(cls, vacancy_data: Iterable[Dict[Any, Any]], rates: Optional[Dict[str, float]])
+        -> List["Vacancy"]:
+            Классовый метод создания списка экземпляров класса с уже полученными курсами валют
+        cast_to_object_iter(cls, vacancy_data: Iterable[Dict[Any, Any]],
+        converter: Optional[CurrencyConversion] = None) -> Iterator["Vacancy"]:
+            Классовый метод-генератор создания экземпляров класса по мере поступления словарей
+        cast_from_bytes(cls, body: Union[bytes, str], converter: Optional[CurrencyConversion] = None)
+        -> List["Vacancy"]:
+            Классовый метод создания списка экземпляров класса напрямую из тела ответа API
+            :raise ValueError: Если тело ответа не является корректным JSON
+        from_trusted_dicts(cls, vacancy_data: Iterable[Dict[str, Any]], validate: Optional[bool] = None)
+        -> List["Vacancy"]:
+            Классовый метод создания экземпляров из уже проверенных словарей (формат to_dict) без валидации
+        __cast_batch(cls, rows: Iterable[Tuple[Any, Any, Any, Any, str, str]],
+        rates: Optional[Dict[str, float]] = None) -> List["Vacancy"]:
+            Приватный классовый метод создания экземпляров с валидацией всех вакансий одним вызовом validate_many
+        __from_valid(cls, name: str, url: str, salary_from: int, salary_to: int, experience: str,
+        currency: str = "RUR", salary_from_original: Optional[int] = None, salary_to_original: Optional[int] = None)
+        -> "Vacancy":
+            Приватный классовый метод создания экземпляра из уже проверенных данных, без повторной валидации
+        __extract_fields(vacancy_data: Dict[Any, Any]) -> Tuple[str, str, Any, Any, str, str]:
+            Статический метод извлечения полей вакансии из словаря API
+        __rates_for(converter: Optional[CurrencyConversion], currencies: Iterable[str])
+        -> Optional[Dict[str, float]]:
+            Статический метод получения курсов к рублю для валют вакансий
+        __to_rub(salary: Any, currency: str, rates: Optional[Dict[str, float]]) -> Any:
+            Статический метод перевода зарплаты в рубли
         __valid_class(other: "Vacancy") -> "Vacancy":
             Статический метод, проверка корректности экземпляра класса
             :raise TypeError: Не является классом Vacancy
@@ -49,7 +112,19 @@ class Vacancy:
     salary_from: Optional[int]
     salary_to: Optional[int]
     experience: str
-    __slots__ = ("name", "url", "salary_from", "salary_to", "experience")
+    currency: str
+    salary_from_original: Optional[int]
+    salary_to_original: Optional[int]
+    __slots__ = (
+        "name",
+        "url",
+        "salary_from",
+        "salary_to",
+        "experience",
+        "currency",
+        "salary_from_original",
+        "salary_to_original",
+    )
 
     def __init__(
         self,
@@ -59,16 +134,22 @@ class Vacancy:
         salary_to: Optional[int] = None,
         experience: str = "",
         validate: Optional[Valid] = None,
+        currency: str = "RUR",
+        salary_from_original: Optional[int] = None,
+        salary_to_original: Optional[int] = None,
     ) -> None:
         """Инициализация класса Vacancy"""
         if validate is None:
-            validate = ValidVacancy()
+            validate = _validator
         validate_data = validate.validate_vacancy_to_dict(name, url, salary_from, salary_to)
         self.name = validate_data["name"]
         self.url = validate_data["url"]
         self.salary_from = validate_data["salary_from"]
         self.salary_to = validate_data["salary_to"]
         self.experience = experience
+        self.currency = currency
+        self.salary_from_original = self.salary_from if salary_from_original is None else salary_from_original
+        self.salary_to_original = self.salary_to if salary_to_original is None else salary_to_original
 
     def __str__(self) -> str:
         """Строковое отображение класса"""
@@ -138,56 +219,253 @@ class Vacancy:
         }
 
     def salary_average(self) -> Union[int, float]:
-        """Метод расчета средней зарплаты"""
-        # Есть от и до, то берем среднее
-        if self.salary_to and self.salary_from:
-            return (self.salary_to + self.salary_from) / 2
-        # Если есть только до
-        elif self.salary_to:
-            return self.salary_to
-        # Если есть только от
-        elif self.salary_from:
-            return self.salary_from
-        else:
-            return 0
+        """Метод расчета средней зарплаты (функция salary_average)"""
+        return salary_average(self.salary_from, self.salary_to)
 
     @classmethod
-    def created_vacancy(cls, vacancy_data: Dict[Any, Any]) -> "Vacancy":
+    def created_vacancy(
+        cls, vacancy_data: Dict[Any, Any], converter: Optional[CurrencyConversion] = None
+    ) -> "Vacancy":
         """
         Классовый метод создание экземпляра класса из словаря
         :param vacancy_data: Словарь с параметрами вакансии
-            Ожидаемые ключи: name, url, salary: from, to, experience: name
+            Ожидаемые ключи: name, url, salary: from, to, currency, experience: name
+        :param converter: Конвертер валют для перевода зарплаты в рубли
+            (по умолчанию None - зарплата не в рублях не учитывается)
         :return: Экземпляр класса Vacancy
         """
-        name = vacancy_data.get("name", "")
-        url = vacancy_data.get("alternate_url", "")
+        name, url, salary_from, salary_to, experience_name, currency = cls.__extract_fields(vacancy_data)
+        rates = cls.__rates_for(converter, (currency,))
+        return cls(
+            name=name,
+            url=url,
+            salary_from=cls.__to_rub(salary_from, currency, rates),
+            salary_to=cls.__to_rub(salary_to, currency, rates),
+            experience=experience_name,
+            currency=currency,
+            salary_from_original=salary_from or 0,
+            salary_to_original=salary_to or 0,
+        )
+
+    @classmethod
+    def cast_to_object_list(
+        cls, vacancy_data: List[Dict[Any, Any]], converter: Optional[CurrencyConversion] = None
+    ) -> List["Vacancy"]:
+        """
+        Классовый метод создание списка экземпляров класса из списка словарей.
+        Данные всех вакансий проверяются одним вызовом ValidVacancy.validate_many.
+        С конвертером курс каждой встреченной валюты запрашивается один раз на весь список
+        :param vacancy_data: Список словарей с параметрами вакансии
+        :param converter: Конвертер валют для перевода зарплаты в рубли
+            (по умолчанию None - зарплата не в рублях не учитывается)
+        :return: Список экземпляров класса Vacancy
+        """
+        rows = [cls.__extract_fields(vacancy) for vacancy in vacancy_data]
+        return cls.__cast_batch(rows, cls.__rates_for(converter, {row[5] for row in rows}))
+
+    @classmethod
+    def cast_with_rates(
+        cls, vacancy_data: Iterable[Dict[Any, Any]], rates: Optional[Dict[str, float]]
+    ) -> List["Vacancy"]:
+        """
+        Классовый метод создания списка экземпляров класса с уже полученными курсами валют
+        (например, в дочерних процессах src.parallel, где конвертер недоступен)
+        :param vacancy_data: Итерируемый объект словарей вакансий API
+        :param rates: Курсы валют к рублю (CurrencyConversion.get_rates_in_rub) или None
+        :return: Список экземпляров класса Vacancy
+        """
+        return cls.__cast_batch(map(cls.__extract_fields, vacancy_data), rates)
+
+    @classmethod
+    def cast_to_object_iter(
+        cls, vacancy_data: Iterable[Dict[Any, Any]], converter: Optional[CurrencyConversion] = None
+    ) -> Iterator["Vacancy"]:
+        """
+        Классовый метод-генератор создания экземпляров класса по мере поступления словарей
+        :param vacancy_data: Итерируемый объект словарей вакансий (например, HeadHunterAPI.iter_vacancies)
+        :param converter: Конвертер валют для перевода зарплаты в рубли (курсы кэшируются в конвертере)
+        :return: Итератор экземпляров класса Vacancy
+        """
+        for vacancy in vacancy_data:
+            yield cls.created_vacancy(vacancy, converter)
+
+    @classmethod
+    def cast_from_bytes(
+        cls, body: Union[bytes, str], converter: Optional[CurrencyConversion] = None
+    ) -> List["Vacancy"]:
+        """
+        Классовый метод создания списка экземпляров класса напрямую из тела ответа API.
+        Байты разбираются быстрым декодером (orjson, если установлен), из каждой вакансии
+        извлекаются только нужные поля, без промежуточных копий словарей
+        :param body: Тело ответа API (страница с ключом "items") или JSON список вакансий
+        :param converter: Конвертер валют для перевода зарплаты в рубли
+            (по умолчанию None - зарплата не в рублях не учитывается)
+        :return: Список экземпляров класса Vacancy
+        :raise ValueError: Если тело ответа не является корректным JSON
+        """
+        data = loads(body)
+        items = data.get("items", []) if isinstance(data, dict) else data
+        return cls.cast_to_object_list(items, converter)
+
+    @classmethod
+    def from_trusted_dicts(
+        cls, vacancy_data: Iterable[Dict[str, Any]], validate: Optional[bool] = None
+    ) -> List["Vacancy"]:
+        """
+        Классовый метод создания экземпляров из уже проверенных словарей (формат to_dict),
+        например прочитанных JSONSaver.read_data. Атрибуты заполняются напрямую, без ValidVacancy
+        :param vacancy_data: Итерируемый объект словарей вакансий в формате to_dict
+        :param validate: Проверить данные (по умолчанию берется из настройки VALIDATE_TRUSTED_DATA)
+        :return: Список экземпляров класса Vacancy
+        :raise TypeError, ValueError: Если validate и данные не проходят проверку
+        """
+        if validate is None:
+            validate = VALIDATE_TRUSTED_DATA
+        rows = (
+            (data["name"], data["url"], data.get("salary_from"), data.get("salary_to"), data.get("experience", ""))
+            for data in vacancy_data
+        )
+        if validate:
+            # В to_dict 0 означает "не указана", для проверки это None (иначе "до" 0 меньше "от")
+            return cls.__cast_batch(
+                (name, url, salary_from or None, salary_to or None, experience, "RUR")
+                for name, url, salary_from, salary_to, experience in rows
+            )
+        from_valid = cls.__from_valid
+        return [
+            from_valid(name, url, salary_from or 0, salary_to or 0, experience)
+            for name, url, salary_from, salary_to, experience in rows
+        ]
+
+    @classmethod
+    def __cast_batch(
+        cls, rows: Iterable[Tuple[Any, Any, Any, Any, str, str]], rates: Optional[Dict[str, float]] = None
+    ) -> List["Vacancy"]:
+        """
+        Создание экземпляров класса с валидацией всех вакансий одним вызовом validate_many.
+        Зарплаты переводятся в рубли одним проходом по колонкам до проверки
+        :param rows: Итерируемый объект кортежей (name, url, salary_from, salary_to, experience, currency)
+        :param rates: Курсы валют к рублю (по умолчанию None - учитывается только зарплата в рублях)
+        :return: Список экземпляров класса Vacancy
+        """
+        rows = list(rows)
+        if not rows:
+            return []
+        names, urls, salaries_from, salaries_to, experiences, currencies = zip(*rows)
+        to_rub = cls.__to_rub
+        rub_from = [to_rub(salary, currency, rates) for salary, currency in zip(salaries_from, currencies)]
+        rub_to = [to_rub(salary, currency, rates) for salary, currency in zip(salaries_to, currencies)]
+        valid = _validator.validate_many(names, urls, rub_from, rub_to)
+        from_valid = cls.__from_valid
+        return [
+            from_valid(name, url, salary_from, salary_to, experience, currency, original_from or 0, original_to or 0)
+            for name, url, salary_from, salary_to, experience, currency, original_from, original_to in zip(
+                valid["name"],
+                valid["url"],
+                valid["salary_from"],
+                valid["salary_to"],
+                experiences,
+                currencies,
+                salaries_from,
+                salaries_to,
+            )
+        ]
+
+    @classmethod
+    def __from_valid(
+        cls,
+        name: str,
+        url: str,
+        salary_from: int,
+        salary_to: int,
+        experience: str,
+        currency: str = "RUR",
+        salary_from_original: Optional[int] = None,
+        salary_to_original: Optional[int] = None,
+    ) -> "Vacancy":
+        """
+        Создание экземпляра класса из уже проверенных данных, без повторной валидации
+        :param name: Название вакансии
+        :param url: Ссылка на вакансию
+        :param salary_from: Зарплата "от" в рублях
+        :param salary_to: Зарплата "до" в рублях
+        :param experience: Требуемый опыт
+        :param currency: Исходная валюта зарплаты (по умолчанию "RUR")
+        :param salary_from_original: Зарплата "от" в исходной валюте (по умолчанию равна salary_from)
+        :param salary_to_original: Зарплата "до" в исходной валюте (по умолчанию равна salary_to)
+        :return: Экземпляр класса Vacancy
+        """
+        vacancy = cls.__new__(cls)
+        vacancy.name = name
+        vacancy.url = url
+        vacancy.salary_from = salary_from
+        vacancy.salary_to = salary_to
+        vacancy.experience = experience
+        vacancy.currency = currency
+        vacancy.salary_from_original = salary_from if salary_from_original is None else salary_from_original
+        vacancy.salary_to_original = salary_to if salary_to_original is None else salary_to_original
+        return vacancy
+
+    @staticmethod
+    def __rates_for(
+        converter: Optional[CurrencyConversion], currencies: Iterable[str]
+    ) -> Optional[Dict[str, float]]:
+        """
+        Получение курсов к рублю для валют вакансий (рубль и пустая валюта в конвертер не запрашиваются)
+        :param converter: Конвертер валют или None
+        :param currencies: Коды валют вакансий
+        :return: Словарь {код валюты: курс к рублю} или None, если конвертер не указан
+        """
+        if converter is None:
+            return None
+        return converter.get_rates_in_rub(foreign_currencies(currencies))
 
+    @staticmethod
+    def __to_rub(salary: Any, currency: str, rates: Optional[Dict[str, float]]) -> Any:
+        """
+        Перевод зарплаты в рубли
+        :param salary: Зарплата в исходной валюте
+        :param currency: Код валюты HeadHunter
+        :param rates: Курсы валют к рублю или None
+        :return: Зарплата в рублях (округляется до целого), None - если курса валюты нет,
+            нечисловое значение возвращается как есть для проверки валидатором
+        """
+        if currency == "RUR":
+            return salary
+        rate = rates.get(currency) if rates is not None else None
+        if rate is None:
+            return None
+        if isinstance(salary, bool) or not isinstance(salary, (int, float)):
+            return salary
+        return round(salary * rate)
+
+    @staticmethod
+    def __extract_fields(vacancy_data: Dict[Any, Any]) -> Tuple[str, str, Any, Any, str, str]:
+        """
+        Извлечение полей вакансии из словаря API (зарплата в исходной валюте)
+        :param vacancy_data: Словарь вакансии.
+            Ожидаемые ключи: name, alternate_url, salary: from, to, currency, experience: name
+        :return: Кортеж (name, url, salary_from, salary_to, experience, currency),
+            без зарплаты - (..., None, None, experience, "RUR"), без кода валюты currency - ""
+        """
         salary_info = vacancy_data.get("salary", {})
-        if salary_info is not None and salary_info.get("currency") == "RUR":
+        if salary_info is not None:
             salary_from = salary_info.get("from", 0)
             salary_to = salary_info.get("to", 0)
+            currency = salary_info.get("currency") or ""
         else:
             salary_from = None
             salary_to = None
+            currency = "RUR"
         experience_info = vacancy_data.get("experience", {})
         if experience_info is not None:
-            experience_name = experience_info.get("name", "")
+            # Значений опыта всего несколько, поэтому одинаковые строки хранятся один раз
+            experience_name = sys.intern(experience_info.get("name", ""))
         else:
             experience_name = ""
-
-        return cls(name=name, url=url, salary_from=salary_from, salary_to=salary_to, experience=experience_name)
-
-    @classmethod
-    def cast_to_object_list(cls, vacancy_data: List[Dict[Any, Any]]) -> List["Vacancy"]:
-        """
-        Классовый метод создание списка экземпляров класса из списка словарей
-        :param vacancy_data: Список словарей с параметрами вакансии
-        :return: Список экземпляров класса Vacancy
-        """
-        result = []
-        for vacancy in vacancy_data:
-            result.append(cls.created_vacancy(vacancy))
-        return result
+        name = vacancy_data.get("name", "")
+        url = vacancy_data.get("alternate_url", "")
+        return name, url, salary_from, salary_to, experience_name, currency
 
     @staticmethod
     def __valid_other(class_date: "Vacancy") -> "Vacancy":
@@ -200,3 +478,146 @@ class Vacancy:
         if not isinstance(class_date, Vacancy):
             raise TypeError("Не является классом Vacancy")
         return class_date
+
+
+# Признак еще не вычисленного поля LazyVacancy
+_MISSING: Any = object()
+
+
+class LazyVacancy(Vacancy):
+    """
+    Класс ленивого представления вакансии поверх исходного словаря API HeadHunter.
+    Поле извлекается и проверяется только при первом обращении и затем кэшируется,
+    поэтому вакансии, отброшенные фильтром по зарплате, не проверяют название и ссылку.
+    Совместим с Vacancy (сравнение, salary_average, to_dict, __str__, утилиты src.utils)
+
+    Атрибуты:
+        raw(dict): Исходный словарь вакансии API
+        name(str), url(str), salary_from(int), salary_to(int), experience(str):
+            Свойства полей вакансии (вычисляются при первом обращении)
+        currency(str), salary_from_original(int), salary_to_original(int):
+            Исходная валюта и суммы зарплаты (зарплата не в рублях в salary_from/salary_to не учитывается)
+
+    Методы:
+        __init__(self, raw: Dict[str, Any]) -> None:
+            Инициализация класса LazyVacancy (без извлечения и проверки полей)
+        cast_to_lazy_list(cls, vacancy_data: Iterable[Dict[str, Any]]) -> List["LazyVacancy"]:
+            Классовый метод создания списка ленивых вакансий из словарей API
+        __salary_info(self) -> Optional[Dict[str, Any]]:
+            Приватный метод получения зарплаты в рублях из словаря API
+            :raise TypeError, ValueError: При обращении к полю, если значение не проходит проверку
+    """
+
+    __raw: Dict[str, Any]
+    __name: str
+    __url: str
+    __salary_from: int
+    __salary_to: int
+    __experience: str
+    __slots__ = ("__raw", "__name", "__url", "__salary_from", "__salary_to", "__experience")
+
+    def __init__(self, raw: Dict[str, Any]) -> None:
+        """
+        Инициализация класса LazyVacancy (без извлечения и проверки полей)
+        :param raw: Исходный словарь вакансии API
+        """
+        self.__raw = raw
+        self.__name = self.__url = self.__salary_from = self.__salary_to = self.__experience = _MISSING
+        # Исходная валюта и суммы не проверяются, поэтому берутся сразу
+        salary_info = raw.get("salary", {})
+        if salary_info is not None:
+            self.currency = salary_info.get("currency") or ""
+            self.salary_from_original = salary_info.get("from") or 0
+            self.salary_to_original = salary_info.get("to") or 0
+        else:
+            self.currency = "RUR"
+            self.salary_from_original = self.salary_to_original = 0
+
+    @classmethod
+    def cast_to_lazy_list(cls, vacancy_data: Iterable[Dict[str, Any]]) -> List["LazyVacancy"]:
+        """
+        Классовый метод создания списка ленивых вакансий из словарей API
+        :param vacancy_data: Итерируемый объект словарей вакансий API
+        :return: Список экземпляров класса LazyVacancy
+        """
+        return [cls(vacancy) for vacancy in vacancy_data]
+
+    @property
+    def raw(self) -> Dict[str, Any]:
+        """Исходный словарь вакансии API"""
+        return self.__raw
+
+    @property
+    def name(self) -> str:
+        """Наименование вакансии (проверяется при первом обращении)"""
+        if self.__name is _MISSING:
+            self.__name = _validator.valid_name(self.__raw.get("name", ""))
+        return self.__name
+
+    @name.setter
+    def name(self, value: str) -> None:
+        """Установка наименования без проверки (как у атрибута Vacancy)"""
+        self.__name = value
+
+    @property
+    def url(self) -> str:
+        """Ссылка на вакансию (проверяется при первом обращении)"""
+        if self.__url is _MISSING:
+            self.__url = _validator.valid_url(self.__raw.get("alternate_url", ""))
+        return self.__url
+
+    @url.setter
+    def url(self, value: str) -> None:
+        """Установка ссылки без проверки (как у атрибута Vacancy)"""
+        self.__url = value
+
+    @property
+    def salary_from(self) -> int:
+        """Зарплата "от" в рублях (0 - не указана)"""
+        if self.__salary_from is _MISSING:
+            salary_info = self.__salary_info()
+            salary_from = salary_info.get("from", 0) if salary_info is not None else None
+            self.__salary_from = _validator.valid_salary_from(salary_from)
+        return self.__salary_from
+
+    @salary_from.setter
+    def salary_from(self, value: int) -> None:
+        """Установка зарплаты "от" без проверки (как у атрибута Vacancy)"""
+        self.__salary_from = value
+
+    @property
+    def salary_to(self) -> int:
+        """Зарплата "до" в рублях (0 - не указана), проверяется вместе с зарплатой "от\""""
+        if self.__salary_to is _MISSING:
+            salary_info = self.__salary_info()
+            salary_to = salary_info.get("to", 0) if salary_info is not None else None
+            self.__salary_to = _validator.valid_salary_to(salary_to, self.salary_from)
+        return self.__salary_to
+
+    @salary_to.setter
+    def salary_to(self, value: int) -> None:
+        """Установка зарплаты "до" без проверки (как у атрибута Vacancy)"""
+        self.__salary_to = value
+
+    @property
+    def experience(self) -> str:
+        """Требуемый опыт"""
+        if self.__experience is _MISSING:
+            experience_info = self.__raw.get("experience", {})
+            self.__experience = sys.intern(experience_info.get("name", "")) if experience_info is not None else ""
+        return self.__experience
+
+    @experience.setter
+    def experience(self, value: str) -> None:
+        """Установка требуемого опыта без проверки (как у атрибута Vacancy)"""
+        self.__experience = value
+
+    def __salary_info(self) -> Optional[Dict[str, Any]]:
+        """
+        Получение зарплаты из словаря API (как в created_vacancy учитывается только зарплата в рублях)
+        :return: Словарь зарплаты или None, если зарплата не указана или не в рублях
+        """
+        salary_info: Optional[Dict[str, Any]] = self.__raw.get("salary", {})
+        if salary_info is not None and salary_info.get("currency") == "RUR":
+            return salary_info
+        return None
@@ -0,0 +1,434 @@
+import heapq
+import sys
+from array import array
+from itertools import compress
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from src.vacancies import Vacancy, salary_average
+from src.validates import ValidVacancy
+
+try:
+    import numpy as np
+except ImportError:  # numpy - необязательная зависимость (pip install numpy)
+    np = None  # type: ignore[assignment]
+
+# Используется ли векторный фильтр numpy
+HAS_NUMPY = np is not None
+
+
+class Categories:
+    """
+    Класс общей таблицы значений категориального поля: каждое значение хранится один раз,
+    а в колонках - только его небольшой целочисленный код
+
+    Методы:
+        __init__(self, values: Iterable[str] = ()) -> None:
+            Инициализация класса Categories
+        __len__(self) -> int:
+            Количество значений в таблице
+        code(self, value: str) -> int:
+            Метод получения кода значения (новое значение добавляется в таблицу)
+        value(self, code: int) -> str:
+            Метод получения значения по коду
+            :raise IndexError: Если кода нет в таблице
+    """
+
+    def __init__(self, values: Iterable[str] = ()) -> None:
+        """
+        Инициализация класса Categories
+        :param values: Начальные значения таблицы (получают коды 0, 1, 2, ...)
+        """
+        self.__values: List[str] = []
+        self.__codes: Dict[str, int] = {}
+        for value in values:
+            self.code(value)
+
+    def __len__(self) -> int:
+        """Количество значений в таблице"""
+        return len(self.__values)
+
+    def code(self, value: str) -> int:
+        """
+        Метод получения кода значения (новое значение добавляется в таблицу)
+        :param value: Значение
+        :return: Код значения
+        """
+        code = self.__codes.get(value)
+        if code is None:
+            code = self.__codes[value] = len(self.__values)
+            self.__values.append(sys.intern(value))
+        return code
+
+    def value(self, code: int) -> str:
+        """
+        Метод получения значения по коду
+        :param code: Код значения
+        :return: Значение
+        :raise IndexError: Если кода нет в таблице
+        """
+        return self.__values[code]
+
+
+# Наибольший номер вакансии, который помещается в колонку url_ids (array "q")
+MAX_URL_ID = 2**63 - 1
+
+# Общие для всех VacancyFrame таблицы: опыт HeadHunter и начало ссылки на вакансию (до номера)
+EXPERIENCES = Categories(["", "Нет опыта", "От 1 года до 3 лет", "От 3 до 6 лет", "Более 6 лет"])
+URL_PREFIXES = Categories(["https://hh.ru/vacancy/", "http://hh.ru/vacancy/", "hh.ru/vacancy/"])
+
+
+class VacancyFrame:
+    """
+    Класс колоночного хранения вакансий. Зарплаты и средняя зарплата хранятся в непрерывных
+    массивах array, поэтому фильтр по диапазону и выбор топ N работают с числами,
+    без вызова salary_average() и сравнения объектов Vacancy. Экземпляры Vacancy
+    создаются только при обращении к строкам (ленивая материализация).
+    Для экономии памяти опыт хранится кодом общей таблицы EXPERIENCES, ссылка - кодом
+    начала ссылки (URL_PREFIXES) и номером вакансии, строки собираются при обращении.
+    При установленном numpy фильтр по зарплате выполняется векторно над буферами массивов
+
+    Атрибуты:
+        names(list): Наименования вакансий (одинаковые строки хранятся один раз)
+        experience_codes(array): Коды требуемого опыта в таблице EXPERIENCES
+        url_prefix_codes(array): Коды начала ссылки в таблице URL_PREFIXES
+        url_ids(array): Номера вакансий из ссылок (-1 - номер больше MAX_URL_ID, ссылка целиком в long_urls)
+        long_urls(dict): Ссылки с номером больше MAX_URL_ID по номеру строки (таблица своя у каждого VacancyFrame)
+        salaries_from(array): Зарплаты "от" (0 - не указана)
+        salaries_to(array): Зарплаты "до" (0 - не указана)
+        averages(array): Средние зарплаты (функция salary_average)
+
+    Методы:
+        __init__(self, names: Sequence[str] = (), urls: Sequence[str] = (),
+        salaries_from: Sequence[Optional[int]] = (), salaries_to: Sequence[Optional[int]] = (),
+        experiences: Optional[Sequence[str]] = None) -> None:
+            Инициализация класса VacancyFrame с проверкой колонок ValidVacancy.validate_many
+            :raise TypeError, ValueError: Если данные колонок некорректны
+        from_vacancies(cls, vacancies: Iterable[Vacancy]) -> "VacancyFrame":
+            Классовый метод создания из экземпляров Vacancy (без повторной проверки)
+        urls(self) -> List[str]:
+            Свойство получения ссылок на вакансии (собираются из кодов)
+        experiences(self) -> List[str]:
+            Свойство получения требуемого опыта (собирается из кодов)
+        __len__(self) -> int:
+            Количество вакансий
+        __getitem__(self, index: int) -> Vacancy:
+            Получение строки в виде экземпляра Vacancy
+        __iter__(self) -> Iterator[Vacancy]:
+            Ленивый перебор строк в виде экземпляров Vacancy
+        filter_by_salary(self, salary_min: int, salary_max: int) -> "VacancyFrame":
+            Метод фильтрации вакансий по средней зарплате в диапазоне (векторно, если установлен numpy)
+        top(self, top_n: int) -> "VacancyFrame":
+            Метод получения топ-'n' вакансий по средней зарплате
+            :raise ValueError: Если вакансий меньше, чем необходимо
+        take(self, indices: Iterable[int]) -> "VacancyFrame":
+            Метод получения строк по номерам
+        to_vacancies(self) -> List[Vacancy]:
+            Метод получения списка экземпляров Vacancy
+        __set_columns(self, names: List[str], urls: Iterable[str], salaries_from: Iterable[int],
+        salaries_to: Iterable[int], experiences: Iterable[str]) -> None:
+            Приватный метод кодирования уже проверенных колонок
+        __take_numpy(self, indices: Any) -> "VacancyFrame":
+            Приватный метод получения строк по массиву номеров numpy
+        __take_long_urls(self, indices: Iterable[int]) -> Dict[int, str]:
+            Приватный метод отбора длинных ссылок (long_urls) для новых номеров строк
+        __from_encoded(cls, names: List[str], url_prefix_codes: Iterable[int], url_ids: Iterable[int],
+        salaries_from: Iterable[int], salaries_to: Iterable[int], experience_codes: Iterable[int],
+        averages: Optional[Iterable[float]] = None, long_urls: Optional[Dict[int, str]] = None) -> "VacancyFrame":
+            Приватный классовый метод создания из закодированных колонок
+        __set_encoded(self, names: List[str], url_prefix_codes: Iterable[int], url_ids: Iterable[int],
+        salaries_from: Iterable[int], salaries_to: Iterable[int], experience_codes: Iterable[int],
+        averages: Optional[Iterable[float]] = None, long_urls: Optional[Dict[int, str]] = None) -> None:
+            Приватный метод заполнения закодированных колонок (средние зарплаты рассчитываются, если не переданы)
+        __split_url(url: str) -> Optional[Tuple[int, int]]:
+            Статический метод разбиения ссылки на код начала и номер вакансии
+        __row(self, index: int) -> Dict[str, Any]:
+            Приватный метод получения строки в формате Vacancy.to_dict
+        __url(self, index: int) -> str:
+            Приватный метод сборки ссылки строки
+    """
+
+    names: List[str]
+    experience_codes: array
+    url_prefix_codes: array
+    url_ids: array
+    salaries_from: array
+    salaries_to: array
+    averages: array
+    long_urls: Dict[int, str]
+
+    def __init__(
+        self,
+        names: Sequence[str] = (),
+        urls: Sequence[str] = (),
+        salaries_from: Sequence[Optional[int]] = (),
+        salaries_to: Sequence[Optional[int]] = (),
+        experiences: Optional[Sequence[str]] = None,
+    ) -> None:
+        """
+        Инициализация класса VacancyFrame
+        :param names: Наименования вакансий
+        :param urls: Ссылки на вакансии
+        :param salaries_from: Зарплаты "от" (None - не указана)
+        :param salaries_to: Зарплаты "до" (None - не указана)
+        :param experiences: Требуемый опыт (по умолчанию "" для всех вакансий)
+        :raise TypeError: Если значение в колонке некорректного типа
+        :raise ValueError: Если значение не проходит проверку или колонки разной длины
+        """
+        if experiences is None:
+            experiences = [""] * len(names)
+        elif len(experiences) != len(names):
+            raise ValueError("Колонки данных вакансий разной длины")
+        valid = ValidVacancy().validate_many(names, urls, salaries_from, salaries_to)
+        self.__set_columns(valid["name"], valid["url"], valid["salary_from"], valid["salary_to"], experiences)
+
+    @classmethod
+    def from_vacancies(cls, vacancies: Iterable[Vacancy]) -> "VacancyFrame":
+        """
+        Классовый метод создания из экземпляров Vacancy (данные уже проверены, повторной проверки нет)
+        :param vacancies: Итерируемый объект экземпляров класса Vacancy
+        :return: Экземпляр класса VacancyFrame
+        """
+        names: List[str] = []
+        urls: List[str] = []
+        salaries_from: List[int] = []
+        salaries_to: List[int] = []
+        experiences: List[str] = []
+        for vacancy in vacancies:
+            names.append(vacancy.name)
+            urls.append(vacancy.url)
+            salaries_from.append(vacancy.salary_from or 0)
+            salaries_to.append(vacancy.salary_to or 0)
+            experiences.append(vacancy.experience or "")
+        frame = cls.__new__(cls)
+        frame.__set_columns(names, urls, salaries_from, salaries_to, experiences)
+        return frame
+
+    @property
+    def urls(self) -> List[str]:
+        """Ссылки на вакансии (собираются из кодов)"""
+        return [self.__url(index) for index in range(len(self))]
+
+    @property
+    def experiences(self) -> List[str]:
+        """Требуемый опыт (собирается из кодов)"""
+        return [EXPERIENCES.value(code) for code in self.experience_codes]
+
+    def __len__(self) -> int:
+        """Количество вакансий"""
+        return len(self.names)
+
+    def __getitem__(self, index: int) -> Vacancy:
+        """
+        Получение строки в виде экземпляра Vacancy
+        :param index: Номер строки
+        :return: Экземпляр класса Vacancy
+        :raise IndexError: Если строки с таким номером нет
+        """
+        return Vacancy.from_trusted_dicts([self.__row(index)], validate=False)[0]
+
+    def __iter__(self) -> Iterator[Vacancy]:
+        """Ленивый перебор строк в виде экземпляров Vacancy"""
+        for index in range(len(self)):
+            yield self[index]
+
+    def filter_by_salary(self, salary_min: int, salary_max: int) -> "VacancyFrame":
+        """
+        Метод фильтрации вакансий по средней зарплате в диапазоне (как get_vacancies_by_salary).
+        При установленном numpy маска и выбор строк считаются векторно над буферами массивов,
+        иначе - одним проходом Python. Средние зарплаты не пересчитываются, а отбираются той же маской
+        :param salary_min: Минимальная необходимая зарплата
+        :param salary_max: Максимальная необходимая зарплата
+        :return: Новый VacancyFrame с вакансиями, входящими в диапазон
+        """
+        if np is not None:
+            averages = np.frombuffer(self.averages, dtype=np.float64)
+            return self.__take_numpy(np.flatnonzero((averages >= salary_min) & (averages <= salary_max)))
+        mask = [salary_min <= average <= salary_max for average in self.averages]
+        long_urls = self.__take_long_urls(compress(range(len(self)), mask)) if self.long_urls else None
+        return self.__from_encoded(
+            list(compress(self.names, mask)),
+            compress(self.url_prefix_codes, mask),
+            compress(self.url_ids, mask),
+            compress(self.salaries_from, mask),
+            compress(self.salaries_to, mask),
+            compress(self.experience_codes, mask),
+            compress(self.averages, mask),
+            long_urls,
+        )
+
+    def top(self, top_n: int) -> "VacancyFrame":
+        """
+        Метод получения топ-'n' вакансий по средней зарплате (частичный выбор heapq.nlargest,
+        без сортировки всех строк; при равной зарплате сохраняется исходный порядок, как в get_top_vacancies)
+        :param top_n: Количество в списке
+        :return: Новый VacancyFrame из top_n вакансий по убыванию средней зарплаты
+        :raise ValueError: Если вакансий меньше, чем необходимо
+        """
+        if len(self) < top_n:
+            raise ValueError("В списке вакансий меньше чем необходимо")
+        return self.take(heapq.nlargest(top_n, range(len(self)), key=self.averages.__getitem__))
+
+    def take(self, indices: Iterable[int]) -> "VacancyFrame":
+        """
+        Метод получения строк по номерам
+        :param indices: Номера строк в нужном порядке
+        :return: Новый VacancyFrame
+        """
+        indices = list(indices)
+        return self.__from_encoded(
+            [self.names[index] for index in indices],
+            [self.url_prefix_codes[index] for index in indices],
+            [self.url_ids[index] for index in indices],
+            [self.salaries_from[index] for index in indices],
+            [self.salaries_to[index] for index in indices],
+            [self.experience_codes[index] for index in indices],
+            [self.averages[index] for index in indices],
+            self.__take_long_urls(indices),
+        )
+
+    def to_vacancies(self) -> List[Vacancy]:
+        """
+        Метод получения списка экземпляров Vacancy
+        :return: Список экземпляров класса Vacancy
+        """
+        return Vacancy.from_trusted_dicts(map(self.__row, range(len(self))), validate=False)
+
+    def __set_columns(
+        self,
+        names: List[str],
+        urls: Iterable[str],
+        salaries_from: Iterable[int],
+        salaries_to: Iterable[int],
+        experiences: Iterable[str],
+    ) -> None:
+        """Кодирование уже проверенных колонок (без повторной проверки) и заполнение атрибутов"""
+        url_parts: List[Tuple[int, int]] = []
+        long_urls: Dict[int, str] = {}
+        for row, url in enumerate(urls):
+            parts = self.__split_url(url)
+            if parts is None:
+                long_urls[row] = url
+                parts = 0, -1
+            url_parts.append(parts)
+        self.__set_encoded(
+            [sys.intern(name) for name in names],
+            [prefix_code for prefix_code, _ in url_parts],
+            [url_id for _, url_id in url_parts],
+            salaries_from,
+            salaries_to,
+            map(EXPERIENCES.code, experiences),
+            long_urls=long_urls,
+        )
+
+    def __take_numpy(self, indices: Any) -> "VacancyFrame":
+        """
+        Получение строк по массиву номеров numpy: колонки array отбираются через буфер без копирования в Python
+        :param indices: Массив номеров строк numpy
+        :return: Новый VacancyFrame
+        """
+        frame = self.__new__(type(self))
+        frame.names = [self.names[index] for index in indices.tolist()]
+        frame.long_urls = self.__take_long_urls(indices.tolist()) if self.long_urls else {}
+        for column in ("url_prefix_codes", "url_ids", "experience_codes", "salaries_from", "salaries_to", "averages"):
+            values: array = getattr(self, column)
+            taken = array(values.typecode)
+            taken.frombytes(np.frombuffer(values, dtype=values.typecode)[indices].tobytes())
+            setattr(frame, column, taken)
+        return frame
+
+    def __take_long_urls(self, indices: Iterable[int]) -> Dict[int, str]:
+        """
+        Отбор длинных ссылок (long_urls) для строк, выбранных по номерам
+        :param indices: Номера выбранных строк в порядке новых строк
+        :return: Словарь {новый номер строки: ссылка}
+        """
+        if not self.long_urls:
+            return {}
+        return {row: self.long_urls[index] for row, index in enumerate(indices) if index in self.long_urls}
+
+    @classmethod
+    def __from_encoded(
+        cls,
+        names: List[str],
+        url_prefix_codes: Iterable[int],
+        url_ids: Iterable[int],
+        salaries_from: Iterable[int],
+        salaries_to: Iterable[int],
+        experience_codes: Iterable[int],
+        averages: Optional[Iterable[float]] = None,
+        long_urls: Optional[Dict[int, str]] = None,
+    ) -> "VacancyFrame":
+        """
+        Создание из закодированных колонок
+        :return: Экземпляр класса VacancyFrame
+        """
+        frame = cls.__new__(cls)
+        frame.__set_encoded(
+            names, url_prefix_codes, url_ids, salaries_from, salaries_to, experience_codes, averages, long_urls
+        )
+        return frame
+
+    def __set_encoded(
+        self,
+        names: List[str],
+        url_prefix_codes: Iterable[int],
+        url_ids: Iterable[int],
+        salaries_from: Iterable[int],
+        salaries_to: Iterable[int],
+        experience_codes: Iterable[int],
+        averages: Optional[Iterable[float]] = None,
+        long_urls: Optional[Dict[int, str]] = None,
+    ) -> None:
+        """Заполнение закодированных колонок (средние зарплаты рассчитываются, только если не переданы)"""
+        self.names = names
+        self.long_urls = {} if long_urls is None else long_urls
+        self.url_prefix_codes = array("H", url_prefix_codes)
+        self.url_ids = array("q", url_ids)
+        self.experience_codes = array("H", experience_codes)
+        self.salaries_from = array("q", salaries_from)
+        self.salaries_to = array("q", salaries_to)
+        if averages is None:
+            averages = map(salary_average, self.salaries_from, self.salaries_to)
+        self.averages = array("d", averages)
+
+    @staticmethod
+    def __split_url(url: str) -> Optional[Tuple[int, int]]:
+        """
+        Разбиение проверенной ссылки "<начало><номер>" на код начала в URL_PREFIXES и номер вакансии.
+        Ведущие нули номера остаются в начале ссылки, поэтому ссылка собирается без изменений.
+        Номер больше MAX_URL_ID не помещается в колонку, такая ссылка хранится целиком в long_urls кадра
+        (общая таблица URL_PREFIXES не растет от уникальных ссылок)
+        :param url: Ссылка на вакансию
+        :return: Кортеж (код начала ссылки, номер вакансии) или None, если номер больше MAX_URL_ID
+        """
+        digits = url[url.rfind("/") + 1:]
+        url_id = digits.lstrip("0") or "0"
+        if len(url_id) > 18 and int(url_id) > MAX_URL_ID:
+            return None
+        return URL_PREFIXES.code(url[: len(url) - len(url_id)]), int(url_id)
+
+    def __row(self, index: int) -> Dict[str, Any]:
+        """
+        Получение строки в формате Vacancy.to_dict (данные уже проверены при создании)
+        :param index: Номер строки
+        :return: Словарь вакансии
+        :raise IndexError: Если строки с таким номером нет
+        """
+        return {
+            "name": self.names[index],
+            "url": self.__url(index),
+            "salary_from": self.salaries_from[index],
+            "salary_to": self.salaries_to[index],
+            "experience": EXPERIENCES.value(self.experience_codes[index]),
+        }
+
+    def __url(self, index: int) -> str:
+        """
+        Сборка ссылки строки
+        :param index: Номер строки
+        :return: Ссылка на вакансию
+        """
+        url_id = self.url_ids[index]
+        if url_id < 0:
+            return self.long_urls[index % len(self)]
+        return f"{URL_PREFIXES.value(self.url_prefix_codes[index])}{url_id}"
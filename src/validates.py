@@ -1,8 +1,11 @@
 import re
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 from src.interfaces import Valid
 
+# Формат ссылки на вакансию (шаблон компилируется один раз при импорте модуля)
+URL_PATTERN = re.compile(r"(https?://)?hh\.ru/vacancy/\d+")
+
 
 class ValidVacancy(Valid):
     """
@@ -13,6 +16,10 @@ class ValidVacancy(Valid):
         self, name: str, url: str, salary_from: Optional[int], salary_to: Optional[int]
         ) -> Dict[str, Any]:
             Метод получения валидные данных вакансии выводит в виде словаря
+        validate_many(self, names: Sequence[str], urls: Sequence[str], salaries_from: Sequence[Optional[int]],
+        salaries_to: Sequence[Optional[int]]) -> Dict[str, List[Any]]:
+            Метод получения валидных данных сразу по колонкам многих вакансий за один проход
+            :raise ValueError: Колонки разной длины
         valid_name(self, name: str) -> str:
             Getter получения валидного наименования вакансии
         valid_url(self, url: str) -> str:
@@ -60,6 +67,57 @@ class ValidVacancy(Valid):
             "salary_to": salary_to,
         }
 
+    def validate_many(
+        self,
+        names: Sequence[str],
+        urls: Sequence[str],
+        salaries_from: Sequence[Optional[int]],
+        salaries_to: Sequence[Optional[int]],
+    ) -> Dict[str, List[Any]]:
+        """
+        Метод получения валидных данных сразу по колонкам многих вакансий за один проход.
+        Проверки и сообщения об ошибках те же, что у validate_vacancy_to_dict, но без вызова
+        цепочки методов на каждую вакансию
+        :param names: Названия вакансий
+        :param urls: Ссылки на вакансии
+        :param salaries_from: Зарплаты "от" (None - не указана)
+        :param salaries_to: Зарплаты "до" (None - не указана)
+        :return: Словарь колонок валидных данных. Формат:
+            {"name": [...], "url": [...], "salary_from": [...], "salary_to": [...]}
+        :raise TypeError: Если значение в колонке некорректного типа
+        :raise ValueError: Если значение не проходит проверку или колонки разной длины
+        """
+        size = len(names)
+        if len(urls) != size or len(salaries_from) != size or len(salaries_to) != size:
+            raise ValueError("Колонки данных вакансий разной длины")
+        url_match = URL_PATTERN.fullmatch
+        valid_from: List[int] = []
+        valid_to: List[int] = []
+        for name, url, salary_from, salary_to in zip(names, urls, salaries_from, salaries_to):
+            if not isinstance(name, str):
+                raise TypeError("Название не является строкой")
+            if len(name) <= 1:
+                raise ValueError("Название вакансии не бывает с 1 символом")
+            if not isinstance(url, str):
+                raise TypeError("Ссылка не является строкой")
+            if url_match(url) is None:
+                raise ValueError("Ссылка не подходит под формат")
+            if salary_from is None:
+                salary_from = 0
+            elif not isinstance(salary_from, int):
+                raise TypeError("Зарплата 'от' не является числом")
+            elif salary_from < 0:
+                raise ValueError("Зарплата 'от' не может быть отрицательным числом")
+            if salary_to is None:
+                salary_to = 0
+            elif not isinstance(salary_to, int):
+                raise TypeError("Зарплата 'до' не является числом")
+            elif salary_to < 0 or salary_to < salary_from:
+                raise ValueError("Зарплата 'до' не может быть отрицательным числом или меньше зарплаты 'от'")
+            valid_from.append(salary_from)
+            valid_to.append(salary_to)
+        return {"name": list(names), "url": list(urls), "salary_from": valid_from, "salary_to": valid_to}
+
     def valid_name(self, name: str) -> str:
         """Метод получения валидного наименования вакансии"""
         return self.__valid_name(name)
@@ -102,7 +160,7 @@ class ValidVacancy(Valid):
         """
         if not isinstance(url, str):
             raise TypeError("Ссылка не является строкой")
-        if not re.fullmatch(r"^(https?://)?hh\.ru/vacancy/\d+$", url):
+        if URL_PATTERN.fullmatch(url) is None:
             raise ValueError("Ссылка не подходит под формат")
         return url
 
@@ -0,0 +1,128 @@
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.async_head_hunter_api import AsyncHeadHunterAPI
+from src.exceptions import APIError
+from src.vacancies import Vacancy
+
+
+def make_stub_app(pages: int, requests_log: List[Dict[str, Any]], status: int = 200) -> web.Application:
+    """Создание локального сервера-заглушки API HeadHunter"""
+
+    async def handler(request: web.Request) -> web.Response:
+        requests_log.append(dict(request.query))
+        if status != 200:
+            return web.Response(status=status, text="Параметры переданы с ошибкой")
+        page = int(request.query.get("page", 0))
+        items = [
+            {
+                "id": str(page),
+                "name": f"Python Developer {page}",
+                "alternate_url": f"https://hh.ru/vacancy/{page + 1}",
+                "salary": {"from": 100000, "to": 150000, "currency": "RUR"},
+                "experience": {"name": "От 1 года до 3 лет"},
+            }
+        ]
+        await asyncio.sleep(0.01 * (pages - page))  # последние страницы отвечают быстрее первых
+        return web.json_response({"items": items, "pages": pages, "found": pages})
+
+    app = web.Application()
+    app.router.add_get("/vacancies", handler)
+    return app
+
+
+async def run_with_server(app: web.Application, **kwargs: Any) -> List[Dict[str, Any]]:
+    async with TestServer(app) as server:
+        hh_api = AsyncHeadHunterAPI(url=str(server.make_url("/vacancies")), **kwargs)
+        return await hh_api.get_vacancies("python", 4)
+
+
+def test_async_hh_api_init() -> None:
+    """Тестирование инициализации класса"""
+    hh_api = AsyncHeadHunterAPI()
+    assert hh_api.per_page == 100
+    assert hh_api.max_concurrency == 5
+    assert hh_api.url == "https://api.hh.ru/vacancies"
+
+
+@pytest.mark.parametrize(
+    "kwargs, expected, exc_message",
+    [
+        ({"per_page": "1"}, TypeError, "Параметр не является целым числом"),
+        ({"per_page": 101}, ValueError, "Параметр не может быть больше 100"),
+        ({"max_concurrency": 0}, ValueError, "Количество одновременных запросов должен быть положительным числом"),
+    ],
+)
+def test_async_hh_api_init_error(kwargs: Dict[str, Any], expected: type[Exception], exc_message: str) -> None:
+    """Тестирование валидации аргументов класса"""
+    with pytest.raises(expected, match=exc_message):
+        AsyncHeadHunterAPI(**kwargs)
+
+
+def test_async_get_vacancies() -> None:
+    """Тестирование получения вакансий с локального сервера с сохранением порядка страниц"""
+    requests_log: List[Dict[str, Any]] = []
+    vacancies = asyncio.run(run_with_server(make_stub_app(6, requests_log), max_concurrency=2))
+
+    assert [vacancy["id"] for vacancy in vacancies] == ["0", "1", "2", "3"]
+    assert sorted(int(query["page"]) for query in requests_log) == [0, 1, 2, 3]
+    assert all(query["text"] == "python" for query in requests_log)
+    assert Vacancy.cast_to_object_list(vacancies)[0].name == "Python Developer 0"
+
+
+def test_async_get_vacancies_error() -> None:
+    """Тестирование ошибки статуса API"""
+    with pytest.raises(APIError, match="Ошибка API: 400 - Параметры переданы с ошибкой"):
+        asyncio.run(run_with_server(make_stub_app(1, [], status=400)))
+
+
+def test_async_concurrent_calls_without_session() -> None:
+    """Тестирование одновременных вызовов без "async with": завершение быстрого не закрывает сессию медленного"""
+
+    async def handler(request: web.Request) -> web.Response:
+        if request.query["text"] == "slow":
+            await asyncio.sleep(0.1)
+        item = {"id": request.query["text"], "name": "Python", "alternate_url": "https://hh.ru/vacancy/1"}
+        return web.json_response({"items": [item], "pages": 1, "found": 1})
+
+    async def run() -> List[List[Dict[str, Any]]]:
+        app = web.Application()
+        app.router.add_get("/vacancies", handler)
+        async with TestServer(app) as server:
+            hh_api = AsyncHeadHunterAPI(url=str(server.make_url("/vacancies")))
+            return list(await asyncio.gather(hh_api.get_vacancies("fast"), hh_api.get_vacancies("slow")))
+
+    fast, slow = asyncio.run(run())
+    assert fast[0]["id"] == "fast"
+    assert slow[0]["id"] == "slow"
+
+
+def test_async_shared_session() -> None:
+    """Тестирование общей сессии внутри "async with" """
+    requests_log: List[Dict[str, Any]] = []
+
+    async def run() -> List[Dict[str, Any]]:
+        async with TestServer(make_stub_app(2, requests_log)) as server:
+            async with AsyncHeadHunterAPI(url=str(server.make_url("/vacancies"))) as hh_api:
+                await hh_api.connect()
+                return await hh_api.get_vacancies("python")
+
+    assert [vacancy["id"] for vacancy in asyncio.run(run())] == ["0", "1"]
+    assert len(requests_log) == 3
+
+
+def test_async_connect() -> None:
+    """Тестирование подключения к API без открытой сессии"""
+
+    async def run() -> Dict[str, Any]:
+        async with TestServer(make_stub_app(1, [])) as server:
+            hh_api = AsyncHeadHunterAPI(url=str(server.make_url("/vacancies")))
+            return await hh_api.connect()
+
+    result = asyncio.run(run())
+    assert result["pages"] == 1
+    assert result["items"][0]["id"] == "0"
@@ -0,0 +1,102 @@
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.cache import CachedResponse, ResponseCache
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> ResponseCache:
+    return ResponseCache(tmp_path / "cache.sqlite3", ttl=60, max_bytes=100)
+
+
+def test_cache_init_error(tmp_path: Path) -> None:
+    """Тестирование инициализации класса с отрицательными параметрами"""
+    with pytest.raises(ValueError, match="Срок жизни и размер кэша не могут быть отрицательными"):
+        ResponseCache(tmp_path / "cache.sqlite3", ttl=-1)
+
+
+def test_make_key() -> None:
+    """Тестирование ключа кэша: порядок параметров не важен, значения важны"""
+    url = "https://api.hh.ru/vacancies"
+    key = ResponseCache.make_key(url, {"text": "python", "page": 0})
+    assert key == ResponseCache.make_key(url, {"page": 0, "text": "python"})
+    assert key != ResponseCache.make_key(url, {"text": "python", "page": 1})
+
+
+def test_get_set(cache: ResponseCache) -> None:
+    """Тестирование сохранения и получения записи"""
+    assert cache.get("key") is None
+    cache.set("key", b'{"items": []}', etag='"abc"')
+    cached = cache.get("key")
+    assert cached is not None
+    assert cached.fresh
+    assert cached.body == b'{"items": []}'
+    assert cache.stats == {
+        "hits": 1,
+        "misses": 1,
+        "revalidations": 0,
+        "bytes_read": 13,
+        "bytes_written": 13,
+        "size_bytes": 13,
+    }
+
+
+def test_get_expired(cache: ResponseCache) -> None:
+    """Тестирование устаревшей записи и продления ее срока после 304"""
+    with patch("src.cache.time.time", return_value=1000.0):
+        cache.set("key", b"{}", last_modified="Wed, 21 Oct 2015 07:28:00 GMT")
+    with patch("src.cache.time.time", return_value=1100.0):
+        cached = cache.get("key")
+        assert cached is not None
+        assert not cached.fresh
+        assert cached.conditional_headers() == {"If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT"}
+        cache.touch("key")
+        cached = cache.get("key")
+    assert cached is not None
+    assert cached.fresh
+    assert cache.stats["revalidations"] == 1
+
+
+def test_lru_eviction(cache: ResponseCache) -> None:
+    """Тестирование вытеснения давно не использованных записей"""
+    with patch("src.cache.time.time", side_effect=[1.0, 2.0, 3.0, 4.0]):
+        cache.set("first", b"a" * 40)
+        cache.set("second", b"b" * 40)
+        cache.get("first")  # "first" использован позже "second"
+        cache.set("third", b"c" * 40)
+    assert cache.get("second") is None
+    assert cache.get("first") is not None
+    assert cache.get("third") is not None
+    assert cache.stats["size_bytes"] == 80
+
+
+def test_set_too_large(cache: ResponseCache) -> None:
+    """Тестирование, не сохранение ответа больше размера кэша"""
+    cache.set("key", b"a" * 101)
+    assert cache.get("key") is None
+
+
+def test_clear(cache: ResponseCache) -> None:
+    """Тестирование очистки кэша"""
+    cache.set("key", b"{}")
+    cache.clear()
+    assert cache.get("key") is None
+
+
+def test_conditional_headers() -> None:
+    """Тестирование заголовков условного запроса"""
+    cached = CachedResponse(b"{}", '"abc"', None, 0.0, False)
+    assert cached.conditional_headers() == {"If-None-Match": '"abc"'}
+    assert CachedResponse(b"{}", None, None, 0.0, False).conditional_headers() == {}
+
+
+def test_persistent(tmp_path: Path) -> None:
+    """Тестирование сохранения кэша между экземплярами"""
+    cache_path = tmp_path / "cache.sqlite3"
+    first = ResponseCache(cache_path)
+    first.set("key", b"{}")
+    first.close()
+    second = ResponseCache(cache_path)
+    assert second.get("key") is not None
@@ -0,0 +1,118 @@
+import os
+import uuid
+from typing import Any, Dict, Iterator, List
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+psycopg2 = pytest.importorskip("psycopg2")
+
+from src.database import DBManager  # noqa: E402
+
+# Строка подключения к временной БД PostgreSQL для интеграционных тестов (без нее тесты пропускаются)
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL", "")
+
+
+@pytest.fixture
+def hh_items() -> List[Dict[str, Any]]:
+    return [
+        {
+            "id": "1",
+            "name": "Python Developer",
+            "alternate_url": "https://hh.ru/vacancy/1",
+            "salary": {"from": 100000, "to": 150000, "currency": "RUR"},
+            "experience": {"name": "Нет опыта"},
+            "employer": {"id": "10", "name": "Компания", "alternate_url": "https://hh.ru/employer/10"},
+            "published_at": "2025-01-01T10:00:00+0300",
+        },
+        {
+            "id": "2",
+            "name": "Go Developer",
+            "alternate_url": "https://hh.ru/vacancy/2",
+            "salary": {"from": 1000, "to": None, "currency": "USD"},
+            "experience": None,
+            "employer": {"name": "Анонимный работодатель"},
+        },
+        {
+            "id": "1",
+            "name": "Python Developer (обновлено)",
+            "alternate_url": "https://hh.ru/vacancy/1",
+            "salary": None,
+            "employer": {"id": "10", "name": "Компания"},
+        },
+        {"name": "Без id", "alternate_url": "https://hh.ru/vacancy/3"},
+    ]
+
+
+def test_db_manager_init() -> None:
+    """Тестирование проверки параметров"""
+    with pytest.raises(ValueError):
+        DBManager("")
+    with pytest.raises(ValueError):
+        DBManager("postgresql://localhost/hh", min_connections=3, max_connections=2)
+
+
+@patch("src.database.ThreadedConnectionPool")
+def test_db_manager_connection(mock_pool: MagicMock) -> None:
+    """Тестирование пула: одно создание, commit при успехе, rollback при ошибке, возврат соединения"""
+    with DBManager("postgresql://localhost/hh", max_connections=3) as manager:
+        manager.connect()
+        with manager.connection() as conn:
+            pass
+        conn.commit.assert_called_once()
+        with pytest.raises(RuntimeError):
+            with manager.connection():
+                raise RuntimeError("Ошибка")
+        conn.rollback.assert_called_once()
+    mock_pool.assert_called_once_with(1, 3, "postgresql://localhost/hh")
+    assert mock_pool.return_value.putconn.call_count == 2
+    mock_pool.return_value.closeall.assert_called_once()
+
+
+@patch("src.database.execute_values")
+@patch("src.database.ThreadedConnectionPool")
+def test_upsert_vacancies(mock_pool: MagicMock, mock_execute: MagicMock, hh_items: List[Dict[str, Any]]) -> None:
+    """Тестирование пакетной вставки: повторы id схлопываются, вакансии без id пропускаются"""
+    manager = DBManager("postgresql://localhost/hh", page_size=500)
+    assert manager.upsert_vacancies(hh_items) == 2
+
+    (employers_call, vacancies_call) = mock_execute.call_args_list
+    assert employers_call.args[2] == [(10, "Компания", "")]
+    assert vacancies_call.args[2] == [
+        (1, 10, "Python Developer (обновлено)", "https://hh.ru/vacancy/1", 0, 0, "RUR", "", None),
+        (2, None, "Go Developer", "https://hh.ru/vacancy/2", 0, 0, "USD", "", None),
+    ]
+    assert vacancies_call.kwargs == {"page_size": 500}
+    assert manager.upsert_vacancies([]) == 0
+
+
+@pytest.fixture
+def db_manager() -> Iterator[DBManager]:
+    """Менеджер во временной схеме тестовой БД (схема удаляется после теста)"""
+    if not TEST_DATABASE_URL:
+        pytest.skip("Не задана переменная окружения TEST_DATABASE_URL")
+    schema = f"test_{uuid.uuid4().hex}"
+    with psycopg2.connect(TEST_DATABASE_URL) as conn, conn.cursor() as cursor:
+        cursor.execute(f"CREATE SCHEMA {schema}")
+    dsn = psycopg2.extensions.make_dsn(TEST_DATABASE_URL, options=f"-csearch_path={schema}")
+    try:
+        with DBManager(dsn) as manager:
+            manager.create_tables()
+            yield manager
+    finally:
+        with psycopg2.connect(TEST_DATABASE_URL) as conn, conn.cursor() as cursor:
+            cursor.execute(f"DROP SCHEMA {schema} CASCADE")
+
+
+def test_upsert_vacancies_postgres(db_manager: DBManager, hh_items: List[Dict[str, Any]]) -> None:
+    """Интеграционный тест: загрузка и обновление вакансий по id HeadHunter"""
+    assert db_manager.upsert_vacancies(hh_items[:2]) == 2
+    assert db_manager.upsert_vacancies(hh_items[2:]) == 1
+    with db_manager.connection() as conn, conn.cursor() as cursor:
+        cursor.execute("SELECT vacancy_id, employer_id, name, salary_from FROM vacancies ORDER BY vacancy_id")
+        assert cursor.fetchall() == [
+            (1, 10, "Python Developer (обновлено)", 0),
+            (2, None, "Go Developer", 0),
+        ]
+        cursor.execute("SELECT employer_id, name FROM employers")
+        assert cursor.fetchall() == [(10, "Компания")]
@@ -1,8 +1,12 @@
-from typing import Any, Dict
-from unittest.mock import MagicMock, patch
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional
+from unittest.mock import MagicMock, PropertyMock, patch
 
 import pytest
 
+from src.cache import ResponseCache
 from src.exceptions import APIError
 from src.head_hunter_api import HeadHunterAPI
 
@@ -39,7 +43,7 @@ def test_connect(mock_connect: MagicMock) -> None:
     assert hh_api.connect() == expected_result
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_private_connect(mock_request: MagicMock) -> None:
     """Тестирование, работы приватного запроса API"""
     expected_result = {"items": [{"id": "123"}, {"id": "321"}]}
@@ -52,10 +56,33 @@ def test_private_connect(mock_request: MagicMock) -> None:
         "https://api.hh.ru/vacancies",
         headers={"User-Agent": "HH-User-Agent"},
         params={"text": "", "page": 0, "per_page": 100},
+        timeout=10.0,
     )
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
+def test_private_connect_fast_json(mock_request: MagicMock) -> None:
+    """Тестирование разбора ответа API напрямую из байтов"""
+    mock_request.return_value.content = b'{"items": [{"id": "123"}], "pages": 1}'
+    mock_request.return_value.status_code = 200
+    hh_api = HeadHunterAPI(fast_json=True)
+
+    assert hh_api.connect() == {"items": [{"id": "123"}], "pages": 1}
+    mock_request.return_value.json.assert_not_called()
+
+
+@patch("requests.Session.get")
+def test_private_connect_fast_json_invalid(mock_request: MagicMock) -> None:
+    """Тестирование разбора ответа API напрямую из байтов, если выдается не словарь"""
+    mock_request.return_value.content = b"[]"
+    mock_request.return_value.status_code = 200
+    hh_api = HeadHunterAPI(fast_json=True)
+
+    with pytest.raises(ValueError, match="API выдает не словарь"):
+        hh_api.connect()
+
+
+@patch("requests.Session.get")
 def test_private_connect_invalid(mock_request: MagicMock) -> None:
     """Тестирование, работы приватного запроса API, если выдается не словарь"""
     with pytest.raises(ValueError) as exc_info:
@@ -67,7 +94,7 @@ def test_private_connect_invalid(mock_request: MagicMock) -> None:
     assert str(exc_info.value) == "API выдает не словарь"
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_private_connect_error(mock_request: MagicMock) -> None:
     """Тестирование, работы приватного запроса API с ошибкой статуса"""
     expected_result = "Параметры переданы с ошибкой"
@@ -84,6 +111,7 @@ def test_private_connect_error(mock_request: MagicMock) -> None:
         "https://api.hh.ru/vacancies",
         headers={"User-Agent": "HH-User-Agent"},
         params={"text": "", "page": 0, "per_page": 100},
+        timeout=10.0,
     )
 
 
@@ -112,3 +140,303 @@ def test_get_vacancies_none_key(mock_response: MagicMock) -> None:
     assert len(vacancies) == 0
 
     mock_response.assert_called_once_with()
+
+
+@pytest.mark.parametrize(
+    "attribute, expected, exc_message",
+    [
+        ("2", TypeError, "Количество потоков не является целым числом"),
+        (0, ValueError, "Количество потоков должно быть положительным числом"),
+    ],
+)
+def test_invalid_max_workers(attribute: Any, expected: type[Exception], exc_message: str) -> None:
+    """Тестирование валидации количества потоков"""
+    with pytest.raises(expected, match=exc_message):
+        HeadHunterAPI(max_workers=attribute)
+
+
+@patch.object(HeadHunterAPI, "_HeadHunterAPI__connect")
+def test_get_vacancies_concurrent(mock_response: MagicMock) -> None:
+    """Тестирование параллельной загрузки страниц с сохранением порядка"""
+
+    def fake_connect(params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        page = 0 if params is None else params["page"]
+        return {"items": [{"id": str(page)}], "pages": 4}
+
+    mock_response.side_effect = fake_connect
+
+    hh_api = HeadHunterAPI(max_workers=3)
+    vacancies = hh_api.get_vacancies("python", 3)
+
+    assert [vacancy["id"] for vacancy in vacancies] == ["0", "1", "2"]
+    assert mock_response.call_count == 3
+
+
+@patch.object(HeadHunterAPI, "_HeadHunterAPI__connect")
+def test_get_vacancies_concurrent_single_page(mock_response: MagicMock) -> None:
+    """Тестирование параллельного режима, если найдена одна страница"""
+    mock_response.return_value = {"items": [{"id": "123"}], "pages": 1}
+
+    hh_api = HeadHunterAPI(max_workers=3)
+    vacancies = hh_api.get_vacancies("python")
+
+    assert vacancies == [{"id": "123"}]
+    mock_response.assert_called_once_with()
+
+
+def test_hh_api_transport() -> None:
+    """Тестирование использования переданного транспорта"""
+    transport = MagicMock()
+    transport.get.return_value.status_code = 200
+    transport.get.return_value.json.return_value = {"items": []}
+
+    hh_api = HeadHunterAPI(transport=transport)
+
+    assert hh_api.transport is transport
+    assert hh_api.connect() == {"items": []}
+    transport.get.assert_called_once_with(
+        "https://api.hh.ru/vacancies",
+        headers={"User-Agent": "HH-User-Agent"},
+        params={"text": "", "page": 0, "per_page": 100},
+    )
+
+
+@patch.object(HeadHunterAPI, "_HeadHunterAPI__connect")
+def test_iter_pages(mock_response: MagicMock) -> None:
+    """Тестирование генератора страниц: страницы запрашиваются по мере чтения"""
+    mock_response.side_effect = [{"items": [{"id": "1"}, {"id": "2"}]}, {"items": [{"id": "3"}]}, {"items": []}]
+
+    hh_api = HeadHunterAPI()
+    pages = hh_api.iter_pages("python")
+
+    assert next(pages) == [{"id": "1"}, {"id": "2"}]
+    assert mock_response.call_count == 1
+    assert list(pages) == [[{"id": "3"}]]
+    assert mock_response.call_count == 3
+
+
+@patch.object(HeadHunterAPI, "_HeadHunterAPI__connect")
+def test_iter_vacancies(mock_response: MagicMock) -> None:
+    """Тестирование генератора вакансий"""
+    mock_response.side_effect = [{"items": [{"id": "1"}, {"id": "2"}]}, {"items": [{"id": "3"}]}]
+
+    hh_api = HeadHunterAPI()
+    vacancies = hh_api.iter_vacancies("python", 2)
+
+    assert [vacancy["id"] for vacancy in vacancies] == ["1", "2", "3"]
+
+
+def test_iter_vacancy_pages() -> None:
+    """Тестирование генератора страниц экземпляров Vacancy из тела ответа"""
+    item = {
+        "name": "Python",
+        "alternate_url": "https://hh.ru/vacancy/1",
+        "salary": {"from": 100000, "to": 150000, "currency": "RUR"},
+        "experience": {"name": "Нет опыта"},
+    }
+    bodies = [json.dumps({"items": [item], "pages": 2}).encode("utf-8"), b'{"items": [], "pages": 2}']
+    transport = MagicMock()
+    transport.get.return_value.status_code = 200
+    type(transport.get.return_value).content = PropertyMock(side_effect=bodies)
+    hh_api = HeadHunterAPI(transport=transport)
+
+    pages = list(hh_api.iter_vacancy_pages("python", 5, date_from="2025-01-02T09:00:00+0300"))
+
+    assert len(pages) == 1
+    assert [(vacancy.url, vacancy.salary_from, vacancy.experience) for vacancy in pages[0]] == [
+        ("https://hh.ru/vacancy/1", 100000, "Нет опыта")
+    ]
+    transport.get.return_value.json.assert_not_called()
+    assert [call.kwargs["params"] for call in transport.get.call_args_list] == [
+        {"text": "python", "page": page, "per_page": 100, "date_from": "2025-01-02T09:00:00+0300"} for page in (0, 1)
+    ]
+
+
+def test_iter_vacancy_pages_cache(tmp_path: Path) -> None:
+    """Тестирование генератора страниц экземпляров Vacancy через кэш ответов"""
+    transport = MagicMock()
+    transport.get.return_value.status_code = 200
+    transport.get.return_value.content = b'{"items": [{"name": "Python", "alternate_url": "https://hh.ru/vacancy/1"}]}'
+    transport.get.return_value.headers = {}
+    hh_api = HeadHunterAPI(transport=transport, cache=ResponseCache(tmp_path / "cache.sqlite3"))
+
+    first = list(hh_api.iter_vacancy_pages("python", 1))
+    second = list(hh_api.iter_vacancy_pages("python", 1))
+
+    assert [vacancy.url for vacancy in first[0]] == ["https://hh.ru/vacancy/1"]
+    assert [vacancy.url for vacancy in second[0]] == ["https://hh.ru/vacancy/1"]
+    transport.get.assert_called_once()
+
+
+@patch.object(HeadHunterAPI, "_HeadHunterAPI__connect")
+def test_iter_pages_concurrent(mock_response: MagicMock) -> None:
+    """Тестирование параллельного генератора страниц с ограниченным числом загрузок"""
+
+    def fake_connect(params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        page = 0 if params is None else params["page"]
+        return {"items": [{"id": str(page)}], "pages": 10}
+
+    mock_response.side_effect = fake_connect
+
+    hh_api = HeadHunterAPI(max_workers=2)
+    pages = list(hh_api.iter_pages("python", 5))
+
+    assert pages == [[{"id": "0"}], [{"id": "1"}], [{"id": "2"}], [{"id": "3"}], [{"id": "4"}]]
+
+
+def test_connect_cache(tmp_path: Path) -> None:
+    """Тестирование кэша: повторный запрос не обращается к сети"""
+    transport = MagicMock()
+    transport.get.return_value.status_code = 200
+    transport.get.return_value.content = b'{"items": [{"id": "123"}]}'
+    transport.get.return_value.headers = {"ETag": '"v1"'}
+    cache = ResponseCache(tmp_path / "cache.sqlite3")
+
+    hh_api = HeadHunterAPI(transport=transport, cache=cache)
+
+    assert hh_api.connect() == {"items": [{"id": "123"}]}
+    assert hh_api.connect() == {"items": [{"id": "123"}]}
+    transport.get.assert_called_once()
+    assert cache.stats["hits"] == 1
+    assert cache.stats["misses"] == 1
+
+
+def test_connect_cache_revalidation(tmp_path: Path) -> None:
+    """Тестирование кэша: устаревшая запись проверяется условным запросом"""
+    transport = MagicMock()
+    cache = ResponseCache(tmp_path / "cache.sqlite3", ttl=0)
+    hh_api = HeadHunterAPI(transport=transport, cache=cache)
+    cache.set(cache.make_key("https://api.hh.ru/vacancies", {"text": "", "page": 0, "per_page": 100}), b"{}", '"v1"')
+    transport.get.return_value.status_code = 304
+
+    assert hh_api.connect() == {}
+    transport.get.assert_called_once_with(
+        "https://api.hh.ru/vacancies",
+        headers={"User-Agent": "HH-User-Agent", "If-None-Match": '"v1"'},
+        params={"text": "", "page": 0, "per_page": 100},
+    )
+    assert cache.stats["revalidations"] == 1
+
+
+def test_connect_cache_error(tmp_path: Path) -> None:
+    """Тестирование кэша: ошибка статуса не сохраняется"""
+    transport = MagicMock()
+    transport.get.return_value.status_code = 500
+    transport.get.return_value.text = "error"
+    cache = ResponseCache(tmp_path / "cache.sqlite3")
+    hh_api = HeadHunterAPI(transport=transport, cache=cache)
+
+    with pytest.raises(APIError, match="Ошибка API: 500 - error"):
+        hh_api.connect()
+    assert cache.stats["size_bytes"] == 0
+
+
+@patch.object(HeadHunterAPI, "_HeadHunterAPI__connect")
+def test_search_many(mock_response: MagicMock) -> None:
+    """Тестирование поиска по нескольким ключевым словам с удалением повторов"""
+    pages = {
+        ("python", 0): {"items": [{"id": "1"}, {"id": "2"}], "pages": 2},
+        ("python", 1): {"items": [{"id": "3"}], "pages": 2},
+        ("django", 0): {"items": [{"id": "2"}, {"id": "4"}, {"name": "без id"}], "pages": 1},
+    }
+    mock_response.side_effect = lambda params: pages[(params["text"], params["page"])]
+
+    hh_api = HeadHunterAPI(max_workers=2)
+    vacancies, counts = hh_api.search_many(["python", "django", "python"])
+
+    assert vacancies == [{"id": "1"}, {"id": "2"}, {"id": "3"}, {"id": "4"}, {"name": "без id"}]
+    assert counts == {"python": {"total": 3, "new": 3}, "django": {"total": 3, "new": 2}}
+    assert mock_response.call_count == 3
+
+
+def test_search_many_empty() -> None:
+    """Тестирование поиска без ключевых слов"""
+    hh_api = HeadHunterAPI()
+    assert hh_api.search_many([]) == ([], {})
+
+
+@patch.object(HeadHunterAPI, "_HeadHunterAPI__connect")
+def test_get_all_vacancies_sliced(mock_response: MagicMock) -> None:
+    """Тестирование разбиения запроса на интервалы дат при found > 2000"""
+    date_from = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    date_to = datetime(2025, 1, 5, tzinfo=timezone.utc)
+    # 1000 вакансий в сутки: 4 дня не помещаются в 2000, 2 дня - помещаются
+    found_by_window = {4: 4000, 2: 2000}
+
+    def fake_connect(params: Dict[str, Any]) -> Dict[str, Any]:
+        start = datetime.strptime(params["date_from"], "%Y-%m-%dT%H:%M:%S%z")
+        end = datetime.strptime(params["date_to"], "%Y-%m-%dT%H:%M:%S%z")
+        found = found_by_window[(end - start).days]
+        page = params["page"]
+        return {"items": [{"id": f"{start.day}-{page}"}, {"id": "shared"}], "found": found, "pages": 2}
+
+    mock_response.side_effect = fake_connect
+
+    hh_api = HeadHunterAPI(max_workers=2)
+    vacancies = hh_api.get_all_vacancies("python", date_from, date_to)
+
+    assert [vacancy["id"] for vacancy in vacancies] == ["3-0", "shared", "3-1", "1-0", "1-1"]
+    # 1 запрос всего интервала + 2 запроса половин + по 1 второй странице на каждую половину
+    assert mock_response.call_count == 5
+
+
+@patch.object(HeadHunterAPI, "_HeadHunterAPI__connect")
+def test_get_all_vacancies_not_sliced(mock_response: MagicMock) -> None:
+    """Тестирование запроса, который помещается в ограничение 2000 вакансий"""
+    mock_response.return_value = {"items": [{"id": "1"}], "found": 1, "pages": 1}
+
+    hh_api = HeadHunterAPI()
+    vacancies = hh_api.get_all_vacancies("python")
+
+    assert vacancies == [{"id": "1"}]
+    params = mock_response.call_args.args[0]
+    assert params["text"] == "python"
+    assert "date_from" in params and "date_to" in params
+
+
+@patch.object(HeadHunterAPI, "_HeadHunterAPI__connect")
+def test_get_all_vacancies_min_window(mock_response: MagicMock) -> None:
+    """Тестирование, интервал меньше минимального не делится"""
+    mock_response.return_value = {"items": [{"id": "1"}], "found": 5000, "pages": 1}
+    date_to = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    hh_api = HeadHunterAPI()
+    vacancies = hh_api.get_all_vacancies("python", date_to - timedelta(seconds=30), date_to)
+
+    assert vacancies == [{"id": "1"}]
+    mock_response.assert_called_once()
+
+
+@patch.object(HeadHunterAPI, "_HeadHunterAPI__connect")
+def test_get_all_vacancies_second_window(mock_response: MagicMock) -> None:
+    """Тестирование, интервал в 1 секунду не делится даже при нулевом минимальном интервале"""
+    mock_response.return_value = {"items": [{"id": "1"}], "found": 5000, "pages": 1}
+    date_to = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    hh_api = HeadHunterAPI()
+    vacancies = hh_api.get_all_vacancies("python", date_to - timedelta(seconds=4), date_to, timedelta(0))
+
+    assert vacancies == [{"id": "1"}]
+    # 1 запрос интервала в 4 секунды + 2 запроса по 2 секунды + 4 запроса по 1 секунде
+    assert mock_response.call_count == 7
+
+
+def test_get_all_vacancies_invalid_dates() -> None:
+    """Тестирование интервала дат, где начало позже конца"""
+    hh_api = HeadHunterAPI()
+    with pytest.raises(ValueError, match="Начало интервала дат не может быть позже конца"):
+        hh_api.get_all_vacancies("python", datetime(2025, 1, 2), datetime(2025, 1, 1))
+
+
+@patch("requests.Session.get")
+def test_get_vacancies_date_from(mock_request: MagicMock) -> None:
+    """Тестирование передачи даты публикации в параметры запроса"""
+    mock_request.return_value.status_code = 200
+    mock_request.return_value.json.return_value = {"items": []}
+
+    hh_api = HeadHunterAPI()
+    hh_api.get_vacancies("python", 1, date_from="2025-01-02T09:00:00+0300")
+    assert mock_request.call_args.kwargs["params"]["date_from"] == "2025-01-02T09:00:00+0300"
+
+    hh_api.get_vacancies("python", 1)
+    assert "date_from" not in mock_request.call_args.kwargs["params"]
@@ -1,10 +1,12 @@
 import json
+import os
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, List
+from unittest.mock import patch
 
 import pytest
 
-from src.job_files import JSONSaver
+from src.job_files import JSONLinesSaver, JSONSaver, json_to_jsonlines, jsonlines_to_json
 from src.settings import BASE_DIR
 
 
@@ -54,6 +56,228 @@ def test_add_data_duplicate(json_file: Path) -> None:
     assert json_saver.read_data() == [{"name": "Python"}]
 
 
+def test_add_many(json_file: Path) -> None:
+    """Тестирование добавления многих записей без повторов"""
+    with open(json_file, "w", encoding="utf-8") as file_json:
+        json.dump([{"name": "Python", "salary": 1}], file_json, indent=4, ensure_ascii=False)
+    json_saver = JSONSaver(json_file)
+    new_data: List[Dict[str, Any]] = [
+        {"salary": 1, "name": "Python"},
+        {"name": "Java"},
+        {"name": "Java"},
+        {"name": "Go"},
+    ]
+    assert json_saver.add_many(iter(new_data)) == 2
+    assert json_saver.read_data() == [{"name": "Python", "salary": 1}, {"name": "Java"}, {"name": "Go"}]
+
+
+def test_add_many_single_write(json_file: Path) -> None:
+    """Тестирование одной записи файла на все записи, без повторного чтения неизмененного файла"""
+    json_saver = JSONSaver(json_file)
+    with patch("builtins.open", wraps=open) as mock_open:
+        json_saver.add_many({"name": str(index)} for index in range(100))
+    assert [call.args[1] for call in mock_open.call_args_list] == ["r", "x"]
+    with patch("builtins.open", wraps=open) as mock_open:
+        assert json_saver.add_many([{"name": "1"}]) == 0
+    mock_open.assert_not_called()
+    assert len(json_saver.read_data()) == 100
+
+
+def test_keyed_upsert_get(json_file: Path) -> None:
+    """Тестирование ключа записи (ссылка): повтор с другим опытом не добавляется, upsert заменяет"""
+    json_saver = JSONSaver(json_file)
+    json_saver.add_many([{"url": "1", "experience": "Нет опыта"}, {"url": "2", "experience": ""}])
+    assert json_saver.add_many([{"url": "1", "experience": "Более 6 лет"}]) == 0
+    assert json_saver.get("1") == {"url": "1", "experience": "Нет опыта"}
+
+    assert json_saver.upsert({"url": "1", "experience": "Более 6 лет"}) is False
+    assert json_saver.upsert({"url": "3", "experience": ""}) is True
+    assert JSONSaver(json_file).read_data() == [
+        {"url": "1", "experience": "Более 6 лет"},
+        {"url": "2", "experience": ""},
+        {"url": "3", "experience": ""},
+    ]
+    assert json_saver.get("100") is None
+
+
+def test_keyed_del_data(json_file: Path) -> None:
+    """Тестирование удаления по ключу записи и обновления индекса"""
+    json_saver = JSONSaver(json_file)
+    json_saver.add_many([{"url": "1", "name": "Python"}, {"url": "2", "name": "Java"}, {"url": "3", "name": "Go"}])
+    json_saver.del_data({"url": "1", "name": "Старое название"})
+    assert json_saver.get("3") == {"url": "3", "name": "Go"}
+    assert [record["url"] for record in json_saver.read_data()] == ["2", "3"]
+    assert JSONSaver(json_file, key_field="name").get("Java") == {"url": "2", "name": "Java"}
+
+
+def test_index_cache(json_file: Path) -> None:
+    """Тестирование разбора файла один раз на процесс и повторного разбора после изменения на диске"""
+    json_saver = JSONSaver(json_file)
+    json_saver.add_data({"url": "1"})
+    with patch("src.job_files.json.load", wraps=json.load) as mock_load:
+        JSONSaver(json_file).read_data()
+        json_saver.get("1")
+        mock_load.assert_not_called()
+        with open(json_file, "w", encoding="utf-8") as file_json:
+            json.dump([{"url": "1"}, {"url": "22"}], file_json)
+        assert json_saver.get("22") == {"url": "22"}
+        mock_load.assert_called_once()
+
+
+@pytest.mark.parametrize("use_mmap", [False, True])
+@pytest.mark.parametrize("chunk_size", [1, 7, 64 * 1024])
+def test_iter_data(json_file: Path, use_mmap: bool, chunk_size: int) -> None:
+    """Тестирование потокового чтения: те же записи, что и read_data, при любом размере части"""
+    test_data = [
+        {"url": "1", "name": "Разработчик Python", "salary_from": 150000, "salary_to": 0.5, "tags": [None, True]},
+        {"url": "2", "name": "Тестировщик \"QA\"", "salary_from": -12, "salary_to": 1e5, "nested": {"a": []}},
+        {},
+    ]
+    with open(json_file, "w", encoding="utf-8") as file_json:
+        json.dump(test_data, file_json, indent=4, ensure_ascii=False)
+    json_saver = JSONSaver(json_file)
+    assert list(json_saver.iter_data(use_mmap=use_mmap, chunk_size=chunk_size)) == json_saver.read_data()
+
+
+@pytest.mark.parametrize("use_mmap", [False, True])
+@pytest.mark.parametrize("content", ["", "   ", "[]", " [ ] ", '{"url": "1"}', "null"])
+def test_iter_data_empty(json_file: Path, use_mmap: bool, content: str) -> None:
+    """Тестирование потокового чтения пустого файла и файла не с массивом записей"""
+    with open(json_file, "w", encoding="utf-8") as file_json:
+        file_json.write(content)
+    assert list(JSONSaver(json_file).iter_data(use_mmap=use_mmap, chunk_size=2)) == []
+
+
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_iter_data_missing_file(tmp_path: Path, use_mmap: bool) -> None:
+    """Тестирование потокового чтения отсутствующего файла"""
+    assert list(JSONSaver(tmp_path / "missing.json").iter_data(use_mmap=use_mmap)) == []
+
+
+@pytest.mark.parametrize("content", ['[{"url": "1"}, {"url": ', '[{"url": "1"} {"url": "2"}]', '[{"url": "1"},'])
+def test_iter_data_error(json_file: Path, content: str) -> None:
+    """Тестирование ошибки потокового чтения поврежденного файла после уже прочитанных записей"""
+    with open(json_file, "w", encoding="utf-8") as file_json:
+        file_json.write(content)
+    records = JSONSaver(json_file).iter_data(chunk_size=3)
+    assert next(records) == {"url": "1"}
+    with pytest.raises(json.JSONDecodeError):
+        next(records)
+
+
+def test_iter_data_chunk_size(json_file: Path) -> None:
+    """Тестирование проверки размера части"""
+    with pytest.raises(ValueError):
+        next(JSONSaver(json_file).iter_data(chunk_size=0))
+
+
+def test_save_atomic(json_file: Path) -> None:
+    """Тестирование атомарной записи: ошибка во время записи не портит файл и не оставляет временных файлов"""
+    json_saver = JSONSaver(json_file)
+    json_saver.add_data({"url": "1"})
+    with patch("src.job_files.json.dump", side_effect=OSError("Нет места на диске")):
+        with pytest.raises(OSError):
+            json_saver.add_data({"url": "2"})
+    assert json_saver.read_data() == [{"url": "1"}]
+    assert JSONSaver(json_file).get("2") is None
+    assert list(json_file.parent.glob(f"{json_file.name}.*.tmp")) == []
+
+
+@pytest.mark.parametrize("fsync, calls", [(False, 0), (True, 2)])
+def test_save_fsync(json_file: Path, fsync: bool, calls: int) -> None:
+    """Тестирование сброса файла и папки на диск"""
+    with patch("src.job_files.os.fsync") as mock_fsync:
+        JSONSaver(json_file, fsync=fsync).add_data({"url": "1"})
+    assert mock_fsync.call_count == calls
+
+
+def test_buffered_flush_on_exit(json_file: Path) -> None:
+    """Тестирование буферизованной сессии: изменения видны в сессии, файл записывается один раз на выходе"""
+    json_saver = JSONSaver(json_file)
+    json_saver.add_data({"url": "1", "name": "Python"})
+    with patch("builtins.open", wraps=open) as mock_open:
+        with json_saver.buffered() as session:
+            session.add_many([{"url": "2"}, {"url": "3"}])
+            session.upsert({"url": "1", "name": "Java"})
+            session.del_data({"url": "3"})
+            session.add_data({"url": "4"})
+            assert [record["url"] for record in session.read_data()] == ["1", "2", "4"]
+            assert [record["url"] for record in session.iter_data()] == ["1", "2", "4"]
+            assert session.get("1") == {"url": "1", "name": "Java"}
+            assert JSONSaver(json_file).read_data() == [{"url": "1", "name": "Python"}]
+            mock_open.assert_not_called()
+        assert [call.args[1] for call in mock_open.call_args_list] == ["x"]
+    with open(json_file, "r", encoding="utf-8") as file_json:
+        assert json.load(file_json) == [{"url": "1", "name": "Java"}, {"url": "2"}, {"url": "4"}]
+
+
+def test_buffered_flush_on_size(json_file: Path) -> None:
+    """Тестирование записи файла по количеству изменений"""
+    json_saver = JSONSaver(json_file)
+    with json_saver.buffered(max_pending=2):
+        json_saver.add_data({"url": "1"})
+        assert not json_file.exists()
+        json_saver.add_data({"url": "2"})
+        assert len(JSONSaver(json_file).read_data()) == 2
+        json_saver.add_data({"url": "3"})
+        assert len(JSONSaver(json_file).read_data()) == 2
+    assert len(JSONSaver(json_file).read_data()) == 3
+
+
+def test_buffered_flush_on_time(json_file: Path) -> None:
+    """Тестирование записи файла по времени с первого незаписанного изменения"""
+    json_saver = JSONSaver(json_file)
+    with patch("src.job_files.time.monotonic", side_effect=[100.0, 100.0, 101.0, 106.0]):
+        with json_saver.buffered(max_delay=5.0):
+            json_saver.add_data({"url": "1"})
+            json_saver.add_data({"url": "2"})
+            assert not json_file.exists()
+            json_saver.add_data({"url": "3"})
+            assert len(JSONSaver(json_file).read_data()) == 3
+
+
+def test_buffered_flush_on_error(json_file: Path) -> None:
+    """Тестирование записи накопленных изменений при выходе из сессии по исключению и явного flush"""
+    json_saver = JSONSaver(json_file)
+    with pytest.raises(RuntimeError):
+        with json_saver.buffered():
+            json_saver.add_data({"url": "1"})
+            with json_saver.buffered():
+                json_saver.add_data({"url": "2"})
+            assert not json_file.exists()
+            json_saver.flush()
+            assert len(JSONSaver(json_file).read_data()) == 2
+            json_saver.add_data({"url": "3"})
+            raise RuntimeError
+    assert len(JSONSaver(json_file).read_data()) == 3
+
+
+@pytest.mark.parametrize("max_pending, max_delay", [(0, 1.0), (1, -1.0)])
+def test_buffered_invalid(json_file: Path, max_pending: int, max_delay: float) -> None:
+    """Тестирование проверки параметров буферизованной сессии"""
+    with pytest.raises(ValueError):
+        with JSONSaver(json_file).buffered(max_pending, max_delay):
+            pass
+
+
+def test_records_not_shared(json_file: Path) -> None:
+    """Тестирование, изменение полученной или сохраненной записи не меняет данные других экземпляров"""
+    record = {"url": "1", "name": "A", "tags": ["python"]}
+    json_saver = JSONSaver(json_file)
+    json_saver.add_data(record)
+    record["name"] = "MUTATED"
+    json_saver.get("1")["name"] = "MUTATED"  # type: ignore[index]
+    json_saver.read_data()[0]["tags"].append("MUTATED")
+    with json_saver.buffered():
+        json_saver.upsert({"url": "2", "name": "B"})
+        next(json_saver.iter_data())["name"] = "MUTATED"
+    assert JSONSaver(json_file).get("1") == {"url": "1", "name": "A", "tags": ["python"]}
+    assert JSONSaver(json_file).read_data() == [
+        {"url": "1", "name": "A", "tags": ["python"]},
+        {"url": "2", "name": "B"},
+    ]
+
+
 def test_del_data(json_file: Path) -> None:
     """Тестирование удаление данных из файла"""
     test_data = [{"name": "Python"}]
@@ -73,3 +297,144 @@ def test_del_data_not_found(json_file: Path, capsys: pytest.CaptureFixture) -> N
     json_saver.del_data({"name": "Python"})
     message = capsys.readouterr()
     assert message.out.strip() == "Вакансия не найдена"
+
+
+@pytest.fixture
+def jsonl_saver(tmp_path: Path) -> JSONLinesSaver:
+    saver = JSONLinesSaver(tmp_path / "vacancies.jsonl")
+    saver.add_many([{"url": "1", "name": "Python"}, {"url": "2", "name": "Java"}, {"url": "1", "name": "Copy"}])
+    return saver
+
+
+def test_jsonl_add_many(jsonl_saver: JSONLinesSaver) -> None:
+    """Тестирование добавления записей в конец файла без повторов по ключу"""
+    jsonl_saver.add_data({"url": "2", "name": "Java 2"})
+    jsonl_saver.add_data({"url": "3", "name": "Go"})
+    assert [record["name"] for record in jsonl_saver.read_data()] == ["Python", "Java", "Go"]
+    assert jsonl_saver.file_path.read_text(encoding="utf-8").count("\n") == 3
+    assert len(jsonl_saver.index_path.read_bytes().splitlines()) == 3
+
+
+def test_jsonl_append_only(jsonl_saver: JSONLinesSaver) -> None:
+    """Тестирование дозаписи: уже записанные строки не перезаписываются"""
+    before = jsonl_saver.file_path.read_bytes()
+    jsonl_saver.add_data({"url": "3", "name": "Go"})
+    assert jsonl_saver.file_path.read_bytes().startswith(before)
+
+
+def test_jsonl_get(jsonl_saver: JSONLinesSaver) -> None:
+    """Тестирование получения записи по ключу чтением одной строки"""
+    with patch("src.job_files.json.loads", wraps=json.loads) as mock_loads:
+        assert jsonl_saver.get("2") == {"url": "2", "name": "Java"}
+    mock_loads.assert_called_once()
+    assert jsonl_saver.get("100") is None
+
+
+def test_jsonl_del_data(jsonl_saver: JSONLinesSaver, capsys: pytest.CaptureFixture) -> None:
+    """Тестирование удаления записью-надгробием и повторного добавления"""
+    jsonl_saver.del_data({"url": "1"})
+    assert jsonl_saver.read_data() == [{"url": "2", "name": "Java"}]
+    assert jsonl_saver.get("1") is None
+    jsonl_saver.del_data({"url": "1"})
+    assert capsys.readouterr().out == "Вакансия не найдена\n"
+    jsonl_saver.add_data({"url": "1", "name": "Python 2"})
+    assert jsonl_saver.read_data() == [{"url": "2", "name": "Java"}, {"url": "1", "name": "Python 2"}]
+
+
+def test_jsonl_compact(jsonl_saver: JSONLinesSaver) -> None:
+    """Тестирование перезаписи файла без удаленных записей"""
+    jsonl_saver.del_data({"url": "1"})
+    jsonl_saver.compact()
+    assert jsonl_saver.file_path.read_text(encoding="utf-8").count("\n") == 1
+    assert jsonl_saver.get("2") == {"url": "2", "name": "Java"}
+    assert JSONLinesSaver(jsonl_saver.file_path).read_data() == [{"url": "2", "name": "Java"}]
+
+
+def test_jsonl_rebuild_index(jsonl_saver: JSONLinesSaver) -> None:
+    """Тестирование построения индекса по файлу данных: без индекса, с поврежденным и отстающим индексом"""
+    jsonl_saver.del_data({"url": "2"})
+    jsonl_saver.index_path.unlink()
+    assert JSONLinesSaver(jsonl_saver.file_path).get("1") == {"url": "1", "name": "Python"}
+    assert JSONLinesSaver(jsonl_saver.file_path).get("2") is None
+
+    jsonl_saver.index_path.write_text("broken", encoding="utf-8")
+    assert JSONLinesSaver(jsonl_saver.file_path).read_data() == [{"url": "1", "name": "Python"}]
+
+    with open(jsonl_saver.file_path, "a", encoding="utf-8") as data_file:
+        data_file.write('{"url": "5", "name": "Rust"}\n{"url": "6", "na')
+    saver = JSONLinesSaver(jsonl_saver.file_path)
+    assert saver.get("5") == {"url": "5", "name": "Rust"}
+    assert saver.get("6") is None
+
+
+@pytest.mark.parametrize("partial", ['{"url": "u2"', '{"url": "u2"}', "{" * (64 * 1024 + 10)])
+def test_jsonl_append_after_partial_line(tmp_path: Path, partial: str) -> None:
+    """Тестирование дозаписи после недописанной последней строки (сбой записи): строка отрезается"""
+    saver = JSONLinesSaver(tmp_path / "vacancies.jsonl")
+    saver.add_data({"url": "u1"})
+    with open(saver.file_path, "a", encoding="utf-8") as data_file:
+        data_file.write(partial)
+    saver.add_data({"url": "u3"})
+    with open(saver.file_path, "a", encoding="utf-8") as data_file:
+        data_file.write(partial)
+    JSONLinesSaver(saver.file_path).add_data({"url": "u4"})
+    expected = [{"url": "u1"}, {"url": "u3"}, {"url": "u4"}]
+    assert saver.read_data() == expected
+    assert JSONLinesSaver(saver.file_path).get("u3") == {"url": "u3"}
+    saver.index_path.unlink()
+    assert JSONLinesSaver(saver.file_path).read_data() == expected
+    saver.compact()
+    assert JSONLinesSaver(saver.file_path).read_data() == expected
+
+
+def test_jsonl_compact_by_other_saver(tmp_path: Path) -> None:
+    """Тестирование перезагрузки индекса после compact и дозаписи в другом экземпляре (файл заменен)"""
+    saver_a = JSONLinesSaver(tmp_path / "vacancies.jsonl")
+    saver_a.add_many({"url": f"https://hh.ru/vacancy/{index}"} for index in range(5))
+    saver_a.del_data({"url": "https://hh.ru/vacancy/0"})
+    saver_a.del_data({"url": "https://hh.ru/vacancy/1"})
+    size_before = saver_a.file_path.stat().st_size
+    saver_b = JSONLinesSaver(saver_a.file_path)
+    saver_b.compact()
+    saver_b.add_many(
+        {"url": f"https://hh.ru/vacancy/{index}", "name": "Python-разработчик"} for index in range(10, 14)
+    )
+    assert saver_a.file_path.stat().st_size > size_before
+    assert saver_a.get("https://hh.ru/vacancy/3") == {"url": "https://hh.ru/vacancy/3"}
+    assert saver_a.get("https://hh.ru/vacancy/13") == {"url": "https://hh.ru/vacancy/13", "name": "Python-разработчик"}
+    assert saver_a.read_data() == saver_b.read_data()
+    assert len(saver_a.read_data()) == 7
+
+
+def test_jsonl_rewritten_same_size(tmp_path: Path) -> None:
+    """Тестирование перезагрузки индекса после перезаписи файла без изменения размера"""
+    saver = JSONLinesSaver(tmp_path / "vacancies.jsonl")
+    saver.add_many([{"url": "1", "name": "A"}, {"url": "2", "name": "B"}])
+    assert saver.get("1") == {"url": "1", "name": "A"}
+    os.utime(saver.file_path, ns=(0, 0))
+    with open(saver.file_path, "r+b") as data_file:
+        data_file.write(b'{"url": "3", "name": "A"}\n')
+    saver.index_path.unlink()
+    assert saver.get("1") is None
+    assert saver.get("3") == {"url": "3", "name": "A"}
+
+
+def test_jsonl_missing_file(tmp_path: Path) -> None:
+    """Тестирование чтения несуществующего файла"""
+    saver = JSONLinesSaver(tmp_path / "missing.jsonl")
+    assert saver.read_data() == []
+    assert saver.get("1") is None
+    assert saver.record_key({"name": "Python"}) == JSONSaver(tmp_path / "missing.json").record_key({"name": "Python"})
+
+
+def test_json_jsonlines_conversion(tmp_path: Path) -> None:
+    """Тестирование перевода между форматами JSON и JSON Lines"""
+    data = [{"url": "1", "name": "Python"}, {"url": "2", "name": "Java"}]
+    JSONSaver(tmp_path / "data.json").add_many(data)
+
+    assert json_to_jsonlines(tmp_path / "data.json", tmp_path / "data.jsonl") == 2
+    assert json_to_jsonlines(tmp_path / "data.json", tmp_path / "data.jsonl") == 2
+    assert JSONLinesSaver(tmp_path / "data.jsonl").read_data() == data
+
+    assert jsonlines_to_json(tmp_path / "data.jsonl", tmp_path / "copy.json") == 2
+    assert JSONSaver(tmp_path / "copy.json").read_data() == data
@@ -0,0 +1,25 @@
+from unittest.mock import patch
+
+import pytest
+
+from src import json_codec
+
+
+@pytest.mark.parametrize("data", [b'{"a": [1, 2]}', '{"a": [1, 2]}', memoryview(b'{"a": [1, 2]}')])
+def test_loads(data: bytes) -> None:
+    """Тестирование разбора JSON из байтов и строки"""
+    assert json_codec.loads(data) == {"a": [1, 2]}
+
+
+@patch.object(json_codec, "orjson", None)
+@pytest.mark.parametrize("data", [b'{"a": 1}', memoryview(b'{"a": 1}')])
+def test_loads_fallback(data: bytes) -> None:
+    """Тестирование разбора стандартным json без orjson"""
+    assert json_codec.loads(data) == {"a": 1}
+
+
+@pytest.mark.parametrize("data", [b"", b"{", "not json"])
+def test_loads_invalid(data: bytes) -> None:
+    """Тестирование некорректного JSON"""
+    with pytest.raises(ValueError):
+        json_codec.loads(data)
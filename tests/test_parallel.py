@@ -0,0 +1,64 @@
+from typing import Any, Dict, List
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.parallel import cast_to_object_list_parallel
+from src.vacancies import Vacancy
+
+
+@pytest.fixture
+def raw_vacancies() -> List[Dict[str, Any]]:
+    return [
+        {
+            "name": f"Python Developer {index}",
+            "alternate_url": f"https://hh.ru/vacancy/{index}",
+            "salary": {"from": 1000 + index, "to": None, "currency": "USD" if index % 3 == 0 else "RUR"},
+            "experience": {"name": "Нет опыта"},
+        }
+        for index in range(1, 11)
+    ]
+
+
+def test_parallel_keeps_order(raw_vacancies: List[Dict[str, Any]]) -> None:
+    """Тестирование обработки в процессах: результат совпадает с последовательной обработкой и порядком"""
+    result = cast_to_object_list_parallel(raw_vacancies, chunk_size=3, workers=2, min_parallel_size=0)
+    expected = Vacancy.cast_to_object_list(raw_vacancies)
+    assert [vacancy.to_dict() for vacancy in result] == [vacancy.to_dict() for vacancy in expected]
+    assert [vacancy.url for vacancy in result] == [f"https://hh.ru/vacancy/{index}" for index in range(1, 11)]
+
+
+def test_parallel_converter(raw_vacancies: List[Dict[str, Any]]) -> None:
+    """Тестирование перевода в рубли: курсы запрашиваются один раз в текущем процессе"""
+    converter = MagicMock()
+    converter.get_rates_in_rub.return_value = {"USD": 100.0}
+
+    result = cast_to_object_list_parallel(raw_vacancies, converter, chunk_size=4, workers=2, min_parallel_size=0)
+
+    converter.get_rates_in_rub.assert_called_once_with({"USD"})
+    assert result[2].salary_from == 100300
+    assert (result[2].currency, result[2].salary_from_original) == ("USD", 1003)
+    assert result[0].salary_from == 1001
+
+
+@patch("src.parallel.ProcessPoolExecutor")
+def test_parallel_serial_fallback(mock_executor: MagicMock, raw_vacancies: List[Dict[str, Any]]) -> None:
+    """Тестирование обработки небольших списков в текущем процессе"""
+    assert len(cast_to_object_list_parallel(iter(raw_vacancies), chunk_size=3)) == 10
+    assert len(cast_to_object_list_parallel(raw_vacancies, chunk_size=3, workers=1, min_parallel_size=0)) == 10
+    assert cast_to_object_list_parallel([], min_parallel_size=0) == []
+    mock_executor.assert_not_called()
+
+
+def test_parallel_invalid_data(raw_vacancies: List[Dict[str, Any]]) -> None:
+    """Тестирование ошибки валидации в одной из частей"""
+    raw_vacancies[7]["alternate_url"] = "https://example.com"
+    with pytest.raises(ValueError, match="Ссылка не подходит под формат"):
+        cast_to_object_list_parallel(raw_vacancies, chunk_size=3, workers=2, min_parallel_size=0)
+
+
+@pytest.mark.parametrize("chunk_size, workers", [(0, None), (10, 0)])
+def test_parallel_invalid_params(chunk_size: int, workers: int) -> None:
+    """Тестирование некорректных параметров"""
+    with pytest.raises(ValueError):
+        cast_to_object_list_parallel([], chunk_size=chunk_size, workers=workers)
@@ -0,0 +1,76 @@
+from typing import List
+from unittest.mock import patch
+
+import pytest
+
+from src.ranking import TopRanker, experience_key, rank_top, salary_key
+from src.vacancies import Vacancy
+
+
+@pytest.fixture
+def ranked_vacancies() -> List[Vacancy]:
+    return [
+        Vacancy("Junior", "https://hh.ru/vacancy/1", 100000, 100000, "Нет опыта"),
+        Vacancy("Middle", "https://hh.ru/vacancy/2", 200000, 200000, "От 1 года до 3 лет"),
+        Vacancy("Senior", "https://hh.ru/vacancy/3", 200000, 200000, "Более 6 лет"),
+        Vacancy("Lead", "https://hh.ru/vacancy/4", 300000, None, "От 3 до 6 лет"),
+        Vacancy("Стажер", "https://hh.ru/vacancy/5", experience=""),
+    ]
+
+
+def names(vacancies: List[Vacancy]) -> List[str]:
+    return [vacancy.name for vacancy in vacancies]
+
+
+def test_rank_top_salary(ranked_vacancies: List[Vacancy]) -> None:
+    """Тестирование топа по зарплате с сохранением порядка при равных ключах"""
+    assert names(rank_top(ranked_vacancies, 3)) == ["Lead", "Middle", "Senior"]
+    assert names(rank_top(ranked_vacancies, 3)) == names(sorted(ranked_vacancies, reverse=True)[:3])
+
+
+def test_rank_top_multi_key(ranked_vacancies: List[Vacancy]) -> None:
+    """Тестирование ранжирования по нескольким ключам (зарплата, затем опыт)"""
+    assert names(rank_top(ranked_vacancies, 3, keys=(salary_key, experience_key))) == ["Lead", "Senior", "Middle"]
+    assert names(rank_top(ranked_vacancies, 2, keys=(experience_key,))) == ["Senior", "Lead"]
+
+
+def test_rank_top_stream(ranked_vacancies: List[Vacancy]) -> None:
+    """Тестирование ранжирования потока вакансий из генератора"""
+    ranker = TopRanker(2)
+    ranker.extend(vacancy for vacancy in ranked_vacancies)
+    assert len(ranker) == 5
+    assert names(ranker.result()) == ["Lead", "Middle"]
+
+
+def test_rank_top_key_computed_once(ranked_vacancies: List[Vacancy]) -> None:
+    """Тестирование однократного расчета средней зарплаты на вакансию"""
+    with patch.object(Vacancy, "salary_average", autospec=True, side_effect=lambda self: 1) as mock_average:
+        rank_top(ranked_vacancies, 2)
+    assert mock_average.call_count == len(ranked_vacancies)
+
+
+def test_rank_top_lenient_and_strict(ranked_vacancies: List[Vacancy]) -> None:
+    """Тестирование режима "вернуть сколько есть" и строгого режима"""
+    assert len(rank_top(ranked_vacancies, 10)) == 5
+    assert rank_top([], 3) == []
+    assert rank_top(ranked_vacancies, 0) == []
+    with pytest.raises(ValueError, match="В списке вакансий меньше чем необходимо"):
+        rank_top(ranked_vacancies, 10, strict=True)
+
+
+@pytest.mark.parametrize(
+    "kwargs, exc_message",
+    [
+        ({"top_n": -1}, "Количество вакансий в топе не может быть отрицательным"),
+        ({"top_n": 1, "keys": ()}, "Не указан ни один ключ ранжирования"),
+    ],
+)
+def test_ranker_init_error(kwargs: dict, exc_message: str) -> None:
+    """Тестирование инициализации с некорректными параметрами"""
+    with pytest.raises(ValueError, match=exc_message):
+        TopRanker(**kwargs)
+
+
+def test_experience_key_unknown() -> None:
+    """Тестирование ключа опыта для неизвестного значения"""
+    assert experience_key(Vacancy("Python", "https://hh.ru/vacancy/1", experience="От 3 лет")) == -1
@@ -0,0 +1,95 @@
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.rate_limiter import RateLimiter, get_rate_limiter
+
+
+@pytest.mark.parametrize(
+    "kwargs, exc_message",
+    [
+        ({"rate": 0}, "Скорость должна быть положительным числом"),
+        ({"rate": 1, "decrease_factor": 1}, "Множитель уменьшения скорости должен быть от 0 до 1"),
+        ({"rate": 1, "capacity": 0.5}, "Некорректная емкость или границы скорости"),
+        ({"rate": 1, "max_rate": 0.5}, "Некорректная емкость или границы скорости"),
+    ],
+)
+def test_rate_limiter_init_error(kwargs: dict, exc_message: str) -> None:
+    """Тестирование инициализации класса с некорректными параметрами"""
+    with pytest.raises(ValueError, match=exc_message):
+        RateLimiter(**kwargs)
+
+
+@patch("src.rate_limiter.time.sleep")
+@patch("src.rate_limiter.time.monotonic")
+def test_acquire_burst_then_wait(mock_monotonic: MagicMock, mock_sleep: MagicMock) -> None:
+    """Тестирование "всплеска" в пределах емкости и ожидания после него"""
+    clock = [100.0]
+    mock_monotonic.side_effect = lambda: clock[0]
+    mock_sleep.side_effect = lambda delay: clock.__setitem__(0, clock[0] + delay)
+    rate_limiter = RateLimiter(rate=2, capacity=2)
+
+    assert rate_limiter.acquire() == 0
+    assert rate_limiter.acquire() == 0
+    assert rate_limiter.acquire() == pytest.approx(0.5)
+    mock_sleep.assert_called_once_with(pytest.approx(0.5))
+
+
+@patch("src.rate_limiter.time.monotonic", return_value=0.0)
+def test_throttle_and_recover(mock_monotonic: MagicMock) -> None:
+    """Тестирование уменьшения скорости при 429 и постепенного восстановления"""
+    rate_limiter = RateLimiter(rate=10, min_rate=2, increase_step=1)
+
+    rate_limiter.on_throttle()
+    assert rate_limiter.rate == 5
+    rate_limiter.on_throttle()
+    rate_limiter.on_throttle()
+    assert rate_limiter.rate == 2
+
+    for _ in range(20):
+        rate_limiter.on_success()
+    assert rate_limiter.rate == 10
+
+
+@patch("src.rate_limiter.time.sleep")
+@patch("src.rate_limiter.time.monotonic", return_value=0.0)
+def test_throttle_drops_tokens(mock_monotonic: MagicMock, mock_sleep: MagicMock) -> None:
+    """Тестирование сгорания накопленных запросов при 429"""
+    rate_limiter = RateLimiter(rate=10)
+    mock_sleep.side_effect = lambda delay: mock_monotonic.configure_mock(return_value=mock_monotonic() + delay)
+
+    rate_limiter.on_throttle()
+
+    assert rate_limiter.acquire() == pytest.approx(0.2)
+
+
+def test_shared_state_file(tmp_path: Path) -> None:
+    """Тестирование общего состояния ограничителей через файл"""
+    lock_path = tmp_path / "limits" / "hh.json"
+    first = RateLimiter(rate=10, lock_path=lock_path)
+    second = RateLimiter(rate=10, lock_path=lock_path)
+
+    first.on_throttle()
+
+    assert lock_path.exists()
+    assert second.rate == 5
+
+
+def test_acquire_threads() -> None:
+    """Тестирование ограничителя из нескольких потоков"""
+    rate_limiter = RateLimiter(rate=1000, capacity=50)
+    threads = [threading.Thread(target=rate_limiter.acquire) for _ in range(50)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert rate_limiter.acquire() >= 0
+
+
+def test_get_rate_limiter_shared() -> None:
+    """Тестирование общего для процесса ограничителя по имени"""
+    rate_limiter = get_rate_limiter("test.example.com", 5)
+    assert get_rate_limiter("test.example.com", 1) is rate_limiter
+    assert rate_limiter.max_rate == 5
@@ -0,0 +1,83 @@
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+import pytest
+
+from src.sqlite_saver import SQLiteSaver
+from src.utils import get_top_vacancies, get_vacancies_by_salary
+from src.vacancies import Vacancy
+
+
+@pytest.fixture
+def records() -> List[Dict[str, Any]]:
+    return [
+        {
+            "name": "Python",
+            "url": "https://hh.ru/vacancy/1",
+            "salary_from": 100000,
+            "salary_to": 150000,
+            "experience": "Нет опыта",
+        },
+        {"name": "Java", "url": "https://hh.ru/vacancy/2", "salary_from": 0, "salary_to": 90000, "experience": ""},
+        {"name": "Go", "url": "https://hh.ru/vacancy/3", "salary_from": 200000, "salary_to": 0, "experience": ""},
+        {"name": "QA", "url": "https://hh.ru/vacancy/4", "salary_from": 0, "salary_to": 0, "experience": ""},
+        {
+            "name": "Rust",
+            "url": "https://hh.ru/vacancy/5",
+            "salary_from": 125000,
+            "salary_to": 125000,
+            "experience": "",
+        },
+    ]
+
+
+@pytest.fixture
+def saver(tmp_path: Path, records: List[Dict[str, Any]]) -> Iterator[SQLiteSaver]:
+    with SQLiteSaver(tmp_path / "vacancies.db", batch_size=2) as sqlite_saver:
+        sqlite_saver.add_many(records)
+        yield sqlite_saver
+
+
+def test_sqlite_init(saver: SQLiteSaver) -> None:
+    """Тестирование режима WAL и индексов по зарплате"""
+    connection = sqlite3.connect(saver.db_path)
+    assert connection.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+    indexes = {row[1] for row in connection.execute("PRAGMA index_list(vacancies)")}
+    assert {"idx_vacancies_salary_from", "idx_vacancies_salary_to", "idx_vacancies_salary_average"} <= indexes
+    connection.close()
+    with pytest.raises(ValueError):
+        SQLiteSaver(saver.db_path, batch_size=0)
+
+
+def test_sqlite_add_many(saver: SQLiteSaver, records: List[Dict[str, Any]]) -> None:
+    """Тестирование добавления пачками без повторов по ключу"""
+    assert saver.read_data() == records
+    assert saver.add_many([{**records[0], "experience": "Более 6 лет"}, {"url": "https://hh.ru/vacancy/6"}]) == 1
+    saver.add_data({"url": "https://hh.ru/vacancy/6", "name": "Повтор"})
+    assert len(saver.read_data()) == 6
+    assert saver.get("https://hh.ru/vacancy/1") == records[0]
+    assert saver.get("https://hh.ru/vacancy/100") is None
+
+
+def test_sqlite_upsert_del(saver: SQLiteSaver, records: List[Dict[str, Any]], capsys: pytest.CaptureFixture) -> None:
+    """Тестирование замены и удаления записи по ключу"""
+    saver.upsert({**records[1], "salary_from": 500000})
+    assert saver.get_top(1) == [{**records[1], "salary_from": 500000}]
+    saver.del_data({"url": "https://hh.ru/vacancy/2"})
+    assert saver.get("https://hh.ru/vacancy/2") is None
+    saver.del_data({"url": "https://hh.ru/vacancy/2"})
+    assert capsys.readouterr().out == "Вакансия не найдена\n"
+
+
+def test_sqlite_salary_queries(saver: SQLiteSaver, records: List[Dict[str, Any]]) -> None:
+    """Тестирование фильтра и топа в SQL: результат как у get_vacancies_by_salary и get_top_vacancies"""
+    vacancies = Vacancy.from_trusted_dicts(records)
+    expected_range = [vacancy.to_dict() for vacancy in get_vacancies_by_salary(vacancies, 90000, 130000)]
+    assert saver.get_by_salary(90000, 130000) == expected_range
+    expected_top = [vacancy.to_dict() for vacancy in get_top_vacancies(vacancies, 3)]
+    assert saver.get_top(3) == expected_top
+    assert [record["name"] for record in saver.get_top(10, salary_min=100000, salary_max=150000)] == ["Python", "Rust"]
+    assert saver.get_top(0) == []
+    with pytest.raises(ValueError):
+        saver.get_top(-1)
@@ -0,0 +1,84 @@
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.sync import IncrementalSync
+
+
+def make_item(vacancy_id: int, published_at: str) -> Dict[str, Any]:
+    return {
+        "id": str(vacancy_id),
+        "name": f"Python Developer {vacancy_id}",
+        "alternate_url": f"https://hh.ru/vacancy/{vacancy_id}",
+        "salary": {"from": 100000, "to": 150000, "currency": "RUR"},
+        "experience": {"name": "От 1 года до 3 лет"},
+        "published_at": published_at,
+    }
+
+
+@pytest.fixture
+def api() -> MagicMock:
+    return MagicMock()
+
+
+def test_store_path(api: MagicMock, tmp_path: Path) -> None:
+    """Тестирование пути к файлу вакансий запроса"""
+    sync = IncrementalSync(api, tmp_path)
+    assert sync.store_path("Python Developer") == tmp_path / "vacancies_python_developer.json"
+    assert sync.store_path("Тестировщик QA") == tmp_path / "vacancies_тестировщик_qa.json"
+
+
+def test_sync_first_run(api: MagicMock, tmp_path: Path) -> None:
+    """Тестирование первого запуска: загрузка всех вакансий и сохранение отметки"""
+    api.get_all_vacancies.return_value = [
+        make_item(1, "2025-01-01T10:00:00+0300"),
+        make_item(2, "2025-01-02T09:00:00+0300"),
+    ]
+    sync = IncrementalSync(api, tmp_path)
+
+    vacancies = sync.sync("python")
+
+    api.get_all_vacancies.assert_called_once_with("python", date_from=None)
+    assert [vacancy.url for vacancy in vacancies] == ["https://hh.ru/vacancy/1", "https://hh.ru/vacancy/2"]
+    assert sync.get_watermark("python") == "2025-01-02T09:00:00+0300"
+    with open(tmp_path / "watermarks.json", encoding="utf-8") as json_file:
+        assert json.load(json_file) == {"python": "2025-01-02T09:00:00+0300"}
+
+
+def test_sync_incremental(api: MagicMock, tmp_path: Path) -> None:
+    """Тестирование повторного запуска: запрос с отметкой и объединение с сохраненными"""
+    sync = IncrementalSync(api, tmp_path)
+    api.get_all_vacancies.return_value = [make_item(1, "2025-01-02T09:00:00+0300")]
+    sync.sync("python")
+
+    # Граничная вакансия приходит повторно (date_from включительно) и не дублируется
+    api.get_all_vacancies.return_value = [
+        make_item(3, "2025-01-03T12:00:00+0300"),
+        make_item(1, "2025-01-02T09:00:00+0300"),
+    ]
+    vacancies = sync.sync("python")
+
+    api.get_all_vacancies.assert_called_with(
+        "python", date_from=datetime(2025, 1, 2, 9, 0, tzinfo=timezone(timedelta(hours=3)))
+    )
+    assert [vacancy.url for vacancy in vacancies] == ["https://hh.ru/vacancy/1", "https://hh.ru/vacancy/3"]
+    assert sync.get_watermark("python") == "2025-01-03T12:00:00+0300"
+
+
+def test_sync_no_new(api: MagicMock, tmp_path: Path) -> None:
+    """Тестирование запуска без новых вакансий: отметка не меняется"""
+    sync = IncrementalSync(api, tmp_path)
+    api.get_all_vacancies.return_value = []
+    assert sync.sync("python") == []
+    assert sync.get_watermark("python") is None
+
+
+def test_watermark_corrupted(api: MagicMock, tmp_path: Path) -> None:
+    """Тестирование поврежденного файла отметок"""
+    (tmp_path / "watermarks.json").write_text("Error", encoding="utf-8")
+    sync = IncrementalSync(api, tmp_path)
+    assert sync.get_watermark("python") is None
@@ -0,0 +1,178 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from src.rate_limiter import RateLimiter
+from src.transport import HttpTransport, get_default_transport
+
+
+def make_response(status_code: int, headers: dict | None = None) -> MagicMock:
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    return response
+
+
+def test_transport_init() -> None:
+    """Тестирование инициализации класса"""
+    transport = HttpTransport(pool_size=4, max_retries=2)
+    assert transport.pool_size == 4
+    assert transport.max_retries == 2
+    assert transport.timeout == 10.0
+
+
+@pytest.mark.parametrize(
+    "kwargs, exc_message",
+    [
+        ({"pool_size": 0}, "Размер пула соединений должен быть положительным числом"),
+        ({"max_retries": -1}, "Параметры повторов и таймаут не могут быть отрицательными"),
+        ({"timeout": 0}, "Параметры повторов и таймаут не могут быть отрицательными"),
+    ],
+)
+def test_transport_init_error(kwargs: dict, exc_message: str) -> None:
+    """Тестирование инициализации класса с некорректными параметрами"""
+    with pytest.raises(ValueError, match=exc_message):
+        HttpTransport(**kwargs)
+
+
+def test_default_transport_shared() -> None:
+    """Тестирование общего для процесса транспорта"""
+    assert get_default_transport() is get_default_transport()
+    assert set(get_default_transport().rate_limiters) == {"api.hh.ru", "api.twelvedata.com"}
+
+
+@patch("src.transport.time.sleep")
+@patch("requests.Session.get")
+def test_get_retry_status(mock_get: MagicMock, mock_sleep: MagicMock) -> None:
+    """Тестирование повтора запроса при статусе 5xx"""
+    mock_get.side_effect = [make_response(503), make_response(200)]
+    transport = HttpTransport(max_retries=3)
+
+    response = transport.get("https://example.com", params={"page": 0})
+
+    assert response.status_code == 200
+    assert mock_get.call_count == 2
+    mock_sleep.assert_called_once()
+
+
+@patch("src.transport.time.sleep")
+@patch("requests.Session.get")
+def test_get_retry_after_seconds(mock_get: MagicMock, mock_sleep: MagicMock) -> None:
+    """Тестирование паузы из заголовка Retry-After"""
+    mock_get.side_effect = [make_response(429, {"Retry-After": "7"}), make_response(200)]
+    transport = HttpTransport()
+
+    transport.get("https://example.com")
+
+    mock_sleep.assert_called_once_with(7.0)
+
+
+@patch("src.transport.time.sleep")
+@patch("requests.Session.get")
+def test_get_retry_after_too_long(mock_get: MagicMock, mock_sleep: MagicMock) -> None:
+    """Тестирование ответа без повтора, если Retry-After больше максимальной паузы"""
+    mock_get.side_effect = [make_response(429, {"Retry-After": "3600"}), make_response(200)]
+    transport = HttpTransport(backoff_max=30.0)
+
+    response = transport.get("https://example.com")
+
+    assert response.status_code == 429
+    assert mock_get.call_count == 1
+    mock_sleep.assert_not_called()
+
+
+@patch("src.transport.time.sleep")
+@patch("requests.Session.get")
+def test_get_retries_exhausted(mock_get: MagicMock, mock_sleep: MagicMock) -> None:
+    """Тестирование возврата последнего ответа после исчерпания повторов"""
+    mock_get.return_value = make_response(500)
+    transport = HttpTransport(max_retries=2)
+
+    response = transport.get("https://example.com")
+
+    assert response.status_code == 500
+    assert mock_get.call_count == 3
+    assert mock_sleep.call_count == 2
+
+
+@patch("src.transport.time.sleep")
+@patch("requests.Session.get")
+def test_get_no_retry_client_error(mock_get: MagicMock, mock_sleep: MagicMock) -> None:
+    """Тестирование отсутствия повтора при статусе 4xx"""
+    mock_get.return_value = make_response(400)
+    transport = HttpTransport()
+
+    assert transport.get("https://example.com").status_code == 400
+    mock_get.assert_called_once()
+    mock_sleep.assert_not_called()
+
+
+@patch("src.transport.time.sleep")
+@patch("requests.Session.get")
+def test_get_connection_error(mock_get: MagicMock, mock_sleep: MagicMock) -> None:
+    """Тестирование повторов при ошибке соединения"""
+    mock_get.side_effect = requests.ConnectionError("connection refused")
+    transport = HttpTransport(max_retries=1)
+
+    with pytest.raises(requests.ConnectionError):
+        transport.get("https://example.com")
+    assert mock_get.call_count == 2
+    mock_sleep.assert_called_once()
+
+
+@patch("src.transport.random.uniform")
+def test_backoff(mock_uniform: MagicMock) -> None:
+    """Тестирование экспоненциальной паузы с ограничением"""
+    mock_uniform.side_effect = lambda low, high: high
+    transport = HttpTransport(backoff_factor=0.5, backoff_max=3.0)
+    assert transport.backoff(0) == 0.5
+    assert transport.backoff(2) == 2.0
+    assert transport.backoff(5) == 3.0
+
+
+def test_retry_after_date() -> None:
+    """Тестирование заголовка Retry-After в формате HTTP-даты"""
+    retry_date = datetime.now(timezone.utc) + timedelta(seconds=30)
+    response = make_response(429, {"Retry-After": format_datetime(retry_date, usegmt=True)})
+    delay = HttpTransport.retry_after(response)
+    assert delay is not None
+    assert 25 <= delay <= 30
+
+
+@pytest.mark.parametrize("headers", [{}, {"Retry-After": "soon"}])
+def test_retry_after_missing(headers: dict) -> None:
+    """Тестирование отсутствующего или некорректного заголовка Retry-After"""
+    assert HttpTransport.retry_after(make_response(429, headers)) is None
+
+
+@patch("src.transport.time.sleep")
+@patch("requests.Session.get")
+def test_get_rate_limiter_throttle(mock_get: MagicMock, mock_sleep: MagicMock) -> None:
+    """Тестирование ограничителя частоты запросов хоста при ответе 429"""
+    mock_get.side_effect = [make_response(429, {"Retry-After": "1"}), make_response(200)]
+    rate_limiter = MagicMock(spec=RateLimiter)
+    transport = HttpTransport(rate_limiters={"api.hh.ru": rate_limiter})
+
+    transport.get("https://api.hh.ru/vacancies")
+
+    assert rate_limiter.acquire.call_count == 2
+    rate_limiter.on_throttle.assert_called_once()
+    rate_limiter.on_success.assert_called_once()
+
+
+@patch("requests.Session.get")
+def test_get_rate_limiter_other_host(mock_get: MagicMock) -> None:
+    """Тестирование отсутствия ограничения для хоста без ограничителя"""
+    mock_get.return_value = make_response(200)
+    rate_limiter = MagicMock(spec=RateLimiter)
+    transport = HttpTransport()
+    transport.set_rate_limiter("api.hh.ru", rate_limiter)
+
+    transport.get("https://example.com")
+    rate_limiter.acquire.assert_not_called()
+
+    transport.set_rate_limiter("api.hh.ru", None)
+    assert transport.rate_limiters == {}
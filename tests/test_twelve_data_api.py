@@ -43,7 +43,7 @@ def test_connect(mock_connect: MagicMock, api_client: TwelveDataApiExchangeRate)
     assert api_client.connect() == expected_result
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_private_connect(mock_request: MagicMock, api_client: TwelveDataApiExchangeRate, api_key: str) -> None:
     """Тестирование, работы приватного запроса API"""
     expected_result = {"symbol": "USD/RUB", "rate": 82.13, "timestamp": 1744792740}
@@ -51,10 +51,15 @@ def test_private_connect(mock_request: MagicMock, api_client: TwelveDataApiExcha
     mock_request.return_value.status_code = 200
     assert api_client.connect() == expected_result
 
-    mock_request.assert_called_once_with(f"https://api.twelvedata.com/exchange_rate?symbol=RUB/RUB&apikey={api_key}")
+    mock_request.assert_called_once_with(
+        f"https://api.twelvedata.com/exchange_rate?symbol=RUB/RUB&apikey={api_key}",
+        headers=None,
+        params=None,
+        timeout=10.0,
+    )
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_private_connect_invalid(mock_request: MagicMock, api_client: TwelveDataApiExchangeRate) -> None:
     """Тестирование, работы приватного запроса API, если выдается не словарь"""
     with pytest.raises(ValueError) as exc_info:
@@ -65,7 +70,7 @@ def test_private_connect_invalid(mock_request: MagicMock, api_client: TwelveData
     assert str(exc_info.value) == "API выдает не словарь"
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_private_connect_error(mock_request: MagicMock, api_client: TwelveDataApiExchangeRate) -> None:
     """Тестирование, работы приватного запроса API с ошибкой статуса"""
     expected_result = "Параметры переданы с ошибкой"
@@ -113,3 +118,23 @@ def test_conversion_in_rub(mock_rate: MagicMock, conversion: CurrencyConversion)
     mock_rate.return_value = 82.48
     result = conversion.conversion_in_rub("USD", "RUB", 100)
     assert result == 8248.0
+
+
+@patch.object(TwelveDataApiExchangeRate, "get_rate")
+def test_get_rates_in_rub(mock_rate: MagicMock, conversion: CurrencyConversion) -> None:
+    """Тестирование получения курсов: каждая валюта запрашивается один раз, курсы кэшируются"""
+    mock_rate.side_effect = lambda currency_from, currency_to: {"USD": 90, "BYN": 28.5}[currency_from]
+
+    rates = conversion.get_rates_in_rub(["USD", "RUR", "USD", "BYR"])
+    assert rates == {"USD": 90.0, "RUR": 1.0, "BYR": 28.5}
+    assert sorted(mock_rate.call_args_list) == [(("BYN", "RUB"),), (("USD", "RUB"),)]
+
+    assert conversion.get_rates_in_rub(["USD"]) == {"USD": 90.0}
+    assert mock_rate.call_count == 2
+
+
+@patch.object(TwelveDataApiExchangeRate, "get_rate")
+def test_get_rates_in_rub_not_found(mock_rate: MagicMock, conversion: CurrencyConversion) -> None:
+    """Тестирование валюты без курса в API: валюта пропускается"""
+    mock_rate.side_effect = ValueError("Курс валюты не найдет в API")
+    assert conversion.get_rates_in_rub(["XYZ"]) == {}
@@ -5,9 +5,9 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from src.utils import (get_top_vacancies, get_vacancies_by_salary, print_vacancies, safe_json,
-                       user_response_salary_range, user_response_top_n)
-from src.vacancies import Vacancy
+from src.utils import (get_top_vacancies, get_vacancies_by_salary, iter_vacancies_by_salary, print_vacancies,
+                       safe_json, user_response_salary_range, user_response_top_n)
+from src.vacancies import LazyVacancy, Vacancy
 
 
 @patch("builtins.input")
@@ -67,6 +67,13 @@ def test_get_vacancies_by_salary(vacancy_list: List[Vacancy]) -> None:
     assert len(ranged_vacancies) == 2
 
 
+def test_iter_vacancies_by_salary(vacancy_list: List[Vacancy]) -> None:
+    """Тестирование потоковой фильтрации экземпляров класса по зарплате"""
+    ranged_vacancies = iter_vacancies_by_salary(iter(vacancy_list), 100000, 140000)
+    assert next(ranged_vacancies) is vacancy_list[0]
+    assert list(ranged_vacancies) == [vacancy_list[2]]
+
+
 def test_get_top_vacancies(vacancy_list: List[Vacancy]) -> None:
     """Тестирование получения топ 'n' вакансий"""
     assert len(vacancy_list) == 3
@@ -80,6 +87,12 @@ def test_get_top_vacancies(vacancy_list: List[Vacancy]) -> None:
     assert top_vacancies[1].salary_to == 150000
 
 
+def test_get_top_vacancies_iterator(vacancy_list: List[Vacancy]) -> None:
+    """Тестирование получения топ 'n' вакансий из итератора"""
+    top_vacancies = get_top_vacancies(iter(vacancy_list), 1)
+    assert top_vacancies == [vacancy_list[1]]
+
+
 def test_get_top_vacancies_error(vacancy_list: List[Vacancy]) -> None:
     """Тестирование при превышении желаемого топа с возможным списком"""
     with pytest.raises(ValueError) as exc_info:
@@ -87,6 +100,12 @@ def test_get_top_vacancies_error(vacancy_list: List[Vacancy]) -> None:
     assert "В списке вакансий меньше чем необходимо" == str(exc_info.value)
 
 
+def test_get_top_vacancies_lenient(vacancy_list: List[Vacancy]) -> None:
+    """Тестирование получения топ-'n' вакансий, если в списке меньше позиций (без ошибки)"""
+    top_vacancies = get_top_vacancies(vacancy_list, 5, strict=False)
+    assert [vacancy.salary_average() for vacancy in top_vacancies] == [190000, 125000, 125000]
+
+
 def test_print_vacancies(vacancy_list: List[Vacancy], capsys: pytest.CaptureFixture) -> None:
     """Тестирование вывода в консоль вакансий"""
     print_vacancies(vacancy_list)
@@ -117,3 +136,21 @@ def test_safe_json(vacancy_list: List[Vacancy], json_file: str | Path) -> None:
         "salary_to": 150000,
         "experience": "От 1 года до 3 лет",
     }
+
+
+def test_lazy_vacancies_pipeline() -> None:
+    """Тестирование фильтра и топа по ленивым вакансиям: отброшенные не проверяют название и ссылку"""
+    raw = [
+        {"name": name, "alternate_url": url, "salary": {"from": salary_from, "to": None, "currency": "RUR"}}
+        for name, url, salary_from in [
+            ("Python", "https://hh.ru/vacancy/1", 200000),
+            ("Q", "bad url", 10),
+            ("Java", "https://hh.ru/vacancy/3", 150000),
+        ]
+    ]
+    ranged = get_vacancies_by_salary(LazyVacancy.cast_to_lazy_list(raw), 100000, 300000)
+    top_vacancies = get_top_vacancies(ranged, 2)
+    assert [vacancy.to_dict()["url"] for vacancy in top_vacancies] == [
+        "https://hh.ru/vacancy/1",
+        "https://hh.ru/vacancy/3",
+    ]
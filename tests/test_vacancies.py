@@ -1,9 +1,10 @@
-from typing import Optional
+import json
+from typing import Any, Dict, List, Optional
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from src.vacancies import Vacancy
+from src.vacancies import LazyVacancy, Vacancy, foreign_currencies, salary_average
 from src.validates import ValidVacancy
 
 
@@ -87,6 +88,32 @@ def test_salary_average(salary_from: int, salary_to: int, expected: int) -> None
     assert result == expected
 
 
+@pytest.mark.parametrize(
+    "salary_from, salary_to, expected",
+    [(None, None, 0), (0, 0, 0), (100, 0, 100), (0, 200, 200), (100, None, 100), (100, 200, 150)],
+)
+def test_salary_average_function(salary_from: int, salary_to: int, expected: float) -> None:
+    """Тестирование единого правила средней зарплаты (0 и None - зарплата не указана)"""
+    assert salary_average(salary_from, salary_to) == expected
+
+
+def test_foreign_currencies() -> None:
+    """Тестирование отбора валют для запроса курса: рубль, пустые строки и None отбрасываются"""
+    assert foreign_currencies(["USD", "RUR", "", None, "EUR", "USD"]) == {"USD", "EUR"}
+
+
+def test_cast_empty_currency_not_requested() -> None:
+    """Тестирование пустой валюты: курс для нее у конвертера не запрашивается"""
+    converter = MagicMock()
+    converter.get_rates_in_rub.return_value = {}
+    Vacancy.cast_to_object_list(
+        [{"name": "Python", "alternate_url": "https://hh.ru/vacancy/1", "salary": {"from": 100, "currency": ""}}],
+        converter,
+    )
+    converter.get_rates_in_rub.assert_called_once()
+    assert set(converter.get_rates_in_rub.call_args.args[0]) == set()
+
+
 def test_comparison(vacancy_one: Vacancy, vacancy_two: Vacancy, vacancy_three: Vacancy) -> None:
     """Тестирование, сравнения экземпляров класса"""
     assert vacancy_one < vacancy_two
@@ -179,6 +206,144 @@ def test_cast_to_object_list() -> None:
     assert test_list[1].name == "QA engineer"
 
 
+@patch.object(ValidVacancy, "validate_vacancy_to_dict")
+@patch.object(ValidVacancy, "validate_many", wraps=ValidVacancy().validate_many)
+def test_cast_to_object_list_batch_validation(mock_many: MagicMock, mock_single: MagicMock) -> None:
+    """Тестирование пакетной валидации списка вакансий одним вызовом"""
+    vacancies = [
+        {"name": "Python Developer", "alternate_url": "https://hh.ru/vacancy/1", "salary": None},
+        {"name": "QA engineer", "alternate_url": "https://hh.ru/vacancy/2", "salary": None},
+    ]
+    result = Vacancy.cast_to_object_list(vacancies)
+
+    mock_many.assert_called_once()
+    mock_single.assert_not_called()
+    assert [vacancy.url for vacancy in result] == ["https://hh.ru/vacancy/1", "https://hh.ru/vacancy/2"]
+    assert result[0].salary_from == 0
+
+
+def test_cast_to_object_list_invalid() -> None:
+    """Тестирование ошибки валидации в списке вакансий"""
+    vacancies = [
+        {"name": "Python Developer", "alternate_url": "https://hh.ru/vacancy/1"},
+        {"name": "QA engineer", "alternate_url": "https://example.com"},
+    ]
+    with pytest.raises(ValueError, match="Ссылка не подходит под формат"):
+        Vacancy.cast_to_object_list(vacancies)
+    assert Vacancy.cast_to_object_list([]) == []
+
+
+def test_cast_to_object_iter() -> None:
+    """Тестирование ленивого получения экземпляров класса из итератора словарей"""
+    vacancies = iter(
+        [
+            {"name": "Python Developer", "alternate_url": "https://hh.ru/vacancy/123456", "salary": None},
+            {"name": "QA engineer", "alternate_url": "https://hh.ru/vacancy/119246134", "salary": None},
+        ]
+    )
+    result = Vacancy.cast_to_object_iter(vacancies)
+    assert next(result).name == "Python Developer"
+    assert [vacancy.name for vacancy in result] == ["QA engineer"]
+
+
+@pytest.mark.parametrize("as_page", [True, False])
+def test_cast_from_bytes(as_page: bool) -> None:
+    """Тестирование получения экземпляров класса напрямую из тела ответа API"""
+    items: List[Dict[str, Any]] = [
+        {
+            "id": "1",
+            "name": "Python Developer",
+            "alternate_url": "https://hh.ru/vacancy/123456",
+            "salary": {"from": 100000, "to": None, "currency": "RUR"},
+            "experience": {"id": "between1And3", "name": "От 1 года до 3 лет"},
+        },
+        {
+            "id": "2",
+            "name": "QA engineer",
+            "alternate_url": "https://hh.ru/vacancy/119246134",
+            "salary": {"from": 2000, "to": 3000, "currency": "USD"},
+            "experience": None,
+        },
+    ]
+    body = json.dumps({"items": items, "pages": 1} if as_page else items).encode("utf-8")
+
+    result = Vacancy.cast_from_bytes(body)
+
+    assert [vacancy.to_dict() for vacancy in result] == [
+        vacancy.to_dict() for vacancy in Vacancy.cast_to_object_list(items)
+    ]
+    assert result[0].salary_from == 100000
+    assert result[1].salary_from == 0
+    assert result[1].experience == ""
+
+
+@pytest.fixture
+def currency_vacancies() -> list:
+    return [
+        {
+            "name": "Python Developer",
+            "alternate_url": "https://hh.ru/vacancy/1",
+            "salary": {"from": 1000, "to": 1500, "currency": "USD"},
+        },
+        {
+            "name": "Go Developer",
+            "alternate_url": "https://hh.ru/vacancy/2",
+            "salary": {"from": 100000, "to": None, "currency": "RUR"},
+        },
+        {
+            "name": "QA engineer",
+            "alternate_url": "https://hh.ru/vacancy/3",
+            "salary": {"from": None, "to": 2000, "currency": "USD"},
+        },
+        {"name": "Analyst", "alternate_url": "https://hh.ru/vacancy/4", "salary": None},
+    ]
+
+
+def test_cast_to_object_list_converter(currency_vacancies: list) -> None:
+    """Тестирование перевода зарплат в рубли: курс каждой валюты запрашивается один раз на список"""
+    converter = MagicMock()
+    converter.get_rates_in_rub.return_value = {"USD": 90.5}
+
+    result = Vacancy.cast_to_object_list(currency_vacancies, converter)
+
+    converter.get_rates_in_rub.assert_called_once()
+    assert set(converter.get_rates_in_rub.call_args.args[0]) == {"USD"}
+    assert [(vacancy.salary_from, vacancy.salary_to) for vacancy in result] == [
+        (90500, 135750),
+        (100000, 0),
+        (0, 181000),
+        (0, 0),
+    ]
+    assert [vacancy.currency for vacancy in result] == ["USD", "RUR", "USD", "RUR"]
+    assert (result[0].salary_from_original, result[0].salary_to_original) == (1000, 1500)
+    assert (result[1].salary_from_original, result[1].salary_to_original) == (100000, 0)
+    assert result[0].to_dict()["salary_from"] == 90500
+
+
+def test_cast_to_object_list_without_converter(currency_vacancies: list) -> None:
+    """Тестирование без конвертера: зарплата не в рублях не учитывается, исходные суммы сохраняются"""
+    result = Vacancy.cast_to_object_list(currency_vacancies)
+    assert (result[0].salary_from, result[0].salary_to) == (0, 0)
+    assert (result[0].currency, result[0].salary_from_original, result[0].salary_to_original) == ("USD", 1000, 1500)
+
+
+def test_cast_to_object_iter_converter(currency_vacancies: list) -> None:
+    """Тестирование перевода зарплат в рубли при поштучном создании вакансий"""
+    converter = MagicMock()
+    converter.get_rates_in_rub.return_value = {"USD": 90.5}
+    result = list(Vacancy.cast_to_object_iter(currency_vacancies, converter))
+    assert [vacancy.to_dict() for vacancy in result] == [
+        vacancy.to_dict() for vacancy in Vacancy.cast_to_object_list(currency_vacancies, converter)
+    ]
+    assert result[2].salary_to_original == 2000
+
+
+def test_cast_from_bytes_invalid() -> None:
+    """Тестирование тела ответа, не являющегося JSON"""
+    with pytest.raises(ValueError):
+        Vacancy.cast_from_bytes(b"<html>")
+
+
 def test__valid_other(vacancy_one: Vacancy) -> None:
     """Тестирование корректности другого класса"""
     result = Vacancy._Vacancy__valid_other(vacancy_one)  # type: ignore
@@ -191,3 +356,106 @@ def test__valid_other_error(vacancy_one: Vacancy) -> None:
     with pytest.raises(TypeError) as exc_info:
         Vacancy._Vacancy__valid_other(error_type)  # type: ignore
     assert "Не является классом Vacancy" == str(exc_info.value)
+
+
+def test_from_trusted_dicts(vacancy_one: Vacancy, vacancy_three: Vacancy) -> None:
+    """Тестирование создания экземпляров из проверенных словарей без валидации"""
+    stored = [vacancy_one.to_dict(), vacancy_three.to_dict()]
+    with patch.object(ValidVacancy, "validate_many") as mock_many:
+        result = Vacancy.from_trusted_dicts(stored, validate=False)
+    mock_many.assert_not_called()
+    assert [vacancy.to_dict() for vacancy in result] == stored
+
+
+def test_from_trusted_dicts_validate() -> None:
+    """Тестирование повторной проверки проверенных словарей (отладка)"""
+    only_from = {"name": "Python", "url": "https://hh.ru/vacancy/1", "salary_from": 100, "salary_to": 0}
+    assert Vacancy.from_trusted_dicts([only_from], validate=True)[0].to_dict() == {**only_from, "experience": ""}
+    stored = [{"name": "Python", "url": "https://example.com", "salary_from": 0, "salary_to": 0, "experience": ""}]
+    assert Vacancy.from_trusted_dicts(stored, validate=False)[0].url == "https://example.com"
+    with pytest.raises(ValueError, match="Ссылка не подходит под формат"):
+        Vacancy.from_trusted_dicts(stored, validate=True)
+
+
+@patch("src.vacancies.VALIDATE_TRUSTED_DATA", True)
+def test_from_trusted_dicts_debug_setting() -> None:
+    """Тестирование включения проверки настройкой VALIDATE_TRUSTED_DATA"""
+    stored = [{"name": "Python", "url": "https://example.com"}]
+    with pytest.raises(ValueError, match="Ссылка не подходит под формат"):
+        Vacancy.from_trusted_dicts(stored)
+
+
+@pytest.fixture
+def raw_vacancy() -> dict:
+    return {
+        "name": "Python Developer",
+        "alternate_url": "https://hh.ru/vacancy/123456",
+        "salary": {"from": 100000, "to": 150000, "currency": "RUR"},
+        "experience": {"name": "От 1 года до 3 лет"},
+    }
+
+
+def test_lazy_vacancy(raw_vacancy: dict) -> None:
+    """Тестирование ленивой вакансии: те же поля и поведение, что у Vacancy"""
+    lazy = LazyVacancy(raw_vacancy)
+    eager = Vacancy.created_vacancy(raw_vacancy)
+    assert isinstance(lazy, Vacancy)
+    assert lazy.raw is raw_vacancy
+    assert lazy.to_dict() == eager.to_dict()
+    assert str(lazy) == str(eager)
+    assert lazy.salary_average() == eager.salary_average()
+    assert lazy >= eager
+
+
+def test_lazy_vacancy_validates_on_access(raw_vacancy: dict) -> None:
+    """Тестирование проверки поля только при первом обращении и кэширования"""
+    with patch.object(ValidVacancy, "valid_url", wraps=ValidVacancy().valid_url) as mock_url:
+        lazy = LazyVacancy({**raw_vacancy, "alternate_url": "https://example.com"})
+        assert lazy.salary_average() == 125000
+        mock_url.assert_not_called()
+        with pytest.raises(ValueError, match="Ссылка не подходит под формат"):
+            lazy.url
+
+    with patch.object(ValidVacancy, "valid_name", wraps=ValidVacancy().valid_name) as mock_name:
+        lazy = LazyVacancy(raw_vacancy)
+        assert lazy.name == lazy.name == "Python Developer"
+        mock_name.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "salary, expected",
+    [
+        (None, (0, 0)),
+        ({"from": 1000, "to": None, "currency": "USD"}, (0, 0)),
+        ({"to": 5000, "currency": "RUR"}, (0, 5000)),
+    ],
+)
+def test_lazy_vacancy_salary(raw_vacancy: dict, salary: Optional[dict], expected: tuple) -> None:
+    """Тестирование зарплаты ленивой вакансии (учитываются только рубли)"""
+    lazy = LazyVacancy({**raw_vacancy, "salary": salary, "experience": None})
+    assert (lazy.salary_from, lazy.salary_to) == expected
+    assert lazy.experience == ""
+
+
+def test_lazy_vacancy_original_salary(raw_vacancy: dict) -> None:
+    """Тестирование исходной валюты и сумм ленивой вакансии"""
+    lazy = LazyVacancy({**raw_vacancy, "salary": {"from": 1000, "to": None, "currency": "USD"}})
+    assert (lazy.currency, lazy.salary_from_original, lazy.salary_to_original) == ("USD", 1000, 0)
+    assert LazyVacancy({**raw_vacancy, "salary": None}).currency == "RUR"
+
+
+def test_lazy_vacancy_setters(raw_vacancy: dict) -> None:
+    """Тестирование изменения полей ленивой вакансии"""
+    lazy = LazyVacancy.cast_to_lazy_list([raw_vacancy])[0]
+    lazy.name = "Java Developer"
+    lazy.url = "https://hh.ru/vacancy/1"
+    lazy.salary_from = 1
+    lazy.salary_to = 2
+    lazy.experience = "Нет опыта"
+    assert lazy.to_dict() == {
+        "name": "Java Developer",
+        "url": "https://hh.ru/vacancy/1",
+        "salary_from": 1,
+        "salary_to": 2,
+        "experience": "Нет опыта",
+    }
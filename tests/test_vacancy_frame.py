@@ -0,0 +1,166 @@
+from typing import Iterator, List
+from unittest.mock import patch
+
+import pytest
+
+from src import vacancy_frame
+from src.utils import get_top_vacancies, get_vacancies_by_salary
+from src.vacancies import Vacancy
+from src.vacancy_frame import Categories, VacancyFrame
+
+
+@pytest.fixture(params=["numpy", "python"])
+def filter_backend(request: pytest.FixtureRequest) -> Iterator[str]:
+    """Фильтр по зарплате с numpy (если установлен) и без него"""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+        yield request.param
+    else:
+        with patch.object(vacancy_frame, "np", None):
+            yield request.param
+
+
+@pytest.fixture
+def vacancies(vacancy_one: Vacancy, vacancy_two: Vacancy, vacancy_three: Vacancy) -> List[Vacancy]:
+    no_salary = Vacancy("Стажер", "https://hh.ru/vacancy/1", experience="Нет опыта")
+    return [vacancy_one, vacancy_two, vacancy_three, no_salary]
+
+
+def test_frame_from_vacancies(vacancies: List[Vacancy]) -> None:
+    """Тестирование создания колонок из экземпляров Vacancy"""
+    frame = VacancyFrame.from_vacancies(vacancies)
+    assert len(frame) == 4
+    assert list(frame.averages) == [vacancy.salary_average() for vacancy in vacancies]
+    assert [vacancy.to_dict() for vacancy in frame] == [vacancy.to_dict() for vacancy in vacancies]
+    assert frame[1].name == "QA engineer"
+
+
+def test_frame_init_columns() -> None:
+    """Тестирование создания из колонок с проверкой данных"""
+    frame = VacancyFrame(["Python Developer"], ["https://hh.ru/vacancy/1"], [None], [150000])
+    assert list(frame.salaries_from) == [0]
+    assert frame.experiences == [""]
+    assert frame.to_vacancies()[0].salary_average() == 150000
+
+
+@pytest.mark.parametrize(
+    "kwargs, expected",
+    [
+        ({"names": ["Python"], "urls": ["https://example.com"], "salaries_from": [0], "salaries_to": [0]}, ValueError),
+        (
+            {"names": ["Python"], "urls": ["https://hh.ru/vacancy/1"], "salaries_from": ["1"], "salaries_to": [0]},
+            TypeError,
+        ),
+        (
+            {
+                "names": ["Python"],
+                "urls": ["https://hh.ru/vacancy/1"],
+                "salaries_from": [0],
+                "salaries_to": [0],
+                "experiences": [],
+            },
+            ValueError,
+        ),
+    ],
+)
+def test_frame_init_error(kwargs: dict, expected: type[Exception]) -> None:
+    """Тестирование создания из некорректных колонок"""
+    with pytest.raises(expected):
+        VacancyFrame(**kwargs)
+
+
+def test_frame_filter_by_salary(vacancies: List[Vacancy], filter_backend: str) -> None:
+    """Тестирование фильтрации по диапазону как у get_vacancies_by_salary"""
+    frame = VacancyFrame.from_vacancies(vacancies).filter_by_salary(100000, 150000)
+    expected = get_vacancies_by_salary(vacancies, 100000, 150000)
+    assert [vacancy.to_dict() for vacancy in frame] == [vacancy.to_dict() for vacancy in expected]
+    assert list(frame.averages) == [vacancy.salary_average() for vacancy in expected]
+    assert frame.experience_codes.typecode == "H"
+
+
+def test_frame_filter_keeps_averages(vacancies: List[Vacancy], filter_backend: str) -> None:
+    """Тестирование, средние зарплаты отбираются маской, а не рассчитываются заново"""
+    frame = VacancyFrame.from_vacancies(vacancies)
+    with patch("src.vacancy_frame.salary_average") as mock_average:
+        filtered = frame.filter_by_salary(0, 10**9)
+        frame.top(2)
+    mock_average.assert_not_called()
+    assert filtered.averages == frame.averages
+
+
+@pytest.mark.parametrize("top_n", [1, 2, 4])
+def test_frame_top(vacancies: List[Vacancy], top_n: int) -> None:
+    """Тестирование топ N как у get_top_vacancies"""
+    frame = VacancyFrame.from_vacancies(vacancies).top(top_n)
+    expected = get_top_vacancies(vacancies, top_n)
+    assert [vacancy.url for vacancy in frame] == [vacancy.url for vacancy in expected]
+
+
+def test_frame_top_ties_keep_order() -> None:
+    """Тестирование сохранения исходного порядка при равной зарплате"""
+    frame = VacancyFrame(
+        ["Первая", "Вторая", "Третья"],
+        ["https://hh.ru/vacancy/1", "https://hh.ru/vacancy/2", "https://hh.ru/vacancy/3"],
+        [100, 100, 200],
+        [None, None, None],
+    )
+    assert frame.top(3).names == ["Третья", "Первая", "Вторая"]
+
+
+def test_frame_top_error(vacancies: List[Vacancy]) -> None:
+    """Тестирование топ N, если вакансий меньше"""
+    with pytest.raises(ValueError, match="В списке вакансий меньше чем необходимо"):
+        VacancyFrame.from_vacancies(vacancies).top(5)
+
+
+def test_frame_empty(filter_backend: str) -> None:
+    """Тестирование пустого набора"""
+    frame = VacancyFrame()
+    assert len(frame) == 0
+    assert len(frame.filter_by_salary(0, 100)) == 0
+    assert frame.top(0).to_vacancies() == []
+
+
+def test_frame_compact_columns(filter_backend: str) -> None:
+    """Тестирование хранения опыта и ссылок кодами с восстановлением при обращении"""
+    urls = ["https://hh.ru/vacancy/123", "hh.ru/vacancy/0042", "http://hh.ru/vacancy/0"]
+    experiences = ["Нет опыта", "Более 6 лет", "Нет опыта"]
+    frame = VacancyFrame(["Python", "Python", "Java"], urls, [1, 2, 3], [None, None, None], experiences)
+
+    assert frame.urls == urls
+    assert frame.experiences == experiences
+    assert list(frame.url_ids) == [123, 42, 0]
+    assert frame.experience_codes[0] == frame.experience_codes[2]
+    assert frame.names[0] is frame.names[1]
+    assert frame.top(1)[0].url == "http://hh.ru/vacancy/0"
+    assert frame.filter_by_salary(2, 2).urls == ["hh.ru/vacancy/0042"]
+
+
+def test_frame_large_url_id(filter_backend: str) -> None:
+    """Тестирование ссылки с номером, который не помещается в колонку номеров"""
+    urls = ["https://hh.ru/vacancy/99999999999999999999", "https://hh.ru/vacancy/9223372036854775807"]
+    prefixes = len(vacancy_frame.URL_PREFIXES)
+    frame = VacancyFrame(["Python", "Java"], urls, [1, 2], [None, None])
+    assert frame.urls == urls
+    assert list(frame.url_ids) == [-1, 9223372036854775807]
+    assert frame.long_urls == {0: urls[0]}
+    assert frame.filter_by_salary(1, 1)[0].url == urls[0]
+    assert frame.filter_by_salary(2, 2).long_urls == {}
+    assert frame.take([1, 0]).urls == [urls[1], urls[0]]
+    assert frame.top(2).long_urls == {1: urls[0]}
+    assert frame[-2].url == urls[0]
+    vacancies = [Vacancy("Python", urls[0], 1, None)]
+    assert VacancyFrame.from_vacancies(vacancies).to_vacancies()[0].url == urls[0]
+    assert len(vacancy_frame.URL_PREFIXES) == prefixes
+
+
+def test_categories() -> None:
+    """Тестирование таблицы категориальных значений"""
+    categories = Categories(["a", "b"])
+    assert categories.code("b") == 1
+    assert categories.code("c") == 2
+    assert categories.code("c") == 2
+    assert len(categories) == 3
+    assert categories.value(2) == "c"
+    with pytest.raises(IndexError):
+        categories.value(5)
@@ -126,3 +126,53 @@ def test_valid_salary_to_error(salary_to: Any, salary_from: int, expected: type[
     with pytest.raises(expected) as exc_info:
         ValidVacancy._ValidVacancy__valid_salary_to(salary_to, salary_from)  # type: ignore
     assert exc_message == str(exc_info.value)
+
+
+def test_validate_many() -> None:
+    """Тестирование пакетной валидации колонок данных вакансий"""
+    names = ["Python Developer", "QA engineer"]
+    urls = ["https://hh.ru/vacancy/123456", "hh.ru/vacancy/119246134"]
+    result = ValidVacancy().validate_many(names, urls, [100000, None], [150000, None])
+    assert result == {"name": names, "url": urls, "salary_from": [100000, 0], "salary_to": [150000, 0]}
+
+
+def test_validate_many_empty() -> None:
+    """Тестирование пакетной валидации пустых колонок"""
+    assert ValidVacancy().validate_many([], [], [], []) == {"name": [], "url": [], "salary_from": [], "salary_to": []}
+
+
+@pytest.mark.parametrize(
+    "row, expected, exc_message",
+    [
+        ((123, "https://hh.ru/vacancy/1", None, None), TypeError, "Название не является строкой"),
+        (("Q", "https://hh.ru/vacancy/1", None, None), ValueError, "Название вакансии не бывает с 1 символом"),
+        (("Python", 1, None, None), TypeError, "Ссылка не является строкой"),
+        (("Python", "https://hh.ru/vacancy/", None, None), ValueError, "Ссылка не подходит под формат"),
+        (("Python", "https://hh.ru/vacancy/1", "1", None), TypeError, "Зарплата 'от' не является числом"),
+        (
+            ("Python", "https://hh.ru/vacancy/1", -1, None),
+            ValueError,
+            "Зарплата 'от' не может быть отрицательным числом",
+        ),
+        (("Python", "https://hh.ru/vacancy/1", None, "1"), TypeError, "Зарплата 'до' не является числом"),
+        (
+            ("Python", "https://hh.ru/vacancy/1", 100, 50),
+            ValueError,
+            "Зарплата 'до' не может быть отрицательным числом или меньше зарплаты 'от'",
+        ),
+    ],
+)
+def test_validate_many_error(row: tuple, expected: type[Exception], exc_message: str) -> None:
+    """Тестирование пакетной валидации с теми же ошибками, что и у одиночной"""
+    valid_row = ("Python Developer", "https://hh.ru/vacancy/123456", 100000, 150000)
+    columns = [list(column) for column in zip(valid_row, row)]
+    with pytest.raises(expected, match=exc_message):
+        ValidVacancy().validate_many(*columns)
+    with pytest.raises(expected, match=exc_message):
+        ValidVacancy().validate_vacancy_to_dict(*row)
+
+
+def test_validate_many_length_mismatch() -> None:
+    """Тестирование пакетной валидации колонок разной длины"""
+    with pytest.raises(ValueError, match="Колонки данных вакансий разной длины"):
+        ValidVacancy().validate_many(["Python"], [], [None], [None])